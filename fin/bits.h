@@ -0,0 +1,15 @@
+/*
+ * Bit manipulation primitives, see `fin/mathx.pxd`.
+ */
+#ifndef FIN_BITS_H
+#define FIN_BITS_H
+#if defined(__GNUC__) || defined(__clang__)
+#define fin_clz64(x) __builtin_clzll(x)
+#define fin_ctz64(x) __builtin_ctzll(x)
+#define fin_popcount64(x) __builtin_popcountll(x)
+#else
+static inline int fin_clz64(unsigned long long x) { int n = 0; while (!(x >> 63)) { x <<= 1; ++n; } return n; }
+static inline int fin_ctz64(unsigned long long x) { int n = 0; while (!(x & 1)) { x >>= 1; ++n; } return n; }
+static inline int fin_popcount64(unsigned long long x) { int n = 0; while (x) { x &= x - 1; ++n; } return n; }
+#endif
+#endif
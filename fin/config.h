@@ -0,0 +1,11 @@
+/*
+ * Compile-time configuration of the native kernels, see `fin/config.pyx`.
+ */
+#ifndef FIN_CONFIG_H
+#define FIN_CONFIG_H
+#ifdef _OPENMP
+#define FIN_OPENMP 1
+#else
+#define FIN_OPENMP 0
+#endif
+#endif
@@ -0,0 +1,4 @@
+# ======================================================================
+# Parallel execution of the native kernels
+# ======================================================================
+cdef int parallel_threads(size_t n) nogil
@@ -0,0 +1,71 @@
+"""
+Runtime configuration of the native kernels.
+
+Element-wise kernels split large columns between several threads when the
+library was built with OpenMP support. Otherwise, they always run serially.
+"""
+import os
+
+cdef extern from "fin/config.h":
+    int FIN_OPENMP
+
+# ======================================================================
+# Parallel execution of the native kernels
+# ======================================================================
+cdef int    _num_threads = os.cpu_count() or 1
+cdef size_t _parallel_threshold = 100000
+
+cdef int parallel_threads(size_t n) nogil:
+    """
+    Return the number of threads a kernel should use to process `n` items.
+    """
+    if FIN_OPENMP and n >= _parallel_threshold:
+        return _num_threads
+
+    return 1
+
+def openmp_enabled():
+    """
+    Return True if the native kernels were built with OpenMP support.
+    """
+    return bool(FIN_OPENMP)
+
+def set_num_threads(n=None):
+    """
+    Set the maximum number of threads used by a single kernel.
+
+    Use None for the number of CPUs. Use 1 to disable parallel execution.
+    """
+    global _num_threads
+    if n is None:
+        n = os.cpu_count() or 1
+    if n < 1:
+        raise ValueError(f"Invalid number of threads {n}")
+
+    _num_threads = n
+
+def get_num_threads():
+    """
+    Return the maximum number of threads used by a single kernel.
+
+    This is always 1 if the library was built without OpenMP support.
+    """
+    return _num_threads if FIN_OPENMP else 1
+
+def set_parallel_threshold(n):
+    """
+    Set the minimum number of items for a kernel to run in parallel.
+
+    Below that threshold, the cost of starting the threads outweighs the gain.
+    """
+    global _parallel_threshold
+    if n < 0:
+        raise ValueError(f"Invalid threshold {n}")
+
+    _parallel_threshold = n
+
+def get_parallel_threshold():
+    """
+    Return the minimum number of items for a kernel to run in parallel.
+    """
+    return _parallel_threshold
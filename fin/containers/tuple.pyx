@@ -30,7 +30,7 @@ cdef class Tuple:
         if PySlice_Check(idx):
             PySlice_GetIndicesEx(idx, self._size, &start, &stop, &step, &length)
             if step != 1:
-                raise ValueError(f"Steps other than 1 are not supported")
+                return tuple_slice_step(self, start, step, length)
             return self.slice(start, stop)
         else:
             return self.get_item(idx)
@@ -47,6 +47,9 @@ cdef class Tuple:
 
         return NotImplemented
 
+    def __reduce__(self):
+        return (tuple_from_pickle, ([ self.get_item(i) for i in range(self._size) ],))
+
     # ------------------------------------------------------------------
     # The Cython interface
     # ------------------------------------------------------------------
@@ -129,6 +132,11 @@ cdef class Tuple:
     def tst_resize(self, new_size):
         tuple_resize(self, new_size)
 
+def tuple_from_pickle(items):
+    """ Rebuild a pickled Tuple. See `Tuple.__reduce__()`.
+    """
+    return tuple_from_sequence(items)
+
 # ======================================================================
 # Memory allocation
 # ======================================================================
@@ -279,6 +287,22 @@ cdef Tuple tuple_slice(Tuple self, Py_ssize_t start, Py_ssize_t stop):
 
     return result
 
+cdef Tuple tuple_slice_step(Tuple self, Py_ssize_t start, Py_ssize_t step, Py_ssize_t length):
+    """ Create a new Tuple instance with every `step`-th item, starting at `start`.
+
+        Unlike `tuple_slice()`, this copies the item pointers.
+    """
+    cdef Tuple      result = tuple_alloc(length)
+    cdef PyObject   *obj
+    cdef Py_ssize_t i
+
+    for i in range(length):
+        obj = self._base_ptr[start + i*step]
+        Py_XINCREF(obj)
+        result._base_ptr[i] = obj
+
+    return result
+
 cdef Tuple tuple_remap(Tuple self, unsigned count, const unsigned* mapping):
     """ Create a new Tuple instance with the items reordered according to `mapping`.
 
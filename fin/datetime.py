@@ -43,6 +43,13 @@ DATE_FORMAT={
     DATETIMEMS: "%Y-%m-%dT%H:%M:%S.%f",
 }
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_UNIT={
+    DATE: timedelta(days=1),
+    DATETIME: timedelta(seconds=1),
+    DATETIMEMS: timedelta(microseconds=1),
+}
+
 # ======================================================================
 # Calendar date delta
 # ======================================================================
@@ -252,6 +259,26 @@ class _CalendarDate:
 
         return result
 
+    @staticmethod
+    def fromepoch(epoch, resolution):
+        """
+        Create a calendar date from a number of days, seconds or microseconds
+        (depending on `resolution`) since the Unix epoch.
+
+        This is the inverse of the `epoch` property.
+        """
+        cls = {
+                DATE: CalendarDate,
+                DATETIME: CalendarDateTime,
+                DATETIMEMS: CalendarDateTimeMicro,
+            }[resolution]
+
+        result = cls.__new__(cls)
+        result._pydate = EPOCH + EPOCH_UNIT[resolution]*epoch
+        result._resolution = resolution
+
+        return result
+
     @classmethod
     def fromstring(cls, string, fmt, resolution):
         """
@@ -341,6 +368,18 @@ class _CalendarDate:
     def timestamp(self):
         return self._pydate.timestamp()
 
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def epoch(self):
+        """
+        Return the number of days, seconds or microseconds (depending on the
+        receiver's resolution) since the Unix epoch.
+        """
+        return (self._pydate - EPOCH) // EPOCH_UNIT[self._resolution]
+
     def iter_by(self, interval = None, *, n = None, **kwargs):
         assert n is None or n >= 0
         assert not(interval and kwargs)
@@ -1,4 +1,5 @@
 from cpython cimport array
+from libc.stdint cimport uint64_t
 
 # ======================================================================
 # Math utilities for Cython
@@ -23,3 +24,12 @@ cdef array.array balloc(unsigned n, char init_value=*)
 # Vectorized operations
 # ======================================================================
 cdef void vrand(unsigned n, double* buffer)
+
+
+# ======================================================================
+# Bit manipulation
+# ======================================================================
+cdef extern from "fin/bits.h":
+    int clz64 "fin_clz64"(uint64_t x) nogil # Undefined for 0
+    int ctz64 "fin_ctz64"(uint64_t x) nogil # Undefined for 0
+    int popcount64 "fin_popcount64"(uint64_t x) nogil
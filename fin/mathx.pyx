@@ -6,6 +6,7 @@ from libc.math cimport erf, sqrt, exp, log
 from libc.stdlib cimport rand, RAND_MAX
 
 from fin.mathx cimport NaN
+from fin cimport mem
 
 # ======================================================================
 # Math utilities for Cython
@@ -109,8 +110,10 @@ cdef inline double[::1] alloc(unsigned n, double init_value = NaN):
     """
     Allocate a contiguous array of n double initialized to NaN.
     Return a view on the array.
+
+    The memory comes from the buffer pool (see `fin.mem`).
     """
-    cdef double[::1] arr = array.clone(double_array_template, n, zero=False)[::1]
+    cdef double[::1] arr = mem.double_alloc(n)
     cdef unsigned i
     for i in range(n):
         arr[i] = init_value
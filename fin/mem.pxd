@@ -1,5 +1,36 @@
 cdef extern from "<alloca.h>":
     void *alloca(size_t size)
 
+from libc.stdint cimport int32_t, int64_t, uint64_t
+
+# ======================================================================
+# Buffer pool
+# ======================================================================
+cdef enum:
+    ALIGNMENT = 64  # Bytes. The size of a cache line, and of the widest vector registers
+
+cdef class Block:
+    """
+    A 64-byte-aligned memory block from the buffer pool, exported through the
+    buffer protocol as a one-dimensional array.
+
+    The memory is returned to the pool when the block is deallocated.
+    """
+    cdef void*          data
+    cdef size_t         nbytes      # Capacity of the block
+    cdef int            size_class  # -1 if the block is not pooled
+    cdef Py_ssize_t     shape[1]
+    cdef Py_ssize_t     itemsize
+    cdef char*          format
+
+cdef Block block_alloc(Py_ssize_t n, Py_ssize_t itemsize, char* format)
+
+# ======================================================================
+# Typed allocators
+# ======================================================================
 cdef double[::1] double_alloc(unsigned n)
+cdef float[::1] float_alloc(unsigned n)
 cdef signed char[::1] schar_alloc(unsigned n)
+cdef int32_t[::1] int32_alloc(unsigned n)
+cdef int64_t[::1] int64_alloc(unsigned n)
+cdef uint64_t[::1] uint64_alloc(unsigned n)
@@ -1,12 +1,210 @@
-from cpython cimport array
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+from libc.stdint cimport uintptr_t
+from libc.stdlib cimport malloc, free
 
-cdef array.array double_array_template = array.array('d', [])
-# cdef array.array int_array_template = array.array('i', [])
-# cdef array.array unsigned_array_template = array.array('I', [])
-cdef array.array schar_array_template = array.array('b', [])
+# ======================================================================
+# Buffer pool
+# ======================================================================
+# Blocks are grouped in power-of-two size classes, from 64 bytes to 4 MiB.
+# Freed blocks are kept in a per-class free list, linked through their first
+# word, and recycled by the next allocation of the same class.
+# Larger blocks are not pooled: they are allocated with their exact size and
+# released immediately.
+#
+# The total size of the free lists is bounded by the pool limit. Beyond the
+# limit, freed blocks are released to the system.
+cdef enum:
+    MIN_CLASS_SHIFT = 6   # 64 bytes
+    NUM_CLASSES     = 17  # Up to 64 << 16 == 4 MiB
 
+cdef void*      _free_lists[NUM_CLASSES]
+cdef size_t     _pool_limit = 64*1024*1024
+
+# Statistics
+cdef size_t     _allocations = 0    # Number of blocks allocated
+cdef size_t     _pool_hits = 0      # Number of blocks recycled from the pool
+cdef size_t     _blocks_in_use = 0
+cdef size_t     _bytes_in_use = 0
+cdef size_t     _peak_bytes_in_use = 0
+cdef size_t     _bytes_pooled = 0
+
+cdef void* aligned_malloc(size_t nbytes):
+    """
+    Allocate `nbytes` of memory aligned on an `ALIGNMENT` boundary.
+
+    The address returned by `malloc()` is stored just before the aligned block.
+    """
+    cdef char* raw = <char*>malloc(nbytes + ALIGNMENT + sizeof(void*) - 1)
+    if raw == NULL:
+        return NULL
+
+    cdef uintptr_t addr = <uintptr_t>(raw + sizeof(void*) + ALIGNMENT - 1)
+    cdef void** aligned = <void**>(addr & ~(<uintptr_t>ALIGNMENT - 1))
+    aligned[-1] = raw
+
+    return aligned
+
+cdef void aligned_free(void* ptr):
+    free((<void**>ptr)[-1])
+
+cdef int size_class(size_t nbytes):
+    """
+    Return the size class for a block of `nbytes`, or -1 if it is too large to be pooled.
+    """
+    cdef int cls = 0
+    cdef size_t capacity = 1 << MIN_CLASS_SHIFT
+    while capacity < nbytes:
+        capacity <<= 1
+        cls += 1
+
+    return cls if cls < NUM_CLASSES else -1
+
+cdef class Block:
+    def __dealloc__(self):
+        global _blocks_in_use, _bytes_in_use, _bytes_pooled
+        if self.data == NULL:
+            return
+
+        _blocks_in_use -= 1
+        _bytes_in_use -= self.nbytes
+        if self.size_class >= 0 and _bytes_pooled + self.nbytes <= _pool_limit:
+            (<void**>self.data)[0] = _free_lists[self.size_class]
+            _free_lists[self.size_class] = self.data
+            _bytes_pooled += self.nbytes
+        else:
+            aligned_free(self.data)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        buffer.buf = self.data
+        buffer.len = self.shape[0]*self.itemsize
+        buffer.readonly = 0
+        buffer.itemsize = self.itemsize
+        buffer.format = self.format if (flags & PyBUF_FORMAT) == PyBUF_FORMAT else NULL
+        buffer.ndim = 1
+        buffer.shape = self.shape if (flags & PyBUF_ND) == PyBUF_ND else NULL
+        buffer.strides = &self.itemsize if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+        buffer.obj = self
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+cdef Block block_alloc(Py_ssize_t n, Py_ssize_t itemsize, char* format):
+    """
+    Allocate an uninitialized block for `n` items of `itemsize` bytes.
+    """
+    global _allocations, _pool_hits, _blocks_in_use, _bytes_in_use, _peak_bytes_in_use, _bytes_pooled
+
+    cdef Block block = Block.__new__(Block)
+    cdef int cls = size_class(n*itemsize)
+    cdef size_t nbytes = (<size_t>1 << (cls + MIN_CLASS_SHIFT)) if cls >= 0 else n*itemsize
+    cdef void* data
+    if cls >= 0 and _free_lists[cls] != NULL:
+        data = _free_lists[cls]
+        _free_lists[cls] = (<void**>data)[0]
+        _bytes_pooled -= nbytes
+        _pool_hits += 1
+    else:
+        data = aligned_malloc(nbytes)
+        if data == NULL:
+            raise MemoryError()
+
+    block.data = data
+    block.nbytes = nbytes
+    block.size_class = cls
+    block.shape[0] = n
+    block.itemsize = itemsize
+    block.format = format
+
+    _allocations += 1
+    _blocks_in_use += 1
+    _bytes_in_use += nbytes
+    if _bytes_in_use > _peak_bytes_in_use:
+        _peak_bytes_in_use = _bytes_in_use
+
+    return block
+
+def get_stats():
+    """
+    Return the statistics of the buffer pool as a dictionary:
+
+    - allocations: number of blocks allocated since the start of the program;
+    - pool_hits: number of those blocks recycled from the pool;
+    - blocks_in_use, bytes_in_use: blocks currently referenced, and their size;
+    - peak_bytes_in_use: the highest value of `bytes_in_use` since the last call
+      to `reset_peak()`;
+    - bytes_pooled: size of the freed blocks kept for reuse.
+
+    Sizes are capacities: they are rounded up to the block's size class.
+    """
+    return dict(
+            allocations=_allocations,
+            pool_hits=_pool_hits,
+            blocks_in_use=_blocks_in_use,
+            bytes_in_use=_bytes_in_use,
+            peak_bytes_in_use=_peak_bytes_in_use,
+            bytes_pooled=_bytes_pooled,
+        )
+
+def reset_peak():
+    """
+    Reset the `peak_bytes_in_use` statistic to the current usage.
+    """
+    global _peak_bytes_in_use
+    _peak_bytes_in_use = _bytes_in_use
+
+def set_pool_limit(nbytes):
+    """
+    Set the maximum number of bytes kept in the pool for reuse.
+
+    Use 0 to disable pooling. Blocks already in the pool beyond the limit are released.
+    """
+    global _pool_limit
+    if nbytes < 0:
+        raise ValueError(f"Negative pool limit {nbytes}")
+    _pool_limit = nbytes
+    if _bytes_pooled > _pool_limit:
+        clear_pool()
+
+def get_pool_limit():
+    """
+    Return the maximum number of bytes kept in the pool for reuse.
+    """
+    return _pool_limit
+
+def clear_pool():
+    """
+    Release all the blocks kept in the pool to the system.
+    """
+    global _bytes_pooled
+    cdef int cls
+    cdef void* data
+    for cls in range(NUM_CLASSES):
+        while _free_lists[cls] != NULL:
+            data = _free_lists[cls]
+            _free_lists[cls] = (<void**>data)[0]
+            aligned_free(data)
+    _bytes_pooled = 0
+
+# ======================================================================
+# Typed allocators
+# ======================================================================
+# The returned memory views keep their block alive.
 cdef double[::1] double_alloc(unsigned n):
-    return array.clone(double_array_template, n, zero=False)[::1]
+    return block_alloc(n, sizeof(double), b"d")
+
+cdef float[::1] float_alloc(unsigned n):
+    return block_alloc(n, sizeof(float), b"f")
 
 cdef signed char[::1] schar_alloc(unsigned n):
-    return array.clone(schar_array_template, n, zero=False)[::1]
+    return block_alloc(n, sizeof(signed char), b"b")
+
+cdef int32_t[::1] int32_alloc(unsigned n):
+    return block_alloc(n, sizeof(int32_t), b"i")
+
+cdef int64_t[::1] int64_alloc(unsigned n):
+    return block_alloc(n, sizeof(int64_t), b"q")
+
+cdef uint64_t[::1] uint64_alloc(unsigned n):
+    return block_alloc(n, sizeof(uint64_t), b"Q")
@@ -19,6 +19,8 @@ cdef parse_type_char(Py_UCS4 c):
         return None
     elif c==u'o':
         return Object()
+    elif c==u'c': # CATEGORICAL
+        return Categorical()
     #
     # Numeric types
     #
@@ -129,7 +131,18 @@ class Float(ColType):
         - precision:
             The number of digits after the decimal separator when converting
             to a string.
+        - storage:
+            "float64" (the default) or "float32". Single-precision storage halves
+            the memory used by the column. Computations are still performed in
+            double precision.
     """
+    def __init__(self, **kwargs):
+        storage = kwargs.get("storage", "float64")
+        if storage not in ("float64", "float32"):
+            raise ValueError(f"Invalid storage {storage!r}")
+
+        ColType.__init__(self, **kwargs)
+
     def parse_sequence(self, sequence):
         cdef list result = []
         cdef unsigned precision = 2
@@ -239,6 +252,17 @@ class Object(ColType):
     def parse_sequence(self, sequence):
         return sequence
 
+class Categorical(ColType):
+    """ The type for a column containing a small set of distinct values, like tickers
+        or exchange codes.
+
+        The column stores the values as 32-bit codes into a dictionary of distinct
+        values shared by the columns derived from it. Grouping and equality tests are
+        performed on the codes.
+    """
+    def parse_sequence(self, sequence):
+        return sequence
+
 class Other(ColType):
     """ User-defined type.
 
@@ -262,10 +286,28 @@ class Other(ColType):
 class DateTimeBase(ColType):
     """ The type for a column containing datetime values.
 
+        Internally, the column stores the values as 64-bit integers counting the
+        number of `RESOLUTION` units since the Unix epoch.
+
         This type support the following options:
         - format:
             The strftime format string used when converting to string.
     """
+    RESOLUTION = None
+
+    def to_epoch(self, value):
+        """ Convert a calendar date to the number of units since the Unix epoch.
+        """
+        if value.resolution != self.RESOLUTION:
+            raise ValueError(f"Cannot mix {value.resolution} and {self.RESOLUTION}")
+
+        return value.epoch
+
+    def from_epoch(self, epoch):
+        """ Convert a number of units since the Unix epoch to a calendar date.
+        """
+        return datetime.CalendarDate.fromepoch(epoch, self.RESOLUTION)
+
     def create_formatter(self):
         format = self._options.get("format")
 
@@ -317,6 +359,8 @@ class DateTimeBase(ColType):
         return result
 
 class Date(DateTimeBase):
+    RESOLUTION = datetime.DATE
+
     def parse_sequence(self, sequence):
         return self.parse_sequence_to(
                 sequence, datetime.CalendarDate,
@@ -324,6 +368,8 @@ class Date(DateTimeBase):
             )
 
 class DateTime(DateTimeBase):
+    RESOLUTION = datetime.DATETIME
+
     def parse_sequence(self, sequence):
         return self.parse_sequence_to(sequence,
                 datetime.CalendarDateTime,
@@ -331,6 +377,8 @@ class DateTime(DateTimeBase):
             )
 
 class DateTimeMicro(DateTimeBase):
+    RESOLUTION = datetime.DATETIMEMS
+
     def parse_sequence(self, sequence):
         return self.parse_sequence_to(
                 sequence,
@@ -1,4 +1,5 @@
 from cpython cimport array
+from libc.stdint cimport int32_t, int64_t, uint64_t, INT64_MIN
 from fin.containers.tuple cimport Tuple
 import array
 
@@ -7,6 +8,43 @@ import array
 # ======================================================================
 cpdef Column as_column(sequence)
 
+# ======================================================================
+# Bit-packed ternary values
+# ======================================================================
+# A ternary column of n rows can be stored as two bitplanes of
+# `planes_words(n)` 64-bit words each, packed one after the other in the same
+# array: the "known" plane, then the "value" plane. Row i is stored in bit
+# i%64 of word i//64 of each plane:
+#
+#   known   value
+#     0       0     None
+#     1       0     False
+#     1       1     True
+#
+# The value bit is never set when the known bit is clear, and the padding bits
+# of the last word are always clear.
+cdef inline Py_ssize_t planes_words(Py_ssize_t n) nogil:
+    return (n + 63) >> 6
+
+cdef inline uint64_t planes_tail_mask(Py_ssize_t n) nogil:
+    """
+    Return the mask of the bits used in the last word of a plane of `n` rows.
+    """
+    return (~<uint64_t>0) >> ((64 - (n & 63)) & 63)
+
+# ======================================================================
+# Column statistics
+# ======================================================================
+cdef class ColumnStats:
+    """
+    Statistics computed in one pass over a column's values.
+    """
+    cdef readonly object    min         # None if the column has no values
+    cdef readonly object    max         # None if the column has no values
+    cdef readonly unsigned  null_count
+    cdef readonly bint      ascending   # Strictly ascending, without None
+    cdef readonly object    sum         # None if the values cannot be added
+
 # ======================================================================
 # Column class
 # ======================================================================
@@ -19,7 +57,20 @@ cdef class Column:
     # ------------------------------------------------------------------
     cdef Tuple          _py_values # Python objects
     cdef double[::1]    _f_values  # Array of doubles
+    cdef float[::1]     _s_values  # Array of single-precision floats (NaN is None)
     cdef signed char[::1] _t_values  # Array of ternary values (-1, 0, +1)
+    cdef uint64_t[::1]  _b_planes  # Bit-packed ternary values (see above)
+    cdef int64_t[::1]   _i_values  # Array of 64-bit integers (INT64_MIN is None)
+    cdef int32_t[::1]   _c_codes   # Array of category codes (-1 is None)
+    cdef Tuple          _categories # Dictionary of the categorical values, shared by derived columns
+    cdef unsigned char  _derived   # Bit mask of the representations held by the cache
+    cdef object         _expr      # Pending arithmetic expression, evaluated on demand
+    cdef object         _runs      # Run-length encoded Python objects (constant columns)
+    cdef object         _sparse    # Sparse values (mostly None columns)
+    cdef object         _strided   # Strided view of another column
+    cdef object         _packed    # Compressed 64-bit values, decoded on demand
+    cdef object         _selection # Rows of another column, gathered on demand
+    cdef ColumnStats    _stats     # Cached statistics (columns are immutable)
 
     # ------------------------------------------------------------------
     # Metadata
@@ -28,6 +79,7 @@ cdef class Column:
     cdef unsigned       _id
     cdef str            _name
     cdef object         _type
+    cdef object         __weakref__
 
     # ------------------------------------------------------------------
     # Accessors
@@ -36,21 +88,32 @@ cdef class Column:
 
     cdef const double*  as_float_values(self) except NULL
     cdef const signed char*  as_ternary_values(self) except NULL
+    cdef const uint64_t* as_ternary_planes(self) except? NULL
+    cdef const int64_t* as_int_values(self) except NULL
+    cdef const int32_t* as_codes(self) except? NULL
     # Methods `as_....()` above:
-    # The returned buffer is valid as long as the column exists.
+    # The returned buffer is valid as long as the column exists and no new
+    # column is created by the calling thread (when a memory budget is set,
+    # creating a column may evict cached representations, and release those
+    # lent to the thread). The accessors themselves never evict: a kernel may
+    # borrow the buffers of all its operands, then create its result.
     # Raise an exception if the column's values cannot be represented using the
     # requested type.
 
 
+    cdef ColumnStats    get_stats(self)
     cdef str            get_name(self)
     cdef object         get_type(self)
+    cdef object         get_float_type(self)
 
     # ------------------------------------------------------------------
     # Cython-specific interface
     # ------------------------------------------------------------------
     cdef Column         c_remap(self, unsigned len, const unsigned* mapping)
     cdef Column         c_rename(self, str newName)
+    cdef Column         c_select(self, unsigned[::1] rows)
     cdef Column         c_shift(self, int n)
+    cdef int            c_mark_changes(self, unsigned char* changes) except -1
 
     cdef Column         c_add_scalar(self, double scalar)
     cdef Column         c_sub_scalar(self, double scalar)
@@ -1,18 +1,177 @@
 from cpython cimport array
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release
 from cpython.object cimport Py_EQ, Py_NE
-from fin.mathx cimport NaN, isnan
+from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from libc.stdint cimport int32_t, int64_t, uint64_t, INT64_MIN, INT64_MAX
+from fin.mathx cimport NaN, isnan, ualloc
+from fin.config cimport parallel_threads
+from cython.parallel cimport prange, threadid
+from libc.math cimport fabs, pow, INFINITY
+cimport cython
 
 import array
+import itertools
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
 from fin.seq import coltypes
 from fin.seq cimport coltypes
 
 from fin cimport mem
+from fin.seq cimport packing
 
 # ======================================================================
 # Globals
 # ======================================================================
 cdef unsigned   _id = 0
 
+# ======================================================================
+# Representation cache
+# ======================================================================
+# Secondary representations (those created on demand by converting the
+# column's primary representation) are registered here in LRU order.
+# When a memory budget is set, the least recently used ones are evicted,
+# and they will be regenerated on demand.
+#
+# Eviction only occurs when a budget is set, and when a column is created
+# outside of an accessor. Accessors never create columns, and eviction is held
+# while they resolve lazy columns. Other threads may still evict a buffer while
+# a kernel uses it: the cached buffers returned by `Column.as_....()` are also
+# lent to the calling thread, which keeps them alive until it creates a column.
+# So they remain valid until the kernel that borrowed them creates its result.
+cdef enum:
+    REPR_PY = 1
+    REPR_F  = 2
+    REPR_T  = 4
+    REPR_I  = 8
+    REPR_C  = 16 # Category codes. Never cached: this is always a primary representation
+    REPR_S  = 32 # Single-precision floats. Never cached either
+    REPR_B  = 64 # Bit-packed ternary values
+
+cdef object     _cache = OrderedDict() # (column id, repr) -> (weakref, nbytes)
+cdef Py_ssize_t _cache_bytes = 0
+cdef Py_ssize_t _budget = -1 # A negative value means "unlimited"
+cdef unsigned   _cache_holds = 0 # Eviction is deferred while positive
+cdef object     _lent = threading.local() # Cached buffers borrowed by each thread
+
+def set_memory_budget(budget):
+    """
+    Set the maximum number of bytes used by the cached secondary representations
+    of all columns.
+
+    Use `None` to remove the limit (the default).
+    """
+    global _budget
+    _budget = -1 if budget is None else budget
+    if _budget >= 0 and _cache_bytes > _budget and not _cache_holds:
+        cache_enforce()
+
+def get_memory_budget():
+    """
+    Return the current memory budget, or None if unlimited.
+    """
+    return None if _budget < 0 else _budget
+
+def get_cache_usage():
+    """
+    Return the number of bytes currently used by cached secondary representations.
+    """
+    return _cache_bytes
+
+def _cache_forget(key, ref):
+    """
+    Weak reference callback: remove the cache entry of a deallocated column.
+    """
+    global _cache_bytes
+    entry = _cache.get(key)
+    if entry is not None and entry[0] is ref:
+        del _cache[key]
+        _cache_bytes -= entry[1]
+
+cdef cache_register(Column column, unsigned char kind, Py_ssize_t nbytes):
+    global _cache_bytes
+    key = (column._id, kind)
+    entry = _cache.pop(key, None)
+    if entry is not None:
+        _cache_bytes -= entry[1]
+
+    _cache[key] = (weakref.ref(column, partial(_cache_forget, key)), nbytes)
+    _cache_bytes += nbytes
+    column._derived |= kind
+
+cdef inline cache_touch(Column column, unsigned char kind):
+    if column._derived & kind:
+        _cache.move_to_end((column._id, kind))
+
+cdef inline int cache_lend(Column column, unsigned char kind, object buffer) except -1:
+    """
+    Keep the cached representation `buffer` alive until the current thread creates
+    a column, even if another thread evicts it meanwhile.
+    """
+    if _budget < 0 or not column._derived & kind:
+        return 0
+
+    try:
+        _lent.buffers.append(buffer)
+    except AttributeError:
+        _lent.buffers = [ buffer ]
+
+    return 0
+
+cdef inline int cache_release() except -1:
+    """
+    Release the buffers lent to the current thread.
+    """
+    cdef list buffers = getattr(_lent, "buffers", None)
+    if buffers:
+        buffers.clear()
+
+    return 0
+
+cdef cache_enforce():
+    global _cache_bytes
+    cdef Column column
+
+    while _cache_bytes > _budget and _cache:
+        (_, kind), (ref, nbytes) = _cache.popitem(last=False)
+        _cache_bytes -= nbytes
+
+        column = ref()
+        if column is None:
+            continue
+
+        column._derived &= ~kind
+        if kind == REPR_PY:
+            column._py_values = None
+        elif kind == REPR_F:
+            column._f_values = None
+        elif kind == REPR_T:
+            column._t_values = None
+        elif kind == REPR_I:
+            column._i_values = None
+        elif kind == REPR_B:
+            column._b_planes = None
+
+cdef Py_ssize_t tuple_nbytes(Tuple sequence, bint deep) except -1:
+    """
+    Return the number of bytes used by a Tuple.
+
+    In deep mode, the size of the referenced objects is included (shared objects are
+    counted once per reference, singletons like None are ignored).
+    """
+    cdef Py_ssize_t nbytes = len(sequence)*sizeof(void*)
+    if deep:
+        for obj in sequence:
+            if obj is not None and obj is not True and obj is not False:
+                nbytes += sys.getsizeof(obj)
+
+    return nbytes
+
 # ======================================================================
 # Errors
 # ======================================================================
@@ -56,9 +215,53 @@ cpdef double[::1] f_values_from_py_values(Tuple sequence):
 
     return arr
 
+cpdef float[::1] s_values_from_py_values(Tuple sequence):
+    cdef unsigned n = len(sequence)
+    cdef unsigned i
+    cdef float[::1] arr = mem.float_alloc(n)
+
+    for i in range(n):
+        arr[i] = NaN if sequence[i] is None else sequence[i]
+
+    return arr
+
+cpdef double[::1] f_values_from_s_values(float[::1] arr):
+    cdef unsigned n = len(arr)
+    cdef double[::1] result = mem.double_alloc(n)
+    cdef const float* src = <const float*>mv_data(arr)
+    cdef double* dst = <double*>mv_data(result)
+
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=parallel_threads(n), schedule="static"):
+        dst[i] = src[i]
+
+    return result
+
+cpdef float[::1] s_values_from_f_values(double[::1] arr):
+    """ Narrow an array of doubles to single precision.
+
+        Values out of the float range become infinite. NaN is preserved.
+    """
+    cdef unsigned n = len(arr)
+    cdef float[::1] result = mem.float_alloc(n)
+    cdef const double* src = <const double*>mv_data(arr)
+    cdef float* dst = <float*>mv_data(result)
+
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=parallel_threads(n), schedule="static"):
+        dst[i] = <float>src[i]
+
+    return result
+
+cdef inline bint single_storage(object coltype):
+    """
+    Return true if `coltype` requests single-precision storage.
+    """
+    return isinstance(coltype, coltypes.Float) and coltype._options.get("storage") == "float32"
+
 cpdef Tuple py_values_from_f_values(double[::1] arr):
     cdef unsigned n = len(arr)
-    cdef const double* src = &arr[0]
+    cdef const double* src = <const double*>mv_data(arr)
     cdef list lst = []
 
     cdef unsigned i
@@ -96,7 +299,7 @@ cpdef signed char[::1] t_values_from_py_values(Tuple sequence):
 
 cpdef Tuple py_values_from_t_values(signed char[::1] arr):
     cdef unsigned n = len(arr)
-    cdef const signed char* src = &arr[0]
+    cdef const signed char* src = <const signed char*>mv_data(arr)
     cdef list lst = []
 
     cdef unsigned i
@@ -110,212 +313,719 @@ cpdef Tuple py_values_from_t_values(signed char[::1] arr):
 
     return Tuple.create(n, lst)
 
-# ----------------------------------------------------------------------
-# Addition
-# ----------------------------------------------------------------------
-cdef Column add_column_scalar(Column column, double scalar):
+cdef inline signed char planes_get(const uint64_t* planes, Py_ssize_t nwords, Py_ssize_t i) nogil:
     """
-    Column to scalar addition.
+    Return the ternary value of row `i` from a pair of bitplanes.
+    """
+    cdef int shift = i & 63
+    cdef int k = (planes[i >> 6] >> shift) & 1
+    cdef int v = (planes[nwords + (i >> 6)] >> shift) & 1
 
-    This method performs an implicit conversion to float values.
+    return <signed char>(2*v - k)
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
+cdef uint64_t[::1] b_planes_from_t_values(signed char[::1] arr):
     """
-    cdef Column result = new_column_with_meta(column, column.length, type="n")
-    result._name = f"({column.get_name()}+{scalar})"
+    Pack an array of ternary values into a pair of bitplanes.
+    """
+    cdef Py_ssize_t n = arr.shape[0]
+    cdef Py_ssize_t nwords = planes_words(n)
+    cdef uint64_t[::1] planes = mem.uint64_alloc(2*nwords)
+    cdef uint64_t* known = planes_data(planes)
+    cdef uint64_t* value = known + nwords
+    cdef const signed char* src = <const signed char*>mv_data(arr)
+    cdef Py_ssize_t w, i, end
+    cdef uint64_t k, v
+
+    with nogil:
+        for w in prange(nwords, num_threads=parallel_threads(n), schedule="static"):
+            k = 0
+            v = 0
+            end = min(n, 64*w + 64)
+            for i in range(64*w, end):
+                k = k | <uint64_t>(src[i] != 0) << (i & 63)
+                v = v | <uint64_t>(src[i] > 0) << (i & 63)
+            known[w] = k
+            value[w] = v
+
+    return planes
+
+cdef signed char[::1] t_values_from_b_planes(uint64_t[::1] planes, Py_ssize_t n):
+    cdef signed char[::1] arr = mem.schar_alloc(n)
+    cdef signed char* dst = <signed char*>mv_data(arr)
+    cdef const uint64_t* src = planes_data(planes)
+    cdef Py_ssize_t nwords = planes_words(n)
+    cdef Py_ssize_t i
 
-    result._f_values = add_vector_scalar(
-            column.length,
-            column.as_float_values(),
-            scalar
-    )
+    with nogil:
+        for i in prange(n, num_threads=parallel_threads(n), schedule="static"):
+            dst[i] = planes_get(src, nwords, i)
 
-    return result
+    return arr
 
-cdef Column add_column_column(Column a, Column b):
-    """
-    Column to column addition.
+cdef Tuple py_values_from_b_planes(uint64_t[::1] planes, Py_ssize_t n):
+    cdef const uint64_t* src = planes_data(planes)
+    cdef Py_ssize_t nwords = planes_words(n)
+    cdef list lst = []
 
-    This method performs an implicit conversion to float values.
+    cdef Py_ssize_t i
+    for i in range(n):
+        lst.append(ternary_to_py(planes_get(src, nwords, i)))
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
+    return Tuple.create(n, lst)
+
+cpdef int64_t[::1] i_values_from_py_values(Tuple sequence):
+    """ Convert a column to an array of 64-bit integers.
+
+        None is stored as the INT64_MIN sentinel value. Consequently, INT64_MIN
+        itself cannot be represented in an integer column.
+        Raise ValueError if a value has a fractional part.
     """
-    cdef unsigned lenA = a.length
-    cdef unsigned lenB = b.length
+    cdef unsigned n = len(sequence)
+    cdef unsigned i
+    cdef int64_t[::1] arr = mem.int64_alloc(n)
+    cdef int64_t tmp
+    cdef object obj
 
-    if lenB != lenA:
-        raise ColumnSizeMismatchError(a, b)
+    for i in range(n):
+        obj = sequence[i]
+        if obj is None:
+            tmp = INT64_MIN
+        else:
+            tmp = obj
+            if tmp == INT64_MIN:
+                raise OverflowError(f"Value {obj} is reserved as the integer null value")
+            if type(obj) is not int and tmp != obj:
+                raise ValueError(f"Cannot convert {obj} to an integer")
 
-    cdef Column result = new_column_with_meta(a, lenA, type="n")
-    result._name = f"({a.get_name()}+{b.get_name()})"
+        arr[i] = tmp
 
-    result._f_values = add_vector_vector(
-            lenA,
-            a.as_float_values(),
-            b.as_float_values(),
-    )
+    return arr
 
-    return result
+cpdef Tuple py_values_from_i_values(int64_t[::1] arr):
+    cdef unsigned n = len(arr)
+    cdef list lst = []
 
-cdef double[::1] add_vector_scalar(unsigned count, const double* values, double other):
-    cdef double[::1] arr = mem.double_alloc(count)
     cdef unsigned i
+    for i in range(n):
+        lst.append(None if arr[i] == INT64_MIN else arr[i])
 
-    for i in range(count):
-        arr[i] = values[i] + other
+    return Tuple.create(n, lst)
 
-    return arr
+cpdef int64_t[::1] i_values_from_dates(Tuple sequence, object coltype):
+    """ Convert a sequence of calendar dates to an array of 64-bit integers.
 
-cdef double[::1] add_vector_vector(unsigned count, const double* a, const double* b):
-    cdef double[::1] arr = mem.double_alloc(count)
+        Dates are stored as a number of days, seconds or microseconds since the
+        Unix epoch, depending on the resolution of `coltype`.
+        None is stored as the INT64_MIN sentinel value.
+    """
+    cdef unsigned n = len(sequence)
     cdef unsigned i
+    cdef int64_t[::1] arr = mem.int64_alloc(n)
+    cdef object obj
+    to_epoch = coltype.to_epoch
 
-    for i in range(count):
-        arr[i] = a[i] + b[i]
+    for i in range(n):
+        obj = sequence[i]
+        if obj is None:
+            arr[i] = INT64_MIN
+        else:
+            try:
+                arr[i] = to_epoch(obj)
+            except AttributeError:
+                raise TypeError(f"Expected a calendar date, got {obj!r}")
 
     return arr
 
-# ----------------------------------------------------------------------
-# Multiplication
-# ----------------------------------------------------------------------
-cdef Column mul_column_scalar(Column column, double scalar):
-    """
-    Column to scalar multiplication.
+cpdef Tuple dates_from_i_values(int64_t[::1] arr, object coltype):
+    cdef unsigned n = len(arr)
+    cdef list lst = []
+    from_epoch = coltype.from_epoch
 
-    This method performs an implicit conversion to float values.
+    cdef unsigned i
+    for i in range(n):
+        lst.append(None if arr[i] == INT64_MIN else from_epoch(arr[i]))
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
-    """
-    cdef Column result = new_column_with_meta(column, column.length, type="n")
-    result._name = f"({column.get_name()}*{scalar})"
+    return Tuple.create(n, lst)
+
+cpdef double[::1] f_values_from_i_values(int64_t[::1] arr):
+    cdef unsigned n = len(arr)
+    cdef double[::1] result = mem.double_alloc(n)
+    cdef const int64_t* src = <const int64_t*>mv_data(arr)
+    cdef double* dst = <double*>mv_data(result)
 
-    result._f_values = mul_vector_scalar(
-            column.length,
-            column.as_float_values(),
-            scalar
-    )
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=parallel_threads(n), schedule="static"):
+        dst[i] = NaN if src[i] == INT64_MIN else <double>src[i]
 
     return result
 
-cdef Column mul_column_column(Column a, Column b):
-    """
-    Column to column multiplication.
+cpdef signed char[::1] t_values_from_i_values(int64_t[::1] arr):
+    cdef unsigned n = len(arr)
+    cdef signed char[::1] result = mem.schar_alloc(n)
+    cdef const int64_t* src = <const int64_t*>mv_data(arr)
+    cdef signed char* dst = <signed char*>mv_data(result)
+
+    cdef Py_ssize_t i
+    for i in prange(n, nogil=True, num_threads=parallel_threads(n), schedule="static"):
+        if src[i] == INT64_MIN:
+            dst[i] = 0
+        elif src[i]:
+            dst[i] = 1
+        else:
+            dst[i] = -1
 
-    This method performs an implicit conversion to float values.
+    return result
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
+cpdef int64_t[::1] i_values_from_f_values(double[::1] arr):
+    """ Convert an array of floats to an array of 64-bit integers.
+
+        NaN is mapped to the INT64_MIN sentinel value.
+        Raise ValueError if a value has a fractional part or is out of range.
     """
-    cdef unsigned lenA = a.length
-    cdef unsigned lenB = b.length
+    cdef unsigned n = len(arr)
+    cdef int64_t[::1] result = mem.int64_alloc(n)
+    cdef double value
 
-    if lenB != lenA:
-        raise ColumnSizeMismatchError(a, b)
+    cdef unsigned i
+    for i in range(n):
+        value = arr[i]
+        if isnan(value):
+            result[i] = INT64_MIN
+        elif not -9.2233720368547758e18 < value < 9.2233720368547758e18 or value != <int64_t>value:
+            raise ValueError(f"Cannot convert {value} to an integer")
+        else:
+            result[i] = <int64_t>value
 
-    cdef Column result = new_column_with_meta(a, lenA, type="n")
-    result._name = f"({a.get_name()}*{b.get_name()})"
+    return result
 
-    result._f_values = mul_vector_vector(
-            lenA,
-            a.as_float_values(),
-            b.as_float_values(),
-    )
+# ----------------------------------------------------------------------
+# Arithmetic expressions
+# ----------------------------------------------------------------------
+# Arithmetic operators do not compute their result immediately. They return
+# a "lazy" column holding an expression tree whose leaves are the operand
+# columns and scalar constants. Operators applied to lazy columns extend
+# the tree instead of materializing the intermediate results.
+#
+# The tree is evaluated on the first access to the column's values. It is
+# compiled into a small stack-based program run block by block over the
+# data: intermediate results stay in cache-sized scratch buffers, and only the
+# final result is allocated.
+cdef enum:
+    EXPR_LOAD
+    EXPR_RUNS
+    EXPR_CONST
+    EXPR_ADD
+    EXPR_SUB
+    EXPR_MUL
+    EXPR_DIV
+    EXPR_POW
+    EXPR_NEG
+    EXPR_ABS
+
+cdef enum:
+    EXPR_BLOCK_SIZE = 512
+    EXPR_MAX_SIZE = 32  # Larger operands are materialized before being combined
+
+cdef class Expr:
+    """
+    A node of an arithmetic expression tree.
+    """
+    cdef int        op
+    cdef unsigned   size    # Number of nodes in the tree
+    cdef unsigned   depth   # Number of stack slots required to evaluate the tree
+    cdef Column     column  # EXPR_LOAD only
+    cdef int        offset  # EXPR_LOAD only: row i reads column[offset+i*stride], or NaN out of bounds
+    cdef unsigned   stride  # EXPR_LOAD only
+    cdef Runs       runs    # EXPR_RUNS only
+    cdef double[::1] run_values # EXPR_RUNS only
+    cdef double     value   # EXPR_CONST only
+    cdef Expr       left
+    cdef Expr       right
+
+cdef Expr expr_operand(Column column):
+    """
+    Return the expression tree computing the values of `column`.
+    """
+    cdef Expr expr = <Expr>column._expr
+    cdef double[::1] run_values
+    if expr is not None:
+        if expr.size < EXPR_MAX_SIZE:
+            return expr
+        materialize(column)
+
+    if column._runs is not None and column._f_values is None:
+        # Broadcast the runs instead of expanding them
+        run_values = f_values_from_py_values((<Runs>column._runs).values)
+        if len(run_values) == 1:
+            return expr_const(run_values[0])
+
+        expr = Expr.__new__(Expr)
+        expr.op = EXPR_RUNS
+        expr.size = expr.depth = 1
+        expr.runs = column._runs
+        expr.run_values = run_values
+
+        return expr
+
+    cdef Strided view = <Strided>column._strided
+    if view is not None and column._f_values is None and (
+            view.base._f_values is not None or view.base._s_values is not None):
+        # Read the view's rows in place
+        return expr_load(view.base, view.start, view.step)
+
+    return expr_load(column, 0)
+
+cdef Expr expr_load(Column column, int offset, unsigned stride=1):
+    if column._s_values is None:
+        get_f_values(column) # Raise conversion errors early
+
+    cdef Expr expr = Expr.__new__(Expr)
+    expr.op = EXPR_LOAD
+    expr.size = expr.depth = 1
+    expr.column = column
+    expr.offset = offset
+    expr.stride = stride
+
+    return expr
+
+cdef Expr expr_const(double value):
+    cdef Expr expr = Expr.__new__(Expr)
+    expr.op = EXPR_CONST
+    expr.size = expr.depth = 1
+    expr.value = value
+
+    return expr
+
+cdef Expr expr_unary(int op, Expr operand):
+    cdef Expr expr = Expr.__new__(Expr)
+    expr.op = op
+    expr.size = operand.size + 1
+    expr.depth = operand.depth
+    expr.left = operand
+
+    return expr
+
+cdef Expr expr_binary(int op, Expr left, Expr right):
+    if op == EXPR_DIV and right.op == EXPR_CONST and right.value == 0.0:
+        raise ZeroDivisionError("float division by zero")
+
+    cdef Expr expr = Expr.__new__(Expr)
+    expr.op = op
+    expr.size = left.size + right.size + 1
+    expr.depth = max(left.depth, right.depth + 1)
+    expr.left = left
+    expr.right = right
+
+    return expr
+
+cdef Column lazy_column(Column meta, Expr expr, str name, type="n"):
+    cdef Column result = new_column_with_meta(meta, meta.length, type=type)
+    result._name = name
+    result._expr = expr
 
     return result
 
-cdef double[::1] mul_vector_scalar(unsigned count, const double* values, double other):
-    cdef double[::1] arr = mem.double_alloc(count)
-    cdef unsigned i
+cdef int expr_storage(Expr expr):
+    """
+    Return a bit mask of the storage read by the EXPR_LOAD leaves of `expr`:
+    1 for doubles, 2 for single-precision floats.
+    """
+    cdef int result = 0
+    if expr.op == EXPR_LOAD:
+        return 2 if (<Column>expr.column)._s_values is not None else 1
+    if expr.left is not None:
+        result |= expr_storage(expr.left)
+    if expr.right is not None:
+        result |= expr_storage(expr.right)
 
-    for i in range(count):
-        arr[i] = values[i] * other
+    return result
 
-    return arr
+cdef inline bint is_lazy(Column column):
+    return column._expr is not None or column._selection is not None
 
-cdef double[::1] mul_vector_vector(unsigned count, const double* a, const double* b):
-    cdef double[::1] arr = mem.double_alloc(count)
-    cdef unsigned i
+cdef int materialize(Column column) except -1:
+    """
+    Evaluate the expression held by a lazy column, or gather its pending selection.
 
-    for i in range(count):
-        arr[i] = a[i] * b[i]
+    The computation is performed in double precision. The result is stored in
+    single precision if all the loaded columns are.
 
-    return arr
+    Materialization happens inside accessors, while the calling kernel may
+    already hold buffers of other columns: eviction is deferred until it ends.
+    """
+    global _cache_holds
+    cdef Expr expr
+    cdef double[::1] result
+    _cache_holds += 1
+    try:
+        if column._selection is not None:
+            return gather(column)
 
-# ----------------------------------------------------------------------
-# Division
-# ----------------------------------------------------------------------
-cdef Column div_column_scalar(Column column, double scalar):
+        expr = <Expr>column._expr
+        result = expr_eval(expr, column.length)
+        if expr_storage(expr) == 2:
+            column._s_values = s_values_from_f_values(result)
+        else:
+            column._f_values = result
+        column._expr = None
+    finally:
+        _cache_holds -= 1
+
+    return 0
+
+ctypedef struct expr_instr_t:
+    int             op
+    const double*   src     # EXPR_LOAD and EXPR_RUNS (one value per run)
+    const float*    src32   # EXPR_LOAD only: single-precision source, or NULL
+    long            offset  # EXPR_LOAD only
+    long            stride  # EXPR_LOAD only
+    unsigned        length  # EXPR_LOAD only
+    const unsigned* ends    # EXPR_RUNS only
+    unsigned        nruns   # EXPR_RUNS only
+    double          value   # EXPR_CONST only
+
+cdef unsigned expr_compile(Expr expr, expr_instr_t* program, unsigned pc) except? 0:
+    """
+    Store the instructions to evaluate `expr` in postfix order, starting at `pc`.
+    Return the address of the next instruction.
     """
-    Column to scalar division.
+    if expr.left is not None:
+        pc = expr_compile(expr.left, program, pc)
+    if expr.right is not None:
+        pc = expr_compile(expr.right, program, pc)
+
+    program[pc].op = expr.op
+    cdef Column column
+    if expr.op == EXPR_LOAD:
+        column = expr.column
+        if column._f_values is None and column._s_values is not None:
+            # Widened block by block while evaluating
+            program[pc].src = NULL
+            program[pc].src32 = <const float*>mv_data(column._s_values)
+        else:
+            program[pc].src = <const double*>mv_data(get_f_values(column))
+            program[pc].src32 = NULL
+        program[pc].offset = expr.offset
+        program[pc].stride = expr.stride
+        program[pc].length = expr.column.length
+    elif expr.op == EXPR_RUNS:
+        program[pc].src = <const double*>mv_data(expr.run_values)
+        program[pc].ends = &expr.runs.ends[0]
+        program[pc].nruns = expr.runs.ends.shape[0]
+    elif expr.op == EXPR_CONST:
+        program[pc].value = expr.value
+
+    return pc + 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int expr_vv(int op, unsigned n, double* out, const double* x, const double* y) except -1 nogil:
+    cdef unsigned i
+    if op == EXPR_ADD:
+        for i in range(n):
+            out[i] = x[i] + y[i]
+    elif op == EXPR_SUB:
+        for i in range(n):
+            out[i] = x[i] - y[i]
+    elif op == EXPR_MUL:
+        for i in range(n):
+            out[i] = x[i] * y[i]
+    elif op == EXPR_DIV:
+        for i in range(n):
+            out[i] = x[i] / y[i]
+    elif op == EXPR_POW:
+        for i in range(n):
+            out[i] = pow(x[i], y[i])
+
+    return 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int expr_vs(int op, unsigned n, double* out, const double* x, double y) except -1 nogil:
+    cdef unsigned i
+    if op == EXPR_ADD:
+        for i in range(n):
+            out[i] = x[i] + y
+    elif op == EXPR_SUB:
+        for i in range(n):
+            out[i] = x[i] - y
+    elif op == EXPR_MUL:
+        for i in range(n):
+            out[i] = x[i] * y
+    elif op == EXPR_DIV:
+        for i in range(n):
+            out[i] = x[i] / y
+    elif op == EXPR_POW:
+        for i in range(n):
+            out[i] = pow(x[i], y)
+
+    return 0
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int expr_sv(int op, unsigned n, double* out, double x, const double* y) except -1 nogil:
+    cdef unsigned i
+    if op == EXPR_ADD:
+        for i in range(n):
+            out[i] = x + y[i]
+    elif op == EXPR_SUB:
+        for i in range(n):
+            out[i] = x - y[i]
+    elif op == EXPR_MUL:
+        for i in range(n):
+            out[i] = x * y[i]
+    elif op == EXPR_DIV:
+        for i in range(n):
+            out[i] = x / y[i]
+    elif op == EXPR_POW:
+        for i in range(n):
+            out[i] = pow(x, y[i])
+
+    return 0
+
+cdef double expr_ss(int op, double x, double y) except? -1 nogil:
+    if op == EXPR_ADD:
+        return x + y
+    elif op == EXPR_SUB:
+        return x - y
+    elif op == EXPR_MUL:
+        return x * y
+    elif op == EXPR_DIV:
+        return x / y
+    else:
+        return pow(x, y)
 
-    This method performs an implicit conversion to float values.
+cdef int expr_eval_block(const expr_instr_t* program, unsigned size,
+        unsigned start, unsigned n, double* dst,
+        double* scratch, const double** ptr, double* val) except -1 nogil:
+    """
+    Evaluate the rows `start` to `start+n` of a compiled expression into `dst`.
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
+    `scratch`, `ptr` and `val` are the evaluation stack. They must not be shared
+    between threads.
     """
-    cdef Column result = new_column_with_meta(column, column.length, type="n")
-    result._name = f"({column.get_name()}/{scalar})"
+    cdef unsigned pc, i, k
+    cdef long first, row, stride
+    cdef int sp, op
+    cdef double* out
+
+    sp = -1
+    for pc in range(size):
+        op = program[pc].op
+        if op == EXPR_LOAD:
+            sp += 1
+            stride = program[pc].stride
+            first = <long>start*stride + program[pc].offset
+            if program[pc].src32 != NULL:
+                out = scratch + sp*EXPR_BLOCK_SIZE
+                for i in range(n):
+                    row = first + i*stride
+                    out[i] = program[pc].src32[row] if 0 <= row < program[pc].length else NaN
+                ptr[sp] = out
+            elif stride == 1 and first >= 0 and first + n <= program[pc].length:
+                ptr[sp] = program[pc].src + first
+            else:
+                # Strided or partially out of bounds: gather, padding with NaN
+                out = scratch + sp*EXPR_BLOCK_SIZE
+                for i in range(n):
+                    row = first + i*stride
+                    out[i] = program[pc].src[row] if 0 <= row < program[pc].length else NaN
+                ptr[sp] = out
+            continue
+        elif op == EXPR_RUNS:
+            sp += 1
+            out = scratch + sp*EXPR_BLOCK_SIZE
+            k = runs_find(program[pc].ends, program[pc].nruns, start)
+            for i in range(n):
+                while program[pc].ends[k] <= start + i:
+                    k += 1
+                out[i] = program[pc].src[k]
+            ptr[sp] = out
+            continue
+        elif op == EXPR_CONST:
+            sp += 1
+            ptr[sp] = NULL
+            val[sp] = program[pc].value
+            continue
+        elif op == EXPR_NEG or op == EXPR_ABS:
+            if ptr[sp] == NULL:
+                val[sp] = -val[sp] if op == EXPR_NEG else fabs(val[sp])
+            else:
+                out = dst + start if pc == size-1 else scratch + sp*EXPR_BLOCK_SIZE
+                if op == EXPR_NEG:
+                    for i in range(n):
+                        out[i] = -ptr[sp][i]
+                else:
+                    for i in range(n):
+                        out[i] = fabs(ptr[sp][i])
+                ptr[sp] = out
+            continue
+
+        # Binary operators: the result replaces the left operand
+        if ptr[sp-1] == NULL and ptr[sp] == NULL:
+            val[sp-1] = expr_ss(op, val[sp-1], val[sp])
+            sp -= 1
+            continue
+
+        out = dst + start if pc == size-1 else scratch + (sp-1)*EXPR_BLOCK_SIZE
+        if ptr[sp] == NULL:
+            expr_vs(op, n, out, ptr[sp-1], val[sp])
+        elif ptr[sp-1] == NULL:
+            expr_sv(op, n, out, val[sp-1], ptr[sp])
+        else:
+            expr_vv(op, n, out, ptr[sp-1], ptr[sp])
+        ptr[sp-1] = out
+        sp -= 1
 
-    result._f_values = div_vector_scalar(
-            column.length,
-            column.as_float_values(),
-            scalar
-    )
+    if ptr[0] == NULL:
+        for i in range(n):
+            dst[start+i] = val[0]
+    elif ptr[0] != dst + start:
+        for i in range(n):
+            dst[start+i] = ptr[0][i]
 
-    return result
+    return 0
 
-cdef Column div_column_column(Column a, Column b):
+cdef double[::1] expr_eval(Expr expr, unsigned count):
     """
-    Column to column multiplication.
-
-    This method performs an implicit conversion to float values.
+    Evaluate an expression tree over `count` rows.
 
-    TODO: If implicit conversion raise an error, fallback to cell-by-cell addition.
+    Large columns are split in blocks evaluated in parallel (see `fin.config`).
     """
-    cdef unsigned lenA = a.length
-    cdef unsigned lenB = b.length
-
-    if lenB != lenA:
-        raise ColumnSizeMismatchError(a, b)
+    cdef double[::1] result = mem.double_alloc(count)
+    if count == 0:
+        return result
 
-    cdef Column result = new_column_with_meta(a, lenA, type="n")
-    result._name = f"({a.get_name()}/{b.get_name()})"
+    cdef double* dst = &result[0]
+    cdef unsigned size = expr.size
+    cdef unsigned depth = expr.depth
+    cdef int nthreads = parallel_threads(count)
+    cdef expr_instr_t* program = <expr_instr_t*>malloc(size*sizeof(expr_instr_t))
+    cdef double* scratch = <double*>malloc(nthreads*depth*EXPR_BLOCK_SIZE*sizeof(double))
+    cdef const double** ptr = <const double**>malloc(nthreads*depth*sizeof(double*)) # NULL for scalars
+    cdef double* val = <double*>malloc(nthreads*depth*sizeof(double))
+    cdef Py_ssize_t nblocks = (count + EXPR_BLOCK_SIZE - 1) // EXPR_BLOCK_SIZE
+    cdef Py_ssize_t block
+    cdef unsigned start
+    cdef int tid
 
-    result._f_values = div_vector_vector(
-            lenA,
-            a.as_float_values(),
-            b.as_float_values(),
-    )
+    try:
+        if not (program and scratch and ptr and val):
+            raise MemoryError()
+
+        expr_compile(expr, program, 0)
+
+        for block in prange(nblocks, nogil=True, num_threads=nthreads, schedule="static"):
+            tid = threadid()
+            start = block*EXPR_BLOCK_SIZE
+            expr_eval_block(
+                    program, size, start, min(count - start, EXPR_BLOCK_SIZE), dst,
+                    scratch + tid*depth*EXPR_BLOCK_SIZE, ptr + tid*depth, val + tid*depth
+            )
+    finally:
+        free(program)
+        free(scratch)
+        free(ptr)
+        free(val)
 
     return result
 
-cdef double[::1] div_vector_scalar(unsigned count, const double* values, double other):
-    cdef double[::1] arr = mem.double_alloc(count)
-    cdef unsigned i
+cdef object arithmetic(int op, str symbol, object a, object b):
+    """
+    Build a lazy column computing `a <op> b`. At least one operand must be a column.
 
-    for i in range(count):
-        arr[i] = values[i] / other
+    Division by a constant zero raises ZeroDivisionError immediately. Division by
+    a column containing zeros raises it when the result is materialized.
+    """
+    if op != EXPR_POW and (is_sparse(a) or is_sparse(b)):
+        return sparse_arithmetic(op, symbol, a, b)
+
+    cdef Column ca, cb
+    if isinstance(a, Column):
+        ca = <Column>a
+        if isinstance(b, Column):
+            cb = <Column>b
+            if cb.length != ca.length:
+                raise ColumnSizeMismatchError(ca, cb)
+
+            return lazy_column(
+                    ca,
+                    expr_binary(op, expr_operand(ca), expr_operand(cb)),
+                    f"({ca.get_name()}{symbol}{cb.get_name()})"
+            )
+        elif isinstance(b, (int, float)):
+            return lazy_column(
+                    ca,
+                    expr_binary(op, expr_operand(ca), expr_const(b)),
+                    f"({ca.get_name()}{symbol}{<double>b})"
+            )
+    elif isinstance(a, (int, float)) and isinstance(b, Column):
+        cb = <Column>b
+        return lazy_column(
+                cb,
+                expr_binary(op, expr_const(a), expr_operand(cb)),
+                f"({<double>a}{symbol}{cb.get_name()})"
+        )
 
-    return arr
+    return NotImplemented
 
-cdef double[::1] div_vector_vector(unsigned count, const double* a, const double* b):
-    cdef double[::1] arr = mem.double_alloc(count)
-    cdef unsigned i
+cdef inline bint is_sparse(object obj):
+    return isinstance(obj, Column) and (<Column>obj)._sparse is not None
 
-    for i in range(count):
-        arr[i] = a[i] / b[i]
+cdef Column sparse_column(Column meta, unsigned[::1] rows, Column values, str name, type="n"):
+    cdef Column result = new_column_with_meta(meta, meta.length, type=type)
+    result._name = name
+    result._sparse = sparse_create(rows, values)
 
-    return arr
+    return result
 
-# ----------------------------------------------------------------------
-# Unary negation
-# ----------------------------------------------------------------------
-cdef double[::1] neg(unsigned count, const double* values):
-    cdef double[::1] arr = mem.double_alloc(count)
-    cdef unsigned i
+cdef object sparse_arithmetic(int op, str symbol, object a, object b):
+    """
+    Build a sparse column computing `a <op> b` when an operand is sparse.
 
-    for i in range(count):
-        arr[i] = -values[i]
+    None (NaN) is absorbing for the arithmetic operators except `**`, so only
+    the rows stored by the sparse operands are computed (the rows stored by
+    both if both operands are sparse).
+    """
+    cdef Column meta
+    cdef Sparse sparse
+    cdef unsigned[::1] rows
+    if isinstance(a, Column) and isinstance(b, Column):
+        meta = <Column>a
+        if (<Column>b).length != meta.length:
+            raise ColumnSizeMismatchError(a, b)
+
+        name = f"({meta.get_name()}{symbol}{(<Column>b).get_name()})"
+        if is_sparse(a) and is_sparse(b):
+            rows = rows_merge((<Column>a)._sparse, (<Column>b)._sparse, False)
+            a = sparse_values_at(a, rows)
+            b = sparse_values_at(b, rows)
+        elif is_sparse(a):
+            sparse = (<Column>a)._sparse
+            rows = sparse.rows
+            a = sparse.values
+            b = sparse_values_at(b, rows)
+        else:
+            sparse = (<Column>b)._sparse
+            rows = sparse.rows
+            a = sparse_values_at(a, rows)
+            b = sparse.values
+    elif isinstance(b, (int, float)):
+        meta = <Column>a
+        name = f"({meta.get_name()}{symbol}{<double>b})"
+        sparse = meta._sparse
+        rows = sparse.rows
+        a = sparse.values
+    elif isinstance(a, (int, float)):
+        meta = <Column>b
+        name = f"({<double>a}{symbol}{meta.get_name()})"
+        sparse = meta._sparse
+        rows = sparse.rows
+        b = sparse.values
+    else:
+        return NotImplemented
 
-    return arr
+    return sparse_column(meta, rows, arithmetic(op, symbol, a, b), name)
 
 # ----------------------------------------------------------------------
 # Bitwise and
@@ -339,24 +1049,77 @@ cdef Column and_column_column(Column a, Column b):
     if result._type is None:
         result._type = b._type
 
-    result._t_values = and_vector_vector(
-            lenA,
-            a.as_ternary_values(),
-            b.as_ternary_values(),
-    )
+    cdef unsigned[::1] rows
+    if a._sparse is not None and b._sparse is not None:
+        # None&None is None: only the rows stored by either operand are computed
+        rows = rows_merge(a._sparse, b._sparse, True)
+        result._sparse = sparse_create(rows, and_column_column(sparse_values_at(a, rows), sparse_values_at(b, rows)))
+    elif is_constant(a) and is_constant(b):
+        result._runs = runs_constant(lenA, ternary_to_py(
+                min(constant_ternary(a), constant_ternary(b))
+        ))
+    elif is_constant(a) or is_constant(b):
+        if is_constant(a):
+            a, b = b, a
+        result._b_planes = and_vector_scalar(
+                lenA,
+                a.as_ternary_planes(),
+                constant_ternary(b),
+        )
+    else:
+        result._b_planes = and_vector_vector(
+                lenA,
+                a.as_ternary_planes(),
+                b.as_ternary_planes(),
+        )
 
     return result
 
-cdef signed char[::1] and_vector_vector(unsigned count, const signed char* a, const signed char* b):
-    cdef signed char[::1] arr = mem.schar_alloc(count)
-    cdef unsigned i
+# In the functions below, a ternary value is false if its known bit is set and
+# its value bit is clear, and true if its value bit is set.
+cdef uint64_t[::1] and_vector_vector(unsigned count, const uint64_t* a, const uint64_t* b):
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] arr = mem.uint64_alloc(2*nwords)
+    cdef uint64_t* dst = planes_data(arr)
+    cdef Py_ssize_t i
+    cdef uint64_t true
+
+    with nogil:
+        for i in prange(nwords, num_threads=parallel_threads(count), schedule="static"):
+            # True if both are true, false if either is false
+            true = a[nwords+i] & b[nwords+i]
+            dst[nwords+i] = true
+            dst[i] = true | (a[i] & ~a[nwords+i]) | (b[i] & ~b[nwords+i])
 
-    for i in range(count):
-        arr[i] = a[i] if a[i] < b[i] else b[i]
-        # In balanced ternary logic, and() is the same as min()
+    return arr
 
+cdef uint64_t[::1] and_vector_scalar(unsigned count, const uint64_t* a, signed char b):
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] arr = mem.uint64_alloc(2*nwords)
+    cdef uint64_t* dst = planes_data(arr)
+    cdef uint64_t b_true = ~<uint64_t>0 if b > 0 else 0
+    cdef uint64_t b_false = ~<uint64_t>0 if b < 0 else 0
+    cdef Py_ssize_t i
+    cdef uint64_t true
+
+    with nogil:
+        for i in prange(nwords, num_threads=parallel_threads(count), schedule="static"):
+            true = a[nwords+i] & b_true
+            dst[nwords+i] = true
+            dst[i] = true | (a[i] & ~a[nwords+i]) | b_false
+
+    planes_clear_padding(arr, count)
     return arr
 
+cdef signed char constant_ternary(Column column) except? -2:
+    """
+    Return the value of a constant column as a ternary value.
+    """
+    return t_values_from_py_values((<Runs>column._runs).values)[0]
+
+cdef inline object ternary_to_py(signed char value):
+    return None if value == 0 else value > 0
+
 # ----------------------------------------------------------------------
 # Bitwise or
 # ----------------------------------------------------------------------
@@ -379,34 +1142,199 @@ cdef Column or_column_column(Column a, Column b):
     if result._type is None:
         result._type = b._type
 
-    result._t_values = or_vector_vector(
-            lenA,
-            a.as_ternary_values(),
-            b.as_ternary_values(),
-    )
+    cdef unsigned[::1] rows
+    if a._sparse is not None and b._sparse is not None:
+        # None|None is None: only the rows stored by either operand are computed
+        rows = rows_merge(a._sparse, b._sparse, True)
+        result._sparse = sparse_create(rows, or_column_column(sparse_values_at(a, rows), sparse_values_at(b, rows)))
+    elif is_constant(a) and is_constant(b):
+        result._runs = runs_constant(lenA, ternary_to_py(
+                max(constant_ternary(a), constant_ternary(b))
+        ))
+    elif is_constant(a) or is_constant(b):
+        if is_constant(a):
+            a, b = b, a
+        result._b_planes = or_vector_scalar(
+                lenA,
+                a.as_ternary_planes(),
+                constant_ternary(b),
+        )
+    else:
+        result._b_planes = or_vector_vector(
+                lenA,
+                a.as_ternary_planes(),
+                b.as_ternary_planes(),
+        )
 
     return result
 
-cdef signed char[::1] or_vector_vector(unsigned count, const signed char* a, const signed char* b):
-    cdef signed char[::1] arr = mem.schar_alloc(count)
-    cdef unsigned i
+cdef uint64_t[::1] or_vector_vector(unsigned count, const uint64_t* a, const uint64_t* b):
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] arr = mem.uint64_alloc(2*nwords)
+    cdef uint64_t* dst = planes_data(arr)
+    cdef Py_ssize_t i
+    cdef uint64_t true
 
-    for i in range(count):
-        arr[i] = a[i] if a[i] > b[i] else b[i]
-        # In balanced ternary logic, or() is the same as max()
+    with nogil:
+        for i in prange(nwords, num_threads=parallel_threads(count), schedule="static"):
+            # True if either is true, false if both are false
+            true = a[nwords+i] | b[nwords+i]
+            dst[nwords+i] = true
+            dst[i] = true | (a[i] & ~a[nwords+i] & b[i] & ~b[nwords+i])
+
+    return arr
 
+cdef uint64_t[::1] or_vector_scalar(unsigned count, const uint64_t* a, signed char b):
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] arr = mem.uint64_alloc(2*nwords)
+    cdef uint64_t* dst = planes_data(arr)
+    cdef uint64_t b_true = ~<uint64_t>0 if b > 0 else 0
+    cdef uint64_t b_false = ~<uint64_t>0 if b < 0 else 0
+    cdef Py_ssize_t i
+    cdef uint64_t true
+
+    with nogil:
+        for i in prange(nwords, num_threads=parallel_threads(count), schedule="static"):
+            true = a[nwords+i] | b_true
+            dst[nwords+i] = true
+            dst[i] = true | (a[i] & ~a[nwords+i] & b_false)
+
+    planes_clear_padding(arr, count)
     return arr
 
+# ----------------------------------------------------------------------
+# Bitplane slicing
+# ----------------------------------------------------------------------
+cdef inline uint64_t planes_load_bits(const uint64_t* plane, Py_ssize_t nwords, Py_ssize_t pos) nogil:
+    """
+    Return the 64 bits of `plane` starting at bit `pos`, which may be negative.
+    Bits outside the plane are read as zero.
+    """
+    cdef Py_ssize_t q = pos >> 6
+    cdef int r = pos & 63
+    cdef uint64_t lo = plane[q] if 0 <= q < nwords else 0
+    if r == 0:
+        return lo
+
+    cdef uint64_t hi = plane[q+1] if 0 <= q+1 < nwords else 0
+    return (lo >> r) | (hi << (64 - r))
+
+cdef void planes_clear_padding(uint64_t[::1] planes, Py_ssize_t count):
+    """
+    Clear the padding bits in the last word of both planes.
+    """
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t* data = planes_data(planes)
+    if nwords > 0:
+        data[nwords-1] &= planes_tail_mask(count)
+        data[2*nwords-1] &= planes_tail_mask(count)
+
+cdef uint64_t[::1] planes_window(uint64_t[::1] planes, Py_ssize_t length, Py_ssize_t offset, Py_ssize_t count):
+    """
+    Return the bitplanes of `count` rows starting at row `offset` of a column of
+    `length` rows. Rows outside the column are None.
+    """
+    cdef Py_ssize_t src_words = planes_words(length)
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] result = mem.uint64_alloc(2*nwords)
+    cdef const uint64_t* src = planes_data(planes)
+    cdef uint64_t* dst = planes_data(result)
+    cdef Py_ssize_t w
+
+    with nogil:
+        for w in range(nwords):
+            dst[w] = planes_load_bits(src, src_words, offset + 64*w)
+            dst[nwords+w] = planes_load_bits(src + src_words, src_words, offset + 64*w)
+
+    planes_clear_padding(result, count)
+    return result
+
+cdef uint64_t[::1] planes_remap(uint64_t[::1] planes, Py_ssize_t length, unsigned count, const unsigned* mapping):
+    """
+    Bitplane counterpart of `remap_values()`.
+    """
+    cdef Py_ssize_t src_words = planes_words(length)
+    cdef Py_ssize_t nwords = planes_words(count)
+    cdef uint64_t[::1] result = mem.uint64_alloc(2*nwords)
+    cdef const uint64_t* src = planes_data(planes)
+    cdef uint64_t* dst = planes_data(result)
+    cdef Py_ssize_t w, i, end
+    cdef unsigned idx
+    cdef uint64_t k, v
+    cdef unsigned MISSING=-1
+
+    with nogil:
+        for w in prange(nwords, num_threads=parallel_threads(count), schedule="static"):
+            k = 0
+            v = 0
+            end = min(<Py_ssize_t>count, 64*w + 64)
+            for i in range(64*w, end):
+                idx = mapping[i]
+                if idx != MISSING:
+                    k = k | ((src[idx >> 6] >> (idx & 63)) & 1) << (i & 63)
+                    v = v | ((src[src_words + (idx >> 6)] >> (idx & 63)) & 1) << (i & 63)
+            dst[w] = k
+            dst[nwords+w] = v
+
+    return result
+
 # ----------------------------------------------------------------------
 # Column remapping
 # ----------------------------------------------------------------------
 ctypedef fused integral_column_t:
     signed char
     double
+    float
+    int32_t
+    int64_t
 
 cdef integral_column_t[::1] remap_values(integral_column_t *values, unsigned count, const unsigned* mapping):
     """
-    Remap an array of double using the indices provided in `mapping`.
+    Remap an array of values using the indices provided in `mapping`.
+
+    The result array is newly allocated here and returned as a Cython `array.array`.
+
+    Low-level function.
+    """
+    cdef integral_column_t[::1] result
+    cdef integral_column_t undefined
+
+    if integral_column_t is double:
+        result = mem.double_alloc(count)
+        undefined = NaN
+    elif integral_column_t is float:
+        result = mem.float_alloc(count)
+        undefined = NaN
+    elif integral_column_t is int64_t:
+        result = mem.int64_alloc(count)
+        undefined = INT64_MIN
+    elif integral_column_t is int32_t:
+        result = mem.int32_alloc(count)
+        undefined = -1
+    else:
+        result = mem.schar_alloc(count)
+        undefined = 0
+
+    cdef integral_column_t *dst = &result[0]
+    cdef Py_ssize_t i
+    cdef unsigned idx
+    cdef unsigned MISSING=-1
+    # XXX Above:
+    # replace by a global constant when it will be properly supported by Cython
+
+    with nogil:
+        for i in prange(count, num_threads=parallel_threads(count), schedule="static"):
+            idx = mapping[i]
+            dst[i] = values[idx] if idx != MISSING else undefined
+
+    return result
+
+# ----------------------------------------------------------------------
+# Column shifting
+# ----------------------------------------------------------------------
+cdef integral_column_t[::1] shift_values(integral_column_t *values, unsigned count, int offset):
+    """
+    Shift an array of values by `offset` positions, padding with the undefined value.
 
     The result array is newly allocated here and returned as a Cython `array.array`.
 
@@ -418,51 +1346,1215 @@ cdef integral_column_t[::1] remap_values(integral_column_t *values, unsigned cou
     if integral_column_t is double:
         result = mem.double_alloc(count)
         undefined = NaN
+    elif integral_column_t is float:
+        result = mem.float_alloc(count)
+        undefined = NaN
+    elif integral_column_t is int64_t:
+        result = mem.int64_alloc(count)
+        undefined = INT64_MIN
+    elif integral_column_t is int32_t:
+        result = mem.int32_alloc(count)
+        undefined = -1
     else:
         result = mem.schar_alloc(count)
         undefined = 0
 
-    cdef integral_column_t *dst = &result[0]
-    cdef unsigned i
-    cdef unsigned idx
-    cdef unsigned MISSING=-1
-    # XXX Above:
-    # replace by a global constant when it will be properly supported by Cython
+    cdef integral_column_t *dst = &result[0]
+    cdef unsigned i
+    cdef unsigned n = abs(offset)
+    if n > count:
+        n = count
+
+    with nogil:
+        if offset >= 0:
+            for i in range(count-n):
+                dst[i] = values[i+n]
+            for i in range(count-n, count):
+                dst[i] = undefined
+        else:
+            for i in range(n):
+                dst[i] = undefined
+            for i in range(n, count):
+                dst[i] = values[i-n]
+
+    return result
+
+
+# ----------------------------------------------------------------------
+# Run-length encoding
+# ----------------------------------------------------------------------
+cdef class Runs:
+    """
+    Run-length encoded values.
+
+    The k-th run holds `values[k]` for the rows in [ends[k-1], ends[k]). A
+    constant column is stored as a single run.
+    """
+    cdef unsigned[::1]  ends
+    cdef Tuple          values
+
+    def __len__(self):
+        return self.ends.shape[0]
+
+cdef Runs runs_create(Tuple values, unsigned[::1] ends):
+    cdef Runs runs = Runs.__new__(Runs)
+    runs.values = values
+    runs.ends = ends
+
+    return runs
+
+cdef Runs runs_constant(unsigned count, object value):
+    return runs_create(Tuple.from_constant(1, value), ualloc(1, count))
+
+cdef Runs runs_from_lists(list values, list ends):
+    cdef unsigned n = len(ends)
+    cdef unsigned[::1] arr = ualloc(n)
+    cdef unsigned k
+    for k in range(n):
+        arr[k] = ends[k]
+
+    return runs_create(Tuple.from_sequence(values), arr)
+
+cdef inline unsigned runs_find(const unsigned* ends, unsigned n, unsigned row) nogil:
+    """
+    Return the index of the run containing `row`.
+    """
+    cdef unsigned lo = 0
+    cdef unsigned hi = n
+    cdef unsigned mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ends[mid] <= row:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+cdef inline bint is_constant(Column column):
+    return column._runs is not None and len(column._runs) == 1
+
+cdef object runs_get_item(Runs runs, unsigned row):
+    return runs.values.get_item(runs_find(&runs.ends[0], runs.ends.shape[0], row))
+
+cdef Runs runs_slice(Runs runs, unsigned start, unsigned stop):
+    """
+    Return the runs covering the rows in [start, stop).
+    """
+    if stop <= start:
+        return runs_create(Tuple.from_sequence(()), ualloc(0))
+
+    cdef unsigned n = runs.ends.shape[0]
+    cdef unsigned first = runs_find(&runs.ends[0], n, start)
+    cdef unsigned last = runs_find(&runs.ends[0], n, stop-1)
+    cdef unsigned[::1] ends = ualloc(last-first+1)
+    cdef unsigned k
+    for k in range(first, last+1):
+        ends[k-first] = (runs.ends[k] if runs.ends[k] < stop else stop) - start
+
+    return runs_create(runs.values.slice(first, last+1), ends)
+
+cdef Runs runs_shift(Runs runs, unsigned count, int offset):
+    """
+    Shift the runs by `offset` positions, padding with None.
+    """
+    cdef unsigned n = abs(offset)
+    if n > count:
+        n = count
+
+    cdef Runs body = runs_slice(runs, n, count) if offset >= 0 else runs_slice(runs, 0, count-n)
+    values = list(body.values)
+    ends = list(body.ends)
+    if offset >= 0:
+        values.append(None)
+        ends.append(count)
+    else:
+        values.insert(0, None)
+        ends = [ n ] + [ end + n for end in ends ]
+
+    return runs_from_lists(values, ends)
+
+cdef Runs runs_remap(Runs runs, unsigned count, const unsigned* mapping):
+    """
+    Remap the runs using the indices provided in `mapping`.
+
+    Consecutive rows picked from the same run produce a single run.
+    """
+    cdef const unsigned* src_ends = &runs.ends[0] if runs.ends.shape[0] else NULL
+    cdef unsigned nruns = runs.ends.shape[0]
+    cdef unsigned MISSING=-1
+    cdef unsigned i, idx, k
+    cdef unsigned current = MISSING - 1 # Neither a run index nor MISSING
+    values = []
+    ends = []
+
+    for i in range(count):
+        idx = mapping[i]
+        k = runs_find(src_ends, nruns, idx) if idx != MISSING else MISSING
+        if k != current:
+            if i:
+                ends.append(i)
+            values.append(runs.values.get_item(k) if k != MISSING else None)
+            current = k
+    if count:
+        ends.append(count)
+
+    return runs_from_lists(values, ends)
+
+cdef integral_column_t[::1] expand_runs(Runs runs, integral_column_t[::1] values, unsigned count):
+    """
+    Expand the run-length encoded `values` into an array of `count` items.
+
+    `values` holds one item per run.
+    """
+    cdef integral_column_t[::1] result
+
+    if integral_column_t is double:
+        result = mem.double_alloc(count)
+    elif integral_column_t is float:
+        result = mem.float_alloc(count)
+    elif integral_column_t is int64_t:
+        result = mem.int64_alloc(count)
+    elif integral_column_t is int32_t:
+        result = mem.int32_alloc(count)
+    else:
+        result = mem.schar_alloc(count)
+
+    cdef unsigned i = 0
+    cdef unsigned k, end
+    cdef integral_column_t value
+    for k in range(runs.ends.shape[0]):
+        end = runs.ends[k]
+        value = values[k]
+        while i < end:
+            result[i] = value
+            i += 1
+
+    return result
+
+cdef Tuple expand_runs_py(Runs runs, unsigned count):
+    cdef unsigned[::1] mapping = ualloc(count)
+    cdef unsigned i = 0
+    cdef unsigned k, end
+    for k in range(runs.ends.shape[0]):
+        end = runs.ends[k]
+        while i < end:
+            mapping[i] = k
+            i += 1
+
+    return runs.values.remap(count, &mapping[0] if count else NULL)
+
+# ----------------------------------------------------------------------
+# Sparse values
+# ----------------------------------------------------------------------
+cdef class Sparse:
+    """
+    Sparse values, for columns holding mostly None.
+
+    Row `rows[k]` holds `values[k]`, and the other rows are None. Rows are
+    strictly ascending. `values` is a regular (dense) column, so the non-None
+    values keep their native representation.
+    """
+    cdef unsigned[::1]  rows
+    cdef Column         values
+
+    def __len__(self):
+        return self.rows.shape[0]
+
+cdef Sparse sparse_create(unsigned[::1] rows, Column values):
+    cdef Sparse sparse = Sparse.__new__(Sparse)
+    sparse.rows = rows
+    sparse.values = values
+
+    return sparse
+
+cdef inline unsigned sparse_find(const unsigned* rows, unsigned n, unsigned row) nogil:
+    """
+    Return the index of the first entry at or after `row`.
+    """
+    cdef unsigned lo = 0
+    cdef unsigned hi = n
+    cdef unsigned mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if rows[mid] < row:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    return lo
+
+cdef inline const unsigned* sparse_rows(Sparse sparse):
+    return &sparse.rows[0] if sparse.rows.shape[0] else NULL
+
+cdef object sparse_get_item(Sparse sparse, unsigned row):
+    cdef unsigned n = sparse.rows.shape[0]
+    cdef unsigned k = sparse_find(sparse_rows(sparse), n, row)
+
+    return sparse.values[k] if k < n and sparse.rows[k] == row else None
+
+cdef Sparse sparse_slice(Sparse sparse, unsigned start, unsigned stop, long offset=0):
+    """
+    Return the entries in [start, stop), moved to `row - start + offset`.
+    """
+    if stop <= start:
+        return sparse_create(ualloc(0), sparse.values[0:0])
+
+    cdef unsigned n = sparse.rows.shape[0]
+    cdef unsigned first = sparse_find(sparse_rows(sparse), n, start)
+    cdef unsigned last = sparse_find(sparse_rows(sparse), n, stop)
+    cdef unsigned[::1] rows = ualloc(last-first)
+    cdef unsigned k
+    for k in range(first, last):
+        rows[k-first] = sparse.rows[k] - start + offset
+
+    return sparse_create(rows, sparse.values[first:last])
+
+cdef Sparse sparse_shift(Sparse sparse, unsigned count, int offset):
+    """
+    Shift the entries by `offset` positions. Entries moved out of the column
+    are dropped.
+    """
+    cdef unsigned n = abs(offset)
+    if n > count:
+        n = count
+
+    if offset >= 0:
+        return sparse_slice(sparse, n, count)
+    else:
+        return sparse_slice(sparse, 0, count-n, n)
+
+cdef unsigned[::1] sparse_positions(Sparse sparse, unsigned count, const unsigned* rows):
+    """
+    Return the index of the entry at each row of `rows`, or MISSING if there is none.
+    """
+    cdef unsigned[::1] result = ualloc(count)
+    cdef unsigned n = sparse.rows.shape[0]
+    cdef const unsigned* src = sparse_rows(sparse)
+    cdef unsigned MISSING=-1
+    cdef unsigned i, k
+
+    for i in range(count):
+        k = sparse_find(src, n, rows[i]) if rows[i] != MISSING else n
+        result[i] = k if k < n and src[k] == rows[i] else MISSING
+
+    return result
+
+cdef Sparse sparse_remap(Sparse sparse, unsigned count, const unsigned* mapping):
+    """
+    Remap the entries using the indices provided in `mapping`.
+
+    Only the rows picking an entry are stored.
+    """
+    cdef unsigned[::1] positions = sparse_positions(sparse, count, mapping)
+    cdef unsigned MISSING=-1
+    cdef unsigned i
+    cdef unsigned m = 0
+    for i in range(count):
+        if positions[i] != MISSING:
+            m += 1
+
+    cdef unsigned[::1] rows = ualloc(m)
+    cdef unsigned[::1] picks = ualloc(m)
+    m = 0
+    for i in range(count):
+        if positions[i] != MISSING:
+            rows[m] = i
+            picks[m] = positions[i]
+            m += 1
+
+    return sparse_create(rows, sparse.values.c_remap(m, &picks[0] if m else NULL))
+
+cdef unsigned[::1] rows_merge(Sparse a, Sparse b, bint union):
+    """
+    Return the union, or the intersection, of the rows of `a` and `b`.
+    """
+    cdef unsigned na = a.rows.shape[0]
+    cdef unsigned nb = b.rows.shape[0]
+    cdef unsigned[::1] result = ualloc(na + nb if union else min(na, nb))
+    cdef unsigned i = 0
+    cdef unsigned j = 0
+    cdef unsigned m = 0
+    while i < na and j < nb:
+        if a.rows[i] == b.rows[j]:
+            result[m] = a.rows[i]
+            i += 1
+            j += 1
+            m += 1
+        elif a.rows[i] < b.rows[j]:
+            if union:
+                result[m] = a.rows[i]
+                m += 1
+            i += 1
+        else:
+            if union:
+                result[m] = b.rows[j]
+                m += 1
+            j += 1
+    if union:
+        while i < na:
+            result[m] = a.rows[i]
+            i += 1
+            m += 1
+        while j < nb:
+            result[m] = b.rows[j]
+            j += 1
+            m += 1
+
+    return result[:m]
+
+cdef Column sparse_values_at(Column column, unsigned[::1] rows):
+    """
+    Return the values of `column` at `rows` as a dense column.
+    """
+    cdef unsigned count = rows.shape[0]
+    cdef const unsigned* mapping = &rows[0] if count else NULL
+    cdef unsigned[::1] positions
+    if column._sparse is not None:
+        positions = sparse_positions(<Sparse>column._sparse, count, mapping)
+        return (<Sparse>column._sparse).values.c_remap(count, &positions[0] if count else NULL)
+
+    return column.c_remap(count, mapping)
+
+cdef integral_column_t[::1] expand_sparse(Sparse sparse, integral_column_t[::1] values, unsigned count):
+    """
+    Expand the sparse `values` into an array of `count` items, padding with the undefined value.
+
+    `values` holds one item per entry.
+    """
+    cdef integral_column_t[::1] result
+    cdef integral_column_t undefined
+
+    if integral_column_t is double:
+        result = mem.double_alloc(count)
+        undefined = NaN
+    elif integral_column_t is float:
+        result = mem.float_alloc(count)
+        undefined = NaN
+    elif integral_column_t is int64_t:
+        result = mem.int64_alloc(count)
+        undefined = INT64_MIN
+    elif integral_column_t is int32_t:
+        result = mem.int32_alloc(count)
+        undefined = -1
+    else:
+        result = mem.schar_alloc(count)
+        undefined = 0
+
+    cdef unsigned i, k
+    for i in range(count):
+        result[i] = undefined
+    for k in range(sparse.rows.shape[0]):
+        result[sparse.rows[k]] = values[k]
+
+    return result
+
+cdef Tuple expand_sparse_py(Sparse sparse, unsigned count):
+    cdef unsigned MISSING=-1
+    cdef unsigned[::1] mapping = ualloc(count, MISSING)
+    cdef unsigned k
+    for k in range(sparse.rows.shape[0]):
+        mapping[sparse.rows[k]] = k
+
+    return sparse.values.get_py_values().remap(count, &mapping[0] if count else NULL)
+
+# ----------------------------------------------------------------------
+# Strided views
+# ----------------------------------------------------------------------
+cdef class Strided:
+    """
+    A zero-copy view of every `step`-th row of `base`, starting at row `start`.
+
+    Views of views are composed, so `base` is never a view itself.
+    """
+    cdef Column         base
+    cdef unsigned       start
+    cdef unsigned       step
+
+cdef Strided strided_create(Column base, unsigned start, unsigned step):
+    cdef Strided view = Strided.__new__(Strided)
+    view.base = base
+    view.start = start
+    view.step = step
+
+    return view
+
+cdef unsigned[::1] strided_mapping(Strided view, unsigned count, const unsigned* mapping):
+    """
+    Return the rows of the base column picked by `mapping`, or by the view itself
+    if `mapping` is NULL.
+    """
+    cdef unsigned[::1] result = ualloc(count)
+    cdef unsigned MISSING=-1
+    cdef unsigned i, idx
+    for i in range(count):
+        idx = mapping[i] if mapping != NULL else i
+        result[i] = view.start + idx*view.step if idx != MISSING else MISSING
+
+    return result
+
+cdef integral_column_t[::1] strided_values(integral_column_t *values, unsigned start, unsigned step, unsigned count):
+    """
+    Gather every `step`-th item of `values`, starting at `start`.
+
+    Low-level function.
+    """
+    cdef integral_column_t[::1] result
+
+    if integral_column_t is double:
+        result = mem.double_alloc(count)
+    elif integral_column_t is float:
+        result = mem.float_alloc(count)
+    elif integral_column_t is int64_t:
+        result = mem.int64_alloc(count)
+    elif integral_column_t is int32_t:
+        result = mem.int32_alloc(count)
+    else:
+        result = mem.schar_alloc(count)
+
+    cdef integral_column_t *dst = <integral_column_t*>mv_data(result)
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in prange(count, num_threads=parallel_threads(count), schedule="static"):
+            dst[i] = values[start + i*step]
+
+    return result
+
+# ----------------------------------------------------------------------
+# Deferred selections
+# ----------------------------------------------------------------------
+cdef class Selection:
+    """
+    The rows of `base` listed in `rows`, gathered when the column is first used.
+
+    The columns filtered together share the same `rows` array.
+    """
+    cdef Column         base
+    cdef unsigned[::1]  rows
+
+cdef Selection selection_create(Column base, unsigned[::1] rows):
+    cdef Selection selection = Selection.__new__(Selection)
+    selection.base = base
+    selection.rows = rows
+
+    return selection
+
+cdef int gather(Column column) except -1:
+    """
+    Resolve the pending selection of `column`, gathering the rows of its base
+    straight into its own representations.
+    """
+    cdef Selection selection = <Selection>column._selection
+    cdef unsigned count = column.length
+    column._selection = None
+    remap_into(column, selection.base, count, &selection.rows[0] if count else NULL)
+
+    return 0
+
+cdef int remap_into(Column result, Column src, unsigned count, const unsigned* mapping) except -1:
+    """
+    Store in `result` the representations of `src` with values picked from the
+    indices specified in `mapping`.
+
+    No column is created, so this is safe to call from an accessor. The
+    representations cached by `src` are registered as cached by `result` too,
+    except the decoded values of a compressed column, which become primary.
+    """
+    if is_lazy(src):
+        materialize(src)
+    decompress(src)
+
+    if src._runs is not None:
+        result._runs = runs_remap(src._runs, count, mapping)
+        return 0
+    if src._sparse is not None:
+        result._sparse = sparse_remap(src._sparse, count, mapping)
+        return 0
+    cdef unsigned[::1] rows
+    if src._strided is not None:
+        rows = strided_mapping(src._strided, count, mapping)
+        return remap_into(result, (<Strided>src._strided).base, count, &rows[0] if count else NULL)
+
+    cdef unsigned char derived = src._derived if src._packed is None else 0
+    if src._f_values is not None:
+        result._f_values = remap_values[double](&src._f_values[0], count, mapping)
+        if derived & REPR_F:
+            cache_register(result, REPR_F, count*sizeof(double))
+    if src._s_values is not None:
+        result._s_values = remap_values[float](<float*>mv_data(src._s_values), count, mapping)
+    if src._t_values is not None:
+        result._t_values = remap_values[schar](&src._t_values[0], count, mapping)
+        if derived & REPR_T:
+            cache_register(result, REPR_T, count*sizeof(signed char))
+    if src._b_planes is not None:
+        result._b_planes = planes_remap(src._b_planes, src.length, count, mapping)
+        if derived & REPR_B:
+            cache_register(result, REPR_B, result._b_planes.shape[0]*sizeof(uint64_t))
+    if src._i_values is not None:
+        result._i_values = remap_values[int64_t](&src._i_values[0], count, mapping)
+        if derived & REPR_I:
+            cache_register(result, REPR_I, count*sizeof(int64_t))
+    if src._c_codes is not None:
+        result._c_codes = remap_values[int32_t](<int32_t*>mv_data(src._c_codes), count, mapping)
+        result._categories = src._categories
+    if src._py_values is not None:
+        result._py_values = src._py_values.remap(count, mapping)
+        if derived & REPR_PY:
+            cache_register(result, REPR_PY, tuple_nbytes(result._py_values, True))
+
+    return 0
+
+# ----------------------------------------------------------------------
+# Compressed columns
+# ----------------------------------------------------------------------
+cdef dict PACK_ENCODINGS = {
+    "delta": packing.PACK_DELTA,
+    "xor": packing.PACK_XOR,
+    "rle": packing.PACK_RLE,
+}
+
+cdef class Packed:
+    """
+    Compressed 64-bit values: integers (INT64_MIN is None) or doubles.
+
+    The values are decoded into a cached native representation when a kernel
+    requires them.
+    """
+    cdef bytes          data
+    cdef int            encoding    # One of the `packing.PACK_...` constants
+    cdef bint           is_float
+
+    def __len__(self):
+        return len(self.data)
+
+cdef Packed packed_create(int encoding, bint is_float, const void* values, unsigned count):
+    cdef Packed packed = Packed.__new__(Packed)
+    packed.data = packing.pack(encoding, values, count)
+    packed.encoding = encoding
+    packed.is_float = is_float
+
+    return packed
+
+cdef double[::1] f_values_from_packed(Packed packed, unsigned count):
+    cdef double[::1] result = mem.double_alloc(count)
+    packing.unpack(packed.encoding, packed.data, mv_data(result), count)
+
+    return result
+
+cdef int64_t[::1] i_values_from_packed(Packed packed, unsigned count):
+    cdef int64_t[::1] result = mem.int64_alloc(count)
+    packing.unpack(packed.encoding, packed.data, mv_data(result), count)
+
+    return result
+
+cdef int decompress(Column column) except -1:
+    """
+    Ensure a compressed column holds its decoded native representation.
+    """
+    cdef Packed packed = <Packed>column._packed
+    if packed is None:
+        return 0
+
+    if packed.is_float:
+        get_f_values(column)
+    else:
+        get_i_values(column)
+
+    return 0
+
+# ----------------------------------------------------------------------
+# Dictionary encoding
+# ----------------------------------------------------------------------
+cdef tuple categories_encode(Tuple values):
+    """
+    Encode `values` as a tuple `(categories, codes)`.
+
+    `categories` holds the distinct values in order of first appearance, and
+    `codes` the index of each value in `categories`. None is encoded as -1.
+    Values are distinct if their types differ, even when they compare equal
+    (like 1, 1.0 and True).
+    Raise TypeError if a value is not hashable.
+    """
+    cdef unsigned n = len(values)
+    cdef int32_t[::1] codes = mem.int32_alloc(n)
+    cdef dict index = {}
+    cdef list categories = []
+    cdef unsigned i
+    for i in range(n):
+        value = values.get_item(i)
+        if value is None:
+            codes[i] = -1
+            continue
+
+        key = (type(value), value)
+        code = index.get(key)
+        if code is None:
+            code = index[key] = len(categories)
+            categories.append(value)
+        codes[i] = code
+
+    return Tuple.from_sequence(categories), codes
+
+cdef inline unsigned* codes_as_mapping(int32_t[::1] codes):
+    """
+    Reinterpret an array of codes as a mapping for `remap_values()` or `Tuple.remap()`.
+
+    This is a zero-copy operation: the code -1 (None) is the MISSING index.
+    """
+    return <unsigned*>mv_data(codes)
+
+cdef double[::1] get_f_values(Column self):
+    """
+    Return the content of the column as an array of floats.
+    """
+    if is_lazy(self):
+        materialize(self)
+
+    if self._f_values is not None:
+        cache_touch(self, REPR_F)
+        return self._f_values
+
+    cdef double[::1] categories
+    cdef Strided view = <Strided>self._strided
+    if view is not None:
+        self._f_values = strided_values[double](
+                <double*>mv_data(get_f_values(view.base)), view.start, view.step, self.length
+        )
+    elif self._packed is not None:
+        if (<Packed>self._packed).is_float:
+            self._f_values = f_values_from_packed(self._packed, self.length)
+        else:
+            self._f_values = f_values_from_i_values(get_i_values(self))
+    elif self._s_values is not None:
+        self._f_values = f_values_from_s_values(self._s_values)
+    elif self._i_values is not None:
+        self._f_values = f_values_from_i_values(self._i_values)
+    elif self._c_codes is not None:
+        categories = f_values_from_py_values(self._categories)
+        self._f_values = remap_values[double](
+                <double*>mv_data(categories), self.length, codes_as_mapping(self._c_codes)
+        )
+    elif self._runs is not None:
+        self._f_values = expand_runs[double](
+                self._runs,
+                f_values_from_py_values((<Runs>self._runs).values),
+                self.length
+        )
+    elif self._sparse is not None:
+        self._f_values = expand_sparse[double](
+                self._sparse,
+                get_f_values((<Sparse>self._sparse).values),
+                self.length
+        )
+    else:
+        # Not cached and no direct conversion implemented. Fallback to the slow path.
+        if self._py_values is None:
+            self.get_py_values()
+
+        self._f_values = f_values_from_py_values(self._py_values)
+
+    cache_register(self, REPR_F, self._f_values.shape[0]*sizeof(double))
+    return self._f_values
+
+cdef signed char[::1] get_t_values(Column self):
+    """
+    Return the content of the column as an array of ternary values.
+    """
+    if is_lazy(self):
+        materialize(self)
+
+    if self._t_values is not None:
+        cache_touch(self, REPR_T)
+        return self._t_values
+
+    cdef signed char[::1] categories
+    cdef Strided view = <Strided>self._strided
+    if view is not None:
+        self._t_values = strided_values[schar](
+                <signed char*>mv_data(get_t_values(view.base)), view.start, view.step, self.length
+        )
+    elif self._b_planes is not None:
+        self._t_values = t_values_from_b_planes(self._b_planes, self.length)
+    elif self._packed is not None and not (<Packed>self._packed).is_float:
+        self._t_values = t_values_from_i_values(get_i_values(self))
+    elif self._i_values is not None:
+        self._t_values = t_values_from_i_values(self._i_values)
+    elif self._c_codes is not None:
+        categories = t_values_from_py_values(self._categories)
+        self._t_values = remap_values[schar](
+                <signed char*>mv_data(categories), self.length, codes_as_mapping(self._c_codes)
+        )
+    elif self._runs is not None:
+        self._t_values = expand_runs[schar](
+                self._runs,
+                t_values_from_py_values((<Runs>self._runs).values),
+                self.length
+        )
+    elif self._sparse is not None:
+        self._t_values = expand_sparse[schar](
+                self._sparse,
+                get_t_values((<Sparse>self._sparse).values),
+                self.length
+        )
+    else:
+        # Not cached and no direct conversion implemented. Fallback to the slow path.
+        if self._py_values is None:
+            self.get_py_values()
+
+        self._t_values = t_values_from_py_values(self._py_values)
+
+    cache_register(self, REPR_T, self._t_values.shape[0]*sizeof(signed char))
+    return self._t_values
+
+cdef uint64_t[::1] get_b_planes(Column self):
+    """
+    Return the content of the column as a pair of ternary bitplanes.
+    """
+    if is_lazy(self):
+        materialize(self)
+
+    if self._b_planes is not None:
+        cache_touch(self, REPR_B)
+        return self._b_planes
+
+    self._b_planes = b_planes_from_t_values(get_t_values(self))
+
+    cache_register(self, REPR_B, self._b_planes.shape[0]*sizeof(uint64_t))
+    return self._b_planes
+
+cdef int64_t[::1] get_i_values(Column self):
+    """
+    Return the content of the column as an array of 64-bit integers.
+    """
+    if is_lazy(self):
+        materialize(self)
+
+    if self._i_values is not None:
+        cache_touch(self, REPR_I)
+        return self._i_values
+
+    cdef Tuple run_values
+    cdef int64_t[::1] categories
+    cdef Strided view = <Strided>self._strided
+    if view is not None:
+        self._i_values = strided_values[int64_t](
+                <int64_t*>mv_data(get_i_values(view.base)), view.start, view.step, self.length
+        )
+    elif self._packed is not None:
+        if (<Packed>self._packed).is_float:
+            self._i_values = i_values_from_f_values(get_f_values(self))
+        else:
+            self._i_values = i_values_from_packed(self._packed, self.length)
+    elif self._f_values is not None:
+        self._i_values = i_values_from_f_values(self._f_values)
+    elif self._s_values is not None:
+        self._i_values = i_values_from_f_values(f_values_from_s_values(self._s_values))
+    elif self._c_codes is not None:
+        categories = (
+                i_values_from_dates(self._categories, self._type)
+                    if isinstance(self._type, coltypes.DateTimeBase)
+                    else i_values_from_py_values(self._categories)
+        )
+        self._i_values = remap_values[int64_t](
+                <int64_t*>mv_data(categories), self.length, codes_as_mapping(self._c_codes)
+        )
+    elif self._runs is not None:
+        run_values = (<Runs>self._runs).values
+        self._i_values = expand_runs[int64_t](
+                self._runs,
+                i_values_from_dates(run_values, self._type)
+                    if isinstance(self._type, coltypes.DateTimeBase)
+                    else i_values_from_py_values(run_values),
+                self.length
+        )
+    elif self._sparse is not None:
+        self._i_values = expand_sparse[int64_t](
+                self._sparse,
+                get_i_values((<Sparse>self._sparse).values),
+                self.length
+        )
+    else:
+        # Not cached and no direct conversion implemented. Fallback to the slow path.
+        if self._py_values is None:
+            self.get_py_values()
+
+        if isinstance(self._type, coltypes.DateTimeBase):
+            self._i_values = i_values_from_dates(self._py_values, self._type)
+        else:
+            self._i_values = i_values_from_py_values(self._py_values)
+
+    cache_register(self, REPR_I, self._i_values.shape[0]*sizeof(int64_t))
+    return self._i_values
+
+# ======================================================================
+# Column statistics
+# ======================================================================
+cdef class ColumnStats:
+    """
+    Statistics computed in one pass over a column's values.
+
+    Null values (None or NaN) are ignored, except for `null_count` and
+    `ascending`.
+    """
+    def __repr__(self):
+        return (
+            f"ColumnStats(min={self.min!r}, max={self.max!r}, null_count={self.null_count}, "
+            f"ascending={self.ascending}, sum={self.sum!r})"
+        )
+
+cdef ColumnStats stats_from_f_values(double[::1] arr, py_values=None):
+    """
+    Compute the statistics of an array of floats.
+
+    If `py_values` is given, the minimum and maximum are taken from these objects
+    rather than from the array.
+    """
+    cdef ColumnStats stats = ColumnStats.__new__(ColumnStats)
+    cdef unsigned n = arr.shape[0]
+    cdef const double* values = <const double*>mv_data(arr)
+    cdef unsigned null_count = 0
+    cdef bint ascending = True
+    cdef double lo = INFINITY
+    cdef double hi = -INFINITY
+    cdef unsigned lo_row = 0
+    cdef unsigned hi_row = 0
+    cdef double acc = 0.0
+    cdef double value
+    cdef unsigned i
+
+    for i in range(n):
+        value = values[i]
+        if isnan(value):
+            null_count += 1
+            ascending = False
+            continue
+        if i and not value > values[i-1]:
+            ascending = False
+        if value < lo:
+            lo = value
+            lo_row = i
+        if value > hi:
+            hi = value
+            hi_row = i
+        acc += value
+
+    if null_count < n:
+        if py_values is None:
+            stats.min = lo
+            stats.max = hi
+        else:
+            stats.min = py_values[lo_row]
+            stats.max = py_values[hi_row]
+    stats.null_count = null_count
+    stats.ascending = ascending
+    stats.sum = acc
+
+    return stats
+
+cdef ColumnStats stats_from_i_values(int64_t[::1] arr, object coltype):
+    cdef ColumnStats stats = ColumnStats.__new__(ColumnStats)
+    cdef unsigned n = arr.shape[0]
+    cdef const int64_t* values = <const int64_t*>mv_data(arr)
+    cdef unsigned null_count = 0
+    cdef bint ascending = True
+    cdef bint overflow = False
+    cdef int64_t lo = INT64_MAX
+    cdef int64_t hi = INT64_MIN
+    cdef int64_t acc = 0
+    cdef int64_t value
+    cdef unsigned i
+
+    for i in range(n):
+        value = values[i]
+        if value == INT64_MIN:
+            null_count += 1
+            ascending = False
+            continue
+        if i and not value > values[i-1]:
+            ascending = False
+        if value < lo:
+            lo = value
+        if value > hi:
+            hi = value
+        if (value > 0 and acc > INT64_MAX - value) or (value < 0 and acc < INT64_MIN + 1 - value):
+            overflow = True
+        else:
+            acc += value
+
+    if null_count < n:
+        if isinstance(coltype, coltypes.DateTimeBase):
+            stats.min = coltype.from_epoch(lo)
+            stats.max = coltype.from_epoch(hi)
+        else:
+            stats.min = lo
+            stats.max = hi
+    stats.null_count = null_count
+    stats.ascending = ascending
+    if isinstance(coltype, coltypes.DateTimeBase):
+        stats.sum = None
+    elif overflow:
+        stats.sum = sum([ values[i] for i in range(n) if values[i] != INT64_MIN ])
+    else:
+        stats.sum = acc
+
+    return stats
+
+cdef ColumnStats stats_from_sparse(Sparse sparse, unsigned count):
+    """
+    Compute the statistics of sparse values from those of the stored entries.
+    """
+    cdef ColumnStats entries = sparse.values.get_stats()
+    cdef ColumnStats stats = ColumnStats.__new__(ColumnStats)
+    stats.min = entries.min
+    stats.max = entries.max
+    stats.null_count = entries.null_count + count - len(sparse)
+    stats.ascending = entries.ascending and len(sparse) == count
+    stats.sum = entries.sum
+
+    return stats
+
+cdef ColumnStats stats_from_objects(values, counts=None):
+    """
+    Compute the statistics of a sequence of Python objects.
+
+    If `counts` is given, `values[k]` is repeated `counts[k]` times.
+    """
+    cdef ColumnStats stats = ColumnStats.__new__(ColumnStats)
+    cdef unsigned null_count = 0
+    cdef bint ascending = True
+    if counts is None:
+        counts = itertools.repeat(1)
+
+    prev = lo = hi = None
+    acc = 0
+    cdef bint summable = True
+    for value, count in zip(values, counts):
+        if not count:
+            continue
+        if value is None:
+            null_count += count
+            ascending = False
+            continue
+        if count > 1:
+            ascending = False
+
+        if lo is None:
+            lo = hi = value
+        else:
+            try:
+                if ascending and not value > prev:
+                    ascending = False
+                if value < lo:
+                    lo = value
+                if value > hi:
+                    hi = value
+            except TypeError:
+                ascending = False # Unordered values
+
+        if summable:
+            try:
+                acc = acc + value*count
+            except TypeError:
+                summable = False
+        prev = value
+
+    stats.min = lo
+    stats.max = hi
+    stats.null_count = null_count
+    stats.ascending = ascending
+    stats.sum = acc if summable else None
+
+    return stats
+
+# ======================================================================
+# Buffer protocol
+# ======================================================================
+ctypedef struct buffer_info_t:
+    PyObject*   base    # The exported memoryview, kept alive until the buffer is released
+    Py_ssize_t  shape
+    Py_ssize_t  stride
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void* mv_data(integral_column_t[::1] arr):
+    """
+    Return the address of the first item of `arr`. Valid for empty arrays too.
+    """
+    return &arr[0]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline uint64_t* planes_data(uint64_t[::1] arr):
+    """
+    Bitplane counterpart of `mv_data()`.
+    """
+    return &arr[0]
+
+cdef Column strided_slice(Column column, slice sl):
+    """
+    Return the rows of `column` selected by `sl`.
+
+    With a positive step, the result is a zero-copy view of the column's storage.
+    Run-length encoded, sparse and categorical columns keep their compact
+    representation instead, and negative steps are remapped.
+    """
+    start, stop, step = sl.indices(column.length)
+    cdef unsigned count = len(range(start, stop, step))
+    cdef Column result
+    cdef Strided view = <Strided>column._strided
+    if step > 0 and column._runs is None and column._sparse is None and column._c_codes is None:
+        result = new_column_with_meta(column, count)
+        if view is not None:
+            result._strided = strided_create(view.base, view.start + start*view.step, view.step*step)
+        else:
+            result._strided = strided_create(column, start, step)
 
-    for i in range(count):
-        idx = mapping[i]
-        dst[i] = values[idx] if idx != MISSING else undefined
+        return result
 
-    return result
+    cdef unsigned[::1] mapping = ualloc(count)
+    cdef unsigned i
+    for i in range(count):
+        mapping[i] = start + i*step
 
+    return column.c_remap(count, &mapping[0] if count else NULL)
 
-cdef double[::1] get_f_values(Column self):
+cdef int buffer_kind(Column column):
     """
-    Return the content of the column as an array of floats.
+    Return the representation exported through the buffer protocol.
+
+    Categorical and single-precision columns export their primary representation. Otherwise, the column's type takes
+    precedence, then an existing native representation is preferred over a
+    conversion.
     """
-    if self._f_values is not None:
-        return self._f_values
+    cdef object t = column._type
+    if column._c_codes is not None:
+        return REPR_C
+    if column._s_values is not None:
+        return REPR_S
+    if isinstance(t, (coltypes.Integer, coltypes.DateTimeBase)):
+        return REPR_I
+    if isinstance(t, coltypes.Ternary):
+        return REPR_T
+    if isinstance(t, coltypes.Float):
+        return REPR_F
+
+    if column._f_values is not None:
+        return REPR_F
+    if column._i_values is not None:
+        return REPR_I
+    if column._t_values is not None or column._b_planes is not None:
+        return REPR_T
+    if column._packed is not None and not (<Packed>column._packed).is_float:
+        return REPR_I
+
+    return REPR_F
 
-    # Not cached and no direct conversion implemented. Fallback to the slow path.
-    if self._py_values is None:
-        self.get_py_values()
+# ======================================================================
+# Pickling
+# ======================================================================
+# A pickled column holds its metadata and its primary representation only.
+# Native arrays are exported as `PickleBuffer` objects with protocol 5, so they
+# can be transferred out-of-band without copy.
+cdef object pickle_buffer(object arr, int protocol):
+    if protocol >= 5:
+        from pickle import PickleBuffer # Python 3.8+, like protocol 5
+        return PickleBuffer(arr)
 
-    self._f_values = f_values_from_py_values(self._py_values)
-    return self._f_values
+    return memoryview(arr).tobytes()
 
-cdef signed char[::1] get_t_values(Column self):
+cdef object unpickle_buffer(object buf, Py_ssize_t itemsize, char* fmt):
     """
-    Return the content of the column as an array of ternary values.
-    """
-    if self._t_values is not None:
-        return self._t_values
+    Return an array of items of format `fmt` over the content of `buf`.
 
-    # Not cached and no direct conversion implemented. Fallback to the slow path.
-    if self._py_values is None:
-        self.get_py_values()
+    Writable buffers are shared. Read-only ones (in-band data, or out-of-band
+    buffers the consumer cannot modify) are copied into a pooled block.
+    """
+    cdef Py_buffer view
+    cdef mem.Block block
+    PyObject_GetBuffer(buf, &view, PyBUF_SIMPLE)
+    try:
+        if view.len % itemsize:
+            raise ValueError(f"Buffer size {view.len} is not a multiple of {itemsize}")
+        if not view.readonly:
+            return memoryview(buf).cast("B").cast(fmt.decode())
+
+        block = mem.block_alloc(view.len // itemsize, itemsize, fmt)
+        memcpy(block.data, view.buf, view.len)
+        return block
+    finally:
+        PyBuffer_Release(&view)
+
+cdef tuple column_state(Column column, int protocol):
+    """
+    Return the kind and data of the primary representation of `column`.
+    """
+    cdef unsigned char derived = column._derived
+    cdef Packed packed
+    cdef unsigned[::1] rows
+    if column._strided is not None:
+        # Only the rows of the view are serialized, not its base
+        rows = strided_mapping(column._strided, column.length, NULL)
+        return column_state(
+                (<Strided>column._strided).base.c_remap(column.length, &rows[0] if column.length else NULL),
+                protocol
+        )
+    if column._packed is not None:
+        packed = <Packed>column._packed
+        return ("packed", packed.data, packed.encoding, packed.is_float)
+    if column._runs is not None:
+        return ("runs", (<Runs>column._runs).values, pickle_buffer((<Runs>column._runs).ends, protocol))
+    if column._sparse is not None:
+        return ("sparse", pickle_buffer((<Sparse>column._sparse).rows, protocol), (<Sparse>column._sparse).values)
+    if column._c_codes is not None:
+        return ("c", pickle_buffer(column._c_codes, protocol), column._categories)
+    if column._s_values is not None:
+        return ("s", pickle_buffer(column._s_values, protocol))
+    if column._i_values is not None and not derived & REPR_I:
+        return ("i", pickle_buffer(column._i_values, protocol))
+    if column._f_values is not None and not derived & REPR_F:
+        return ("f", pickle_buffer(column._f_values, protocol))
+    if column._b_planes is not None and not derived & REPR_B:
+        return ("b", pickle_buffer(column._b_planes, protocol))
+    if column._t_values is not None and not derived & REPR_T:
+        return ("t", pickle_buffer(column._t_values, protocol))
+
+    return ("py", column.get_py_values())
+
+def column_from_pickle(length, name, type, kind, *data):
+    """
+    Rebuild a pickled column. See `Column.__reduce_ex__()`.
+    """
+    cdef Column column = Column(name=name, type=type)
+    cdef Packed packed
+    column.length = length
+    if kind == "f":
+        column._f_values = unpickle_buffer(data[0], sizeof(double), b"d")
+    elif kind == "s":
+        column._s_values = unpickle_buffer(data[0], sizeof(float), b"f")
+    elif kind == "t":
+        column._t_values = unpickle_buffer(data[0], sizeof(signed char), b"b")
+    elif kind == "b":
+        column._b_planes = unpickle_buffer(data[0], sizeof(uint64_t), b"Q")
+    elif kind == "i":
+        column._i_values = unpickle_buffer(data[0], sizeof(int64_t), b"q")
+    elif kind == "c":
+        column._c_codes = unpickle_buffer(data[0], sizeof(int32_t), b"i")
+        column._categories = data[1]
+    elif kind == "runs":
+        column._runs = runs_create(data[0], unpickle_buffer(data[1], sizeof(unsigned), b"I"))
+    elif kind == "sparse":
+        column._sparse = sparse_create(unpickle_buffer(data[0], sizeof(unsigned), b"I"), data[1])
+    elif kind == "packed":
+        packed = Packed.__new__(Packed)
+        packed.data, packed.encoding, packed.is_float = data
+        column._packed = packed
+    elif kind == "py":
+        column._py_values = data[0]
+    else:
+        raise ValueError(f"Unknown column representation {kind!r}")
 
-    self._t_values = t_values_from_py_values(self._py_values)
-    return self._t_values
+    return column
 
 # ======================================================================
 # Column class
@@ -481,10 +2573,20 @@ cdef class Column:
     def __cinit__(self):
         global _id
 
+        if _budget >= 0:
+            cache_release()
+            if _cache_bytes > _budget and not _cache_holds:
+                cache_enforce()
+
         self._id = _id
         _id += 1
         self._t_values = None
+        self._b_planes = None
         self._f_values = None
+        self._s_values = None
+        self._i_values = None
+        self._c_codes = None
+        self._derived = 0
 
     def __init__(self, *, name=None, type=None):
         if name is not None:
@@ -506,7 +2608,62 @@ cdef class Column:
             name = str(k)
 
         cdef Column column = Column(name=name, **kwargs)
-        column._py_values = Tuple.from_constant(count, k)
+        column._runs = runs_constant(count, k)
+        column.length = count
+
+        return column
+
+    @staticmethod
+    def from_runs(values, counts, **kwargs):
+        """
+        Create a Column from run-length encoded values.
+
+        The column holds `counts[k]` copies of `values[k]` for each k. The runs are
+        expanded only if a kernel requires an array of values.
+        """
+        if len(values) != len(counts):
+            raise ValueError("Values and counts must have the same length")
+
+        ends = []
+        cdef unsigned end = 0
+        for count in counts:
+            if count < 0:
+                raise ValueError(f"Negative run length {count}")
+            end += count
+            ends.append(end)
+
+        cdef Column column = Column(**kwargs)
+        column._runs = runs_from_lists(list(values), ends)
+        column.length = end
+
+        return column
+
+    @staticmethod
+    def from_sparse(count, rows, values, **kwargs):
+        """
+        Create a Column of `count` rows holding `values[k]` at row `rows[k]`, and
+        None elsewhere.
+
+        `rows` must be strictly ascending. `values` is a sequence or a column.
+        Dense representations are only built if a kernel requires them.
+        """
+        if len(rows) != len(values):
+            raise ValueError("Rows and values must have the same length")
+
+        cdef unsigned n = len(rows)
+        cdef unsigned[::1] arr = ualloc(n)
+        cdef unsigned k
+        for k, row in enumerate(rows):
+            if not 0 <= row < count:
+                raise IndexError(f"Row {row} out of range")
+            if k and row <= arr[k-1]:
+                raise ValueError(f"Rows must be strictly ascending ({arr[k-1]}, {row})")
+            arr[k] = row
+
+        cdef Column column = Column(**kwargs)
+        if not isinstance(values, Column):
+            values = Column.from_sequence(values, type=column._type)
+        column._sparse = sparse_create(arr, values)
         column.length = count
 
         return column
@@ -516,6 +2673,11 @@ cdef class Column:
         """ Create a Column from a sequence of Python objects.
 
             This factory method delegates the actual conversion to the column's `_type` object.
+            Integer and date/time columns are stored natively as an array of 64-bit integers,
+            unless some values are out of range. Categorical columns are stored as an array
+            of codes into a dictionary of distinct values, unless some values are not hashable.
+            Float columns with the "float32" storage option are stored as an array of
+            single-precision floats.
         """
         cdef Column column = Column(**kwargs)
         column._py_values = Tuple.from_sequence(
@@ -523,6 +2685,60 @@ cdef class Column:
         )
         column.length = len(column._py_values)
 
+        if isinstance(column._type, coltypes.Integer):
+            try:
+                column._i_values = i_values_from_py_values(column._py_values)
+            except OverflowError:
+                pass # Keep the Python objects
+            else:
+                column._py_values = None
+        elif isinstance(column._type, coltypes.DateTimeBase):
+            try:
+                column._i_values = i_values_from_dates(column._py_values, column._type)
+            except (TypeError, ValueError):
+                pass # Keep the Python objects
+            else:
+                column._py_values = None
+        elif single_storage(column._type):
+            column._s_values = s_values_from_py_values(column._py_values)
+            column._py_values = None
+        elif isinstance(column._type, coltypes.Categorical):
+            try:
+                column._categories, column._c_codes = categories_encode(column._py_values)
+            except TypeError:
+                pass # Keep the Python objects
+            else:
+                column._py_values = None
+
+        return column
+
+    @staticmethod
+    def from_codes(codes, categories, **kwargs):
+        """
+        Create a categorical Column from an array of codes and the dictionary they index.
+
+        The code -1 is interpreted as None. The codes are copied, unless they are
+        already a writable buffer of 32-bit integers.
+        """
+        cdef int32_t[::1] arr
+        try:
+            arr = codes
+        except (TypeError, ValueError):
+            arr = array.array("i", codes)
+
+        cdef Tuple dictionary = Tuple.from_sequence(categories)
+        cdef int32_t n = len(dictionary)
+        cdef unsigned i
+        for i in range(arr.shape[0]):
+            if not -1 <= arr[i] < n:
+                raise ValueError(f"Code {arr[i]} out of range at row {i}")
+
+        kwargs.setdefault("type", coltypes.Categorical())
+        cdef Column column = Column(**kwargs)
+        column._c_codes = arr
+        column._categories = dictionary
+        column.length = arr.shape[0]
+
         return column
 
     @staticmethod
@@ -544,11 +2760,31 @@ cdef class Column:
         """
         Create a Column from an array of floats.
 
+        This is an efficient "zero-copy" operation, unless the column's type requests
+        single-precision storage: then the values are narrowed into a new array.
+        You MUST treat the original array's content as an immutable object.
+        """
+        cdef Column column = Column(**kwargs)
+        if single_storage(column._type):
+            column._s_values = s_values_from_f_values(arr)
+        else:
+            column._f_values = arr
+        column.length = arr.shape[0]
+
+        return column
+
+    @staticmethod
+    def from_float32_mv(float[::1] arr, **kwargs):
+        """
+        Create a Column from an array of single-precision floats.
+
+        The values are widened to double precision on demand. NaN is interpreted as None.
+
         This is an efficient "zero-copy" operation.
         You MUST treat the original array's content as an immutable object.
         """
         cdef Column column = Column(**kwargs)
-        column._f_values = arr
+        column._s_values = arr
         column.length = arr.shape[0]
 
         return column
@@ -567,6 +2803,107 @@ cdef class Column:
 
         return column
 
+    @staticmethod
+    def from_ternary_planes(uint64_t[::1] planes, length, **kwargs):
+        """
+        Create a Column of `length` ternary values from a pair of bitplanes.
+
+        See `column.pxd` for the layout. This is a "zero-copy" operation.
+        You MUST treat the original array's content as an immutable object.
+        """
+        if planes.shape[0] != 2*planes_words(length):
+            raise ValueError(f"Expected {2*planes_words(length)} words for {length} rows, got {planes.shape[0]}")
+
+        cdef Column column = Column(**kwargs)
+        column._b_planes = planes
+        column.length = length
+
+        return column
+
+    @staticmethod
+    def from_int_mv(int64_t[::1] arr, **kwargs):
+        """
+        Create a Column from an array of 64-bit integers.
+
+        The value INT64_MIN is interpreted as None.
+
+        This is an efficient "zero-copy" operation.
+        You MUST treat the original array's content as an immutable object.
+        """
+        cdef Column column = Column(**kwargs)
+        column._i_values = arr
+        column.length = arr.shape[0]
+
+        return column
+
+    @staticmethod
+    def from_buffer(obj, dtype=None, **kwargs):
+        """
+        Create a Column from any object supporting the buffer protocol.
+
+        `dtype` is a `struct` format character: "d" for floats, "f" for
+        single-precision floats, "q" for 64-bit
+        integers (INT64_MIN is None) or "b" for ternary values. By default, it is
+        inferred from the buffer's format. If it differs, the buffer's content is
+        reinterpreted as `dtype`.
+
+        Writable buffers are wrapped without copy. You MUST treat the original
+        buffer's content as an immutable object. Read-only buffers are copied.
+        """
+        view = memoryview(obj)
+        if view.ndim != 1 or not view.c_contiguous:
+            raise ValueError("A one-dimensional contiguous buffer is required")
+
+        fmt = view.format.lstrip("@")
+        if dtype is None:
+            dtype = fmt
+        if view.readonly:
+            view = memoryview(bytearray(view))
+        elif fmt != dtype:
+            view = view.cast("B")
+        if view.format != dtype:
+            view = view.cast(dtype)
+
+        if dtype == "d":
+            return Column.from_float_mv(view, **kwargs)
+        elif dtype == "f":
+            return Column.from_float32_mv(view, **kwargs)
+        elif dtype == "q" or dtype == "l":
+            return Column.from_int_mv(view, **kwargs)
+        elif dtype == "b":
+            return Column.from_ternary_mv(view, **kwargs)
+        else:
+            raise ValueError(f"Unsupported buffer format {dtype!r}")
+
+    @staticmethod
+    def from_numpy(arr, **kwargs):
+        """
+        Create a Column from a one-dimensional NumPy array.
+
+        Float64, float32 and int64 arrays are wrapped without copy when contiguous. Other
+        numeric arrays are converted, and boolean arrays become ternary columns.
+        Requires NumPy.
+        """
+        import numpy
+
+        arr = numpy.asarray(arr)
+        kind = arr.dtype.kind
+        if kind == "b":
+            arr = numpy.where(arr, 1, -1).astype(numpy.int8)
+            dtype = "b"
+        elif kind in "iu":
+            arr = arr.astype(numpy.int64, copy=False)
+            dtype = "q"
+        elif kind == "f" and arr.dtype.itemsize == 4:
+            dtype = "f"
+        elif kind == "f":
+            arr = arr.astype(numpy.float64, copy=False)
+            dtype = "d"
+        else:
+            raise TypeError(f"Unsupported NumPy dtype {arr.dtype}")
+
+        return Column.from_buffer(numpy.ascontiguousarray(arr), dtype, **kwargs)
+
     @staticmethod
     def from_callable(fct, *columns, name=None, type=None, **kwargs):
         if name is None:
@@ -605,21 +2942,51 @@ cdef class Column:
         """
         Return the content of the column as a sequence of Python objects.
         """
+        if is_lazy(self):
+            materialize(self)
+
         if self._py_values is not None:
+            cache_touch(self, REPR_PY)
             return self._py_values
 
         # else
-        if self._f_values is not None:
+        cdef unsigned[::1] mapping
+        if self._strided is not None:
+            mapping = strided_mapping(self._strided, self.length, NULL)
+            self._py_values = (<Strided>self._strided).base.get_py_values().remap(
+                    self.length, &mapping[0] if self.length else NULL
+            )
+        elif self._i_values is not None:
+            if isinstance(self._type, coltypes.DateTimeBase):
+                self._py_values = dates_from_i_values(self._i_values, self._type)
+            else:
+                self._py_values = py_values_from_i_values(self._i_values)
+        elif self._f_values is not None:
             self._py_values = py_values_from_f_values(self._f_values)
-            return self._py_values
-
-        # else
-        if self._t_values is not None:
+        elif self._s_values is not None:
+            self._py_values = py_values_from_f_values(f_values_from_s_values(self._s_values))
+        elif self._t_values is not None:
             self._py_values = py_values_from_t_values(self._t_values)
-            return self._py_values
+        elif self._b_planes is not None:
+            self._py_values = py_values_from_b_planes(self._b_planes, self.length)
+        elif self._c_codes is not None:
+            self._py_values = self._categories.remap(self.length, codes_as_mapping(self._c_codes))
+        elif self._runs is not None:
+            self._py_values = expand_runs_py(self._runs, self.length)
+        elif self._sparse is not None:
+            self._py_values = expand_sparse_py(self._sparse, self.length)
+        elif self._packed is not None:
+            if (<Packed>self._packed).is_float:
+                self._py_values = py_values_from_f_values(get_f_values(self))
+            elif isinstance(self._type, coltypes.DateTimeBase):
+                self._py_values = dates_from_i_values(get_i_values(self), self._type)
+            else:
+                self._py_values = py_values_from_i_values(get_i_values(self))
+        else:
+            raise NotImplementedError()
 
-        # else
-        raise NotImplementedError()
+        cache_register(self, REPR_PY, tuple_nbytes(self._py_values, True))
+        return self._py_values
 
     @property
     def f_values(self):
@@ -629,6 +2996,7 @@ cdef class Column:
         if self._f_values is None:
             get_f_values(self) # This may raise an exception!
 
+        cache_lend(self, REPR_F, self._f_values)
         return &self._f_values[0]
 
     @property
@@ -639,8 +3007,227 @@ cdef class Column:
         if self._t_values is None:
             get_t_values(self) # This may raise an exception!
 
+        cache_lend(self, REPR_T, self._t_values)
         return &self._t_values[0]
 
+    @property
+    def b_planes(self):
+        return get_b_planes(self)
+
+    cdef const uint64_t* as_ternary_planes(self) except? NULL:
+        if self._b_planes is None:
+            get_b_planes(self) # This may raise an exception!
+
+        cache_lend(self, REPR_B, self._b_planes)
+        return planes_data(self._b_planes)
+
+    @property
+    def i_values(self):
+        return get_i_values(self)
+
+    cdef const int64_t* as_int_values(self) except NULL:
+        if self._i_values is None:
+            get_i_values(self) # This may raise an exception!
+
+        cache_lend(self, REPR_I, self._i_values)
+        return &self._i_values[0]
+
+    @property
+    def codes(self):
+        """
+        The category codes of a categorical column, or None.
+        """
+        if is_lazy(self):
+            materialize(self)
+
+        return self._c_codes
+
+    @property
+    def categories(self):
+        """
+        The dictionary of a categorical column, as a tuple, or None.
+        """
+        if is_lazy(self):
+            materialize(self)
+
+        return None if self._categories is None else tuple(self._categories)
+
+    @property
+    def compression(self):
+        """
+        The encoding of a compressed column (see `compress()`), or None.
+        """
+        if self._packed is None:
+            return None
+
+        cdef int encoding = (<Packed>self._packed).encoding
+        for name, value in PACK_ENCODINGS.items():
+            if value == encoding:
+                return name
+
+    cdef const int32_t* as_codes(self) except? NULL:
+        if is_lazy(self):
+            materialize(self)
+
+        if self._c_codes is None:
+            raise TypeError(f"Column {self.get_name()} is not categorical")
+
+        return <const int32_t*>mv_data(self._c_codes)
+
+    # ------------------------------------------------------------------
+    # Buffer protocol
+    # ------------------------------------------------------------------
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        """
+        Export the column's native storage as a read-only one-dimensional buffer.
+
+        The exported representation depends on the column's type: 32-bit category
+        codes for categorical columns, single-precision floats for columns stored
+        that way, 64-bit integers for integer and date/time
+        columns, signed chars for ternary columns, and doubles otherwise.
+        Strided views share the storage of the column they were taken from.
+        """
+        if (flags & PyBUF_WRITABLE) == PyBUF_WRITABLE:
+            raise BufferError("Column buffers are read-only")
+        if is_lazy(self):
+            materialize(self)
+
+        # A strided view exports the storage of its base column
+        cdef Column src = self
+        cdef Py_ssize_t start = 0
+        cdef Py_ssize_t step = 1
+        cdef Strided view = <Strided>self._strided
+        if view is not None:
+            src = view.base
+            start = view.start
+            step = view.step
+            if step != 1 and (flags & PyBUF_STRIDES) != PyBUF_STRIDES:
+                raise BufferError("Strided column views require a strided buffer request")
+
+        cdef int kind = buffer_kind(src)
+        cdef object base
+        cdef void* data
+        cdef Py_ssize_t itemsize
+        cdef char* fmt
+        if kind == REPR_C:
+            data = mv_data(src._c_codes)
+            base = src._c_codes
+            itemsize = sizeof(int32_t)
+            fmt = b"i"
+        elif kind == REPR_S:
+            data = mv_data(src._s_values)
+            base = src._s_values
+            itemsize = sizeof(float)
+            fmt = b"f"
+        elif kind == REPR_I:
+            data = mv_data(get_i_values(src))
+            base = src._i_values
+            itemsize = sizeof(int64_t)
+            fmt = b"q"
+        elif kind == REPR_T:
+            data = mv_data(get_t_values(src))
+            base = src._t_values
+            itemsize = sizeof(signed char)
+            fmt = b"b"
+        else:
+            data = mv_data(get_f_values(src))
+            base = src._f_values
+            itemsize = sizeof(double)
+            fmt = b"d"
+
+        cdef buffer_info_t* info = <buffer_info_t*>malloc(sizeof(buffer_info_t))
+        if info == NULL:
+            raise MemoryError()
+        info.base = <PyObject*>base
+        info.shape = self.length
+        info.stride = itemsize*step
+        Py_INCREF(base)
+
+        buffer.buf = <char*>data + start*itemsize
+        buffer.len = self.length*itemsize
+        buffer.readonly = 1
+        buffer.itemsize = itemsize
+        buffer.format = fmt if (flags & PyBUF_FORMAT) == PyBUF_FORMAT else NULL
+        buffer.ndim = 1
+        buffer.shape = &info.shape if (flags & PyBUF_ND) == PyBUF_ND else NULL
+        buffer.strides = &info.stride if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+        buffer.internal = info
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        cdef buffer_info_t* info = <buffer_info_t*>buffer.internal
+        Py_DECREF(<object>info.base)
+        free(info)
+
+    def to_numpy(self):
+        """
+        Return a read-only NumPy array sharing the column's native storage.
+
+        See `__getbuffer__()` for the exported representation. Requires NumPy.
+        """
+        import numpy
+
+        return numpy.asarray(self)
+
+    # ------------------------------------------------------------------
+    # Pickling
+    # ------------------------------------------------------------------
+    def __reduce_ex__(self, protocol):
+        """
+        Support for pickle.
+
+        Only the primary representation is serialized. With protocol 5 and above,
+        native arrays are exported as out-of-band buffers (see `pickle.PickleBuffer`).
+        """
+        if is_lazy(self):
+            materialize(self)
+
+        return (column_from_pickle, (self.length, self.get_name(), self._type, *column_state(self, protocol)))
+
+    def memory_usage(self, deep=False):
+        """
+        Return the number of bytes used by each representation currently held by
+        the column.
+
+        If `deep` is true, the size of the Python objects referenced by the
+        `py_values` representation is included.
+        """
+        result = {}
+        if self._py_values is not None:
+            result["py_values"] = tuple_nbytes(self._py_values, deep)
+        if self._f_values is not None:
+            result["f_values"] = self._f_values.shape[0]*sizeof(double)
+        if self._s_values is not None:
+            result["s_values"] = self._s_values.shape[0]*sizeof(float)
+        if self._t_values is not None:
+            result["t_values"] = self._t_values.shape[0]*sizeof(signed char)
+        if self._b_planes is not None:
+            result["b_planes"] = self._b_planes.shape[0]*sizeof(uint64_t)
+        if self._i_values is not None:
+            result["i_values"] = self._i_values.shape[0]*sizeof(int64_t)
+        if self._c_codes is not None:
+            result["c_codes"] = (
+                    tuple_nbytes(self._categories, deep)
+                    + self._c_codes.shape[0]*sizeof(int32_t)
+            )
+        if self._runs is not None:
+            result["runs"] = (
+                    tuple_nbytes((<Runs>self._runs).values, deep)
+                    + len(self._runs)*sizeof(unsigned)
+            )
+        if self._strided is not None:
+            result["strided"] = 0 # The storage belongs to the base column
+        if self._sparse is not None:
+            result["sparse"] = (
+                    sum((<Sparse>self._sparse).values.memory_usage(deep).values())
+                    + len(self._sparse)*sizeof(unsigned)
+            )
+        if self._packed is not None:
+            result["packed"] = len(self._packed)
+        if self._selection is not None:
+            result["selection"] = 0 # Not gathered yet. The rows are shared with the other filtered columns
+
+        return result
 
     # ------------------------------------------------------------------
     # Metadata
@@ -665,6 +3252,19 @@ cdef class Column:
     cdef object get_type(self):
         return self._type
 
+    cdef object get_float_type(self):
+        """
+        Return the type of the float columns computed by a kernel from this one.
+
+        Columns stored in single precision request single-precision results.
+        """
+        if self._s_values is None or single_storage(self._type):
+            return self._type
+
+        options = dict(self._type._options) if isinstance(self._type, coltypes.Float) else {}
+        options["storage"] = "float32"
+        return coltypes.Float(**options)
+
 
     def metadata(self, name, default=None):
         if self._metadata is None:
@@ -678,13 +3278,67 @@ cdef class Column:
         else:
             self._metadata.update(kwargs)
 
+    def stats(self):
+        """
+        Return the statistics of the column (see `ColumnStats`).
+
+        The statistics are computed once, natively when the values have a native
+        representation, and cached since columns are immutable.
+        """
+        return self.get_stats()
+
+    cdef ColumnStats get_stats(self):
+        cdef Runs runs
+        if self._stats is not None:
+            return self._stats
+
+        if is_lazy(self):
+            materialize(self)
+        decompress(self)
+
+        if self._i_values is None and isinstance(self._type, coltypes.DateTimeBase):
+            try:
+                get_i_values(self)
+            except (TypeError, ValueError):
+                pass
+
+        cdef Strided view = <Strided>self._strided
+        if view is not None:
+            # Gather the view natively instead of building Python objects
+            if view.base._i_values is not None:
+                get_i_values(self)
+            elif view.base._f_values is not None or view.base._s_values is not None:
+                get_f_values(self)
+
+        if self._runs is not None:
+            runs = <Runs>self._runs
+            self._stats = stats_from_objects(runs.values, [
+                runs.ends[k] - (runs.ends[k-1] if k else 0) for k in range(len(runs))
+            ])
+        elif self._sparse is not None:
+            self._stats = stats_from_sparse(self._sparse, self.length)
+        elif self._c_codes is not None:
+            self._stats = stats_from_objects(self.get_py_values())
+        elif self._i_values is not None:
+            self._stats = stats_from_i_values(self._i_values, self._type)
+        elif (self._f_values is not None or self._s_values is not None) and (
+                self._py_values is None or isinstance(self._type, coltypes.Float)):
+            self._stats = stats_from_f_values(get_f_values(self), self._py_values)
+        else:
+            self._stats = stats_from_objects(self.get_py_values())
+
+        return self._stats
+
     def min_max(self):
         """
         Return the minimum and maximum values in the column.
         None values are ignored.
         """
-        values = [v for v in self.py_values if v is not None]
-        return min(values), max(values)
+        cdef ColumnStats stats = self.get_stats()
+        if stats.min is None:
+            raise ValueError("min() arg is an empty sequence")
+
+        return stats.min, stats.max
 
     def __richcmp__(self, other, int op):
         """
@@ -712,30 +3366,94 @@ cdef class Column:
 
     def __getitem__(self, x):
         cdef slice  sl
+        if is_lazy(self):
+            materialize(self)
         if type(x) is slice:
             sl = <slice>x
-            if sl.step is not None and sl.step != 1:
-                raise ValueError(f"Only contiguous slices are supported ({sl})")
+            if self._strided is not None or (sl.step is not None and sl.step != 1):
+                return strided_slice(self, sl)
 
+            # Create the result first: this may evict the decoded values
             column = new_column_with_meta(self, 0)
+            decompress(self)
+            if self._runs is not None:
+                start, stop, _ = sl.indices(self.length)
+                column._runs = runs_slice(self._runs, start, max(start, stop))
+                column.length = max(0, stop - start)
+                return column
+            if self._sparse is not None:
+                start, stop, _ = sl.indices(self.length)
+                column._sparse = sparse_slice(self._sparse, start, max(start, stop))
+                column.length = max(0, stop - start)
+                return column
+
             # XXX Do we really need to slice all representations?
             if self._f_values is not None:
                 column._f_values = self._f_values[sl.start:sl.stop]
                 column.length = len(column._f_values)
+            if self._s_values is not None:
+                column._s_values = self._s_values[sl.start:sl.stop]
+                column.length = len(column._s_values)
             if self._t_values is not None:
                 column._t_values = self._t_values[sl.start:sl.stop]
                 column.length = len(column._t_values)
+            if self._b_planes is not None:
+                start, stop, _ = sl.indices(self.length)
+                column.length = max(0, stop - start)
+                column._b_planes = planes_window(self._b_planes, self.length, start, column.length)
+            if self._i_values is not None:
+                column._i_values = self._i_values[sl.start:sl.stop]
+                column.length = len(column._i_values)
+            if self._c_codes is not None:
+                column._c_codes = self._c_codes[sl.start:sl.stop]
+                column._categories = self._categories
+                column.length = len(column._c_codes)
             if self._py_values is not None:
                 column._py_values = self._py_values.slice(x.start, x.stop)
                 column.length = len(column._py_values)
             return column
 
+        decompress(self)
+        cdef int64_t i_value
+        cdef int32_t code
         if self._py_values is not None:
             return self._py_values[<Py_ssize_t>x]
+        if self._c_codes is not None:
+            code = self._c_codes[<Py_ssize_t>x]
+            return self._categories.get_item(code) if code >= 0 else None
+        if self._i_values is not None:
+            i_value = self._i_values[<Py_ssize_t>x]
+            if i_value == INT64_MIN:
+                return None
+            if isinstance(self._type, coltypes.DateTimeBase):
+                return self._type.from_epoch(i_value)
+            return i_value
         if self._f_values is not None:
             return self._f_values[<Py_ssize_t>x]
+        if self._s_values is not None:
+            return self._s_values[<Py_ssize_t>x]
         if self._t_values is not None:
-            return self._t_values[<Py_ssize_t>x]
+            return ternary_to_py(self._t_values[<Py_ssize_t>x])
+        if self._b_planes is not None:
+            idx = x + self.length if x < 0 else x
+            if not 0 <= idx < self.length:
+                raise IndexError(f"Column index {x} out of range")
+            return ternary_to_py(planes_get(planes_data(self._b_planes), planes_words(self.length), idx))
+        if self._runs is not None:
+            idx = x + self.length if x < 0 else x
+            if not 0 <= idx < self.length:
+                raise IndexError(f"Column index {x} out of range")
+            return runs_get_item(self._runs, idx)
+        if self._sparse is not None:
+            idx = x + self.length if x < 0 else x
+            if not 0 <= idx < self.length:
+                raise IndexError(f"Column index {x} out of range")
+            return sparse_get_item(self._sparse, idx)
+        if self._strided is not None:
+            idx = x + self.length if x < 0 else x
+            if not 0 <= idx < self.length:
+                raise IndexError(f"Column index {x} out of range")
+            return (<Strided>self._strided).base[(<Strided>self._strided).start + idx*(<Strided>self._strided).step]
 
         raise NotImplementedError()
 
@@ -758,12 +3476,30 @@ cdef class Column:
         Create a copy of the column with values picked from the index specificed in `mapping`.
         """
         cdef Column result = new_column_with_meta(self, count)
-        if self._f_values is not None:
-            result._f_values = remap_values[double](&self._f_values[0], count, mapping)
-        if self._t_values is not None:
-            result._t_values = remap_values[schar](&self._t_values[0], count, mapping)
-        if self._py_values is not None:
-            result._py_values = self._py_values.remap(count, mapping)
+        remap_into(result, self, count, mapping)
+
+        return result
+
+    cdef Column c_select(self, unsigned[::1] rows):
+        """
+        Create a column holding the rows of the receiver listed in `rows`.
+
+        The values are gathered when the column is first used. `rows` must not be
+        modified afterward, since it is shared by the columns selected together.
+        """
+        cdef unsigned count = rows.shape[0]
+        cdef Column result = new_column_with_meta(self, count)
+        cdef Selection selection = <Selection>self._selection
+        cdef unsigned[::1] composed
+        cdef unsigned i
+        if selection is None:
+            result._selection = selection_create(self, rows)
+        else:
+            # Select directly from the base column
+            composed = ualloc(count)
+            for i in range(count):
+                composed[i] = selection.rows[rows[i]]
+            result._selection = selection_create(selection.base, composed)
 
         return result
 
@@ -771,15 +3507,91 @@ cdef class Column:
         return self.c_rename(newName)
 
     cdef Column c_rename(self, str newName):
+        if self._expr is not None:
+            materialize(self)
+
         cdef Column result = new_column_with_meta(self, self.length)
         result._t_values = self._t_values
+        result._b_planes = self._b_planes
         result._f_values = self._f_values
+        result._s_values = self._s_values
+        result._i_values = self._i_values
+        result._c_codes = self._c_codes
+        result._categories = self._categories
         result._py_values = self._py_values
+        result._runs = self._runs
+        result._sparse = self._sparse
+        result._strided = self._strided
+        result._packed = self._packed
+        result._selection = self._selection
 
         result._name = newName
 
         return result
 
+    def compress(self, encoding=None):
+        """
+        Create a copy of the column whose values are stored in compressed form.
+
+        Integer and date/time columns are compressed as 64-bit integers, using
+        the "delta" (delta-of-delta, suited to regularly spaced timestamps) or the
+        "rle" (run-length) encoding. Float columns are compressed as doubles,
+        using the "xor" (XOR of consecutive values, suited to slowly varying
+        series) or the "rle" encoding. If `encoding` is None, the encoding producing
+        the smallest data is chosen.
+
+        The values are decoded on demand into pooled buffers, which are cached
+        like the other secondary representations. Under a memory budget, only the
+        compressed data is kept once they are evicted.
+        """
+        if is_lazy(self):
+            materialize(self)
+
+        cdef object t = self._type
+        cdef bint is_float
+        if isinstance(t, (coltypes.Integer, coltypes.DateTimeBase)):
+            is_float = False
+        elif isinstance(t, coltypes.Float):
+            is_float = True
+        elif self._i_values is not None and self._f_values is None:
+            is_float = False
+        elif self._f_values is not None or self._s_values is not None:
+            is_float = True
+        else:
+            # Untyped values: integers are compressed as such, other numbers as floats
+            is_float = not all([ v is None or type(v) is int for v in self.get_py_values() ])
+            try:
+                if is_float:
+                    get_f_values(self)
+                else:
+                    get_i_values(self)
+            except (TypeError, ValueError, OverflowError):
+                raise TypeError(f"Column {self.get_name()} has no numeric representation")
+
+        cdef list candidates = [ "xor", "rle" ] if is_float else [ "delta", "rle" ]
+        if encoding is not None:
+            if encoding not in candidates:
+                raise ValueError(
+                        f"Invalid encoding {encoding!r} for {'float' if is_float else 'integer'} "
+                        f"column {self.get_name()}"
+                )
+            candidates = [ encoding ]
+
+        cdef const void* values = (
+                mv_data(get_f_values(self)) if is_float else mv_data(get_i_values(self))
+        )
+        cdef Packed best = None
+        cdef Packed packed
+        for name in candidates:
+            packed = packed_create(PACK_ENCODINGS[name], is_float, values, self.length)
+            if best is None or len(packed) < len(best):
+                best = packed
+
+        cdef Column result = new_column_with_meta(self, self.length)
+        result._packed = best
+
+        return result
+
     def shift(self, n):
         """
         Create a new column whose values are shifted.
@@ -787,61 +3599,208 @@ cdef class Column:
         return self.c_shift(n)
 
     cdef Column c_shift(self, int n):
+        if is_lazy(self):
+            materialize(self)
+        decompress(self)
+
+        cdef unsigned[::1] mapping
+        cdef unsigned i
+        cdef unsigned MISSING=-1
+        cdef signed char[::1] t_values
+
+        # The Python objects of float and ternary columns are parsed from their
+        # typed representation: the latter can be shifted instead.
+        cdef bint is_float = isinstance(self._type, coltypes.Float)
+        cdef bint is_ternary = isinstance(self._type, coltypes.Ternary)
+        if (is_float and self._f_values is None and self._s_values is None and self.length
+                and self._py_values is not None and self._strided is None):
+            get_f_values(self)
+
+        if ((self._f_values is not None or self._s_values is not None)
+                and (self._py_values is None or is_float)
+                and self._i_values is None and self._c_codes is None and self._runs is None
+                and self._sparse is None):
+            # Zero-copy view over the float values. The padding is virtual: it
+            # is only produced when the column is materialized or while evaluating
+            # an expression using it.
+            return lazy_column(self, expr_load(self, n), self._name, type=None)
+
         cdef Column result = new_column_with_meta(self, self.length)
-        result._py_values = self.get_py_values().shift(n)
+        if self.length == 0:
+            result._py_values = self.get_py_values()
+        elif self._runs is not None:
+            result._runs = runs_shift(self._runs, self.length, n)
+        elif self._sparse is not None:
+            result._sparse = sparse_shift(self._sparse, self.length, n)
+        elif self._strided is not None:
+            mapping = ualloc(self.length)
+            for i in range(self.length):
+                mapping[i] = i + n if 0 <= <long>i + n < self.length else MISSING
+            result = self.c_remap(self.length, &mapping[0])
+        elif self._c_codes is not None:
+            result._c_codes = shift_values[int32_t](&self._c_codes[0], self.length, n)
+            result._categories = self._categories
+        elif self._i_values is not None:
+            result._i_values = shift_values[int64_t](&self._i_values[0], self.length, n)
+        elif self._py_values is None and self._b_planes is not None and self._t_values is None:
+            result._b_planes = planes_window(self._b_planes, self.length, n, self.length)
+        elif is_ternary or (self._py_values is None and self._t_values is not None):
+            t_values = get_t_values(self)
+            result._t_values = shift_values[schar](&t_values[0], self.length, n)
+        else:
+            result._py_values = self.get_py_values().shift(n)
 
         return result
 
+    # ------------------------------------------------------------------
+    # Comparison of consecutive rows
+    # ------------------------------------------------------------------
+    cdef int c_mark_changes(self, unsigned char* changes) except -1:
+        """
+        Set `changes[i]` to 1 for each row `i` whose value differs from the value of
+        the previous row. Other items are left untouched, so the changes of several
+        columns can be accumulated in the same buffer.
+
+        None values compare equal. Categorical, integer, float and ternary columns are
+        compared natively. Run-length encoded columns are compared once per run, and
+        sparse columns only around their entries.
+        """
+        if is_lazy(self):
+            materialize(self)
+        decompress(self)
+
+        cdef unsigned n = self.length
+        cdef unsigned i, k, end
+        cdef unsigned prev_end = 0
+        cdef Runs runs
+        cdef Sparse sparse
+        cdef unsigned row
+        cdef const int32_t* codes
+        cdef const int64_t* i_values
+        cdef const double* f_values
+        cdef const signed char* t_values
+        cdef Tuple py_values
+        if self._runs is not None:
+            runs = <Runs>self._runs
+            prev = None
+            for k in range(runs.ends.shape[0]):
+                end = runs.ends[k]
+                if end == prev_end:
+                    continue # Empty run
+                value = runs.values.get_item(k)
+                if prev_end > 0 and not (value is prev or value == prev):
+                    changes[prev_end] = 1
+                prev = value
+                prev_end = end
+        elif self._sparse is not None:
+            sparse = <Sparse>self._sparse
+            py_values = sparse.values.get_py_values()
+            for k in range(len(sparse)):
+                row = sparse.rows[k]
+                value = py_values.get_item(k)
+                prev = py_values.get_item(k-1) if k and sparse.rows[k-1] == row-1 else None
+                if row > 0 and not (value is prev or value == prev):
+                    changes[row] = 1
+                if value is not None and row+1 < n and not (k+1 < len(sparse) and sparse.rows[k+1] == row+1):
+                    changes[row+1] = 1 # Back to None
+        elif self._c_codes is not None:
+            # Categories are distinct, so equal codes means equal values
+            codes = <const int32_t*>mv_data(self._c_codes)
+            for i in range(1, n):
+                if codes[i] != codes[i-1]:
+                    changes[i] = 1
+        elif self._py_values is None and self._i_values is not None:
+            i_values = <const int64_t*>mv_data(self._i_values)
+            for i in range(1, n):
+                if i_values[i] != i_values[i-1]:
+                    changes[i] = 1
+        elif self._py_values is None and (self._f_values is not None or self._s_values is not None):
+            f_values = <const double*>mv_data(get_f_values(self))
+            for i in range(1, n):
+                if f_values[i] != f_values[i-1] and not (isnan(f_values[i]) and isnan(f_values[i-1])):
+                    changes[i] = 1
+        elif self._py_values is None and (self._t_values is not None or self._b_planes is not None):
+            t_values = <const signed char*>mv_data(get_t_values(self))
+            for i in range(1, n):
+                if t_values[i] != t_values[i-1]:
+                    changes[i] = 1
+        else:
+            py_values = self.get_py_values()
+            for i in range(1, n):
+                value = py_values.get_item(i)
+                prev = py_values.get_item(i-1)
+                if not (value is prev or value == prev):
+                    changes[i] = 1
+
+        return 0
+
     # ------------------------------------------------------------------
     # Addition
     # ------------------------------------------------------------------
     def __add__(self, other):
-        if isinstance(other, (int, float)):
-            return add_column_scalar(self, other)
-        elif isinstance(other, Column):
-            return add_column_column(self, other)
-        else:
-            return NotImplemented
+        return arithmetic(EXPR_ADD, "+", self, other)
 
     cdef Column c_add_scalar(self, double scalar):
-        return add_column_scalar(self, scalar)
+        return arithmetic(EXPR_ADD, "+", self, scalar)
 
     # ------------------------------------------------------------------
     # Subtraction
     # ------------------------------------------------------------------
     def __sub__(self, other):
-        return self + -other
+        if isinstance(self, Column):
+            return arithmetic(EXPR_SUB, "+-", self, other)
+        else:
+            return arithmetic(EXPR_SUB, "-", self, other)
 
     cdef Column c_sub_scalar(self, double scalar):
-        return add_column_scalar(self, -scalar)
+        return arithmetic(EXPR_SUB, "+-", self, scalar)
 
     # ------------------------------------------------------------------
     # Multiplication
     # ------------------------------------------------------------------
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
-            return mul_column_scalar(self, other)
-        elif isinstance(other, Column):
-            return mul_column_column(self, other)
-        else:
-            return NotImplemented
+        return arithmetic(EXPR_MUL, "*", self, other)
 
     cdef Column c_mul_scalar(self, double scalar):
-        return mul_column_scalar(self, scalar)
+        return arithmetic(EXPR_MUL, "*", self, scalar)
 
     # ------------------------------------------------------------------
     # Division
     # ------------------------------------------------------------------
     def __truediv__(self, other):
-        if isinstance(other, (int, float)):
-            return div_column_scalar(self, other)
-        elif isinstance(other, Column):
-            return div_column_column(self, other)
-        else:
-            return NotImplemented
+        return arithmetic(EXPR_DIV, "/", self, other)
 
     cdef Column c_div_scalar(self, double scalar):
-        return div_column_scalar(self, scalar)
+        return arithmetic(EXPR_DIV, "/", self, scalar)
+
+    # ------------------------------------------------------------------
+    # Exponentiation
+    # ------------------------------------------------------------------
+    def __pow__(self, other, modulo):
+        if modulo is not None:
+            return NotImplemented
+
+        return arithmetic(EXPR_POW, "**", self, other)
+
+    # ------------------------------------------------------------------
+    # Absolute value
+    # ------------------------------------------------------------------
+    def __abs__(self):
+        """
+        Absolute value.
+
+        This method performs an implicit conversion to float values.
+        """
+        if self._sparse is not None:
+            return sparse_column(
+                    self, (<Sparse>self._sparse).rows, abs((<Sparse>self._sparse).values), f"abs({self.get_name()})"
+            )
+
+        return lazy_column(
+                self,
+                expr_unary(EXPR_ABS, expr_operand(self)),
+                f"abs({self.get_name()})"
+        )
 
     # ------------------------------------------------------------------
     # Unary negation
@@ -851,17 +3810,18 @@ cdef class Column:
         Unary negation.
 
         This method performs an implicit conversion to float values.
-
-        TODO: If implicit conversion raise an error, fallback to cell-by-cell negation.
         """
-        cdef double[::1] values = get_f_values(self)
-        cdef unsigned count = len(values)
-
-        cdef Column result = new_column_with_meta(self, self.length)
-        result._name = f"-{self.get_name()}"
-        result._f_values = neg(count, &values[0])
-
-        return result
+        if self._sparse is not None:
+            return sparse_column(
+                    self, (<Sparse>self._sparse).rows, -(<Sparse>self._sparse).values, f"-{self.get_name()}", type=None
+            )
+
+        return lazy_column(
+                self,
+                expr_unary(EXPR_NEG, expr_operand(self)),
+                f"-{self.get_name()}",
+                type=None
+        )
 
     # ------------------------------------------------------------------
     # Bitwise and
@@ -1,8 +1,12 @@
+from libc.stdint cimport int32_t
+from fin.containers.tuple cimport Tuple
 from fin.seq.column cimport Column
 from fin.seq.serie cimport Serie
 from fin.seq.coltypes import Ternary
 
 from fin cimport mem
+from fin.config cimport parallel_threads
+from cython.parallel cimport prange
 
 cdef class above:
     cdef double threshold
@@ -20,7 +24,8 @@ cdef class above:
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src)
 
         # ------------------ epilogue ------------------
         res = Column.from_ternary_mv(
@@ -34,8 +39,75 @@ cdef class above:
             return res
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, signed char* dst, const double* src):
+    cdef void eval(self, unsigned l, signed char* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        cdef double threshold = self.threshold
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = +1 if src[i]>threshold else -1
+
+
+cdef class equal:
+    """
+    Evaluates to True where the values are equal to `value`.
+
+    Categorical columns are compared using their codes, so `value` is compared
+    only once with each category.
+    """
+    cdef object value
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"EQUAL({self.value!r})"
+
+    def __call__(self, Serie ser, Column col, *tail):
+        # ------------------ prologue ------------------
+        cdef unsigned l = ser.rowcount
+        cdef signed char[::1] dst = mem.schar_alloc(l)
+        cdef signed char[::1] matches
+        cdef const signed char* matches_ptr = NULL
+        cdef const int32_t* codes
+        cdef unsigned i
+        # -------------- end of prologue ---------------
+
+        if self.value is None:
+            for i in range(l):
+                dst[i] = 0
+        elif col._c_codes is not None:
+            # Several categories may compare equal to the value (e.g. 1 and 1.0)
+            matches = mem.schar_alloc(len(col._categories))
+            for i, category in enumerate(col._categories):
+                matches[i] = +1 if category == self.value else -1
+            if matches.shape[0]:
+                matches_ptr = &matches[0]
+            codes = col.as_codes()
+            with nogil:
+                self.eval_codes(l, &dst[0], codes, matches_ptr)
+        else:
+            self.eval_objects(l, &dst[0], col.get_py_values())
+
+        # ------------------ epilogue ------------------
+        res = Column.from_ternary_mv(
+                dst,
+                name=f"{self}, {col.name}",
+                type=Ternary()
+            )
+        if tail:
+            return (res, self, tail)
+        else:
+            return res
+        # -------------- end of epilogue ---------------
+
+    cdef void eval_codes(self, unsigned l, signed char* dst, const int32_t* codes, const signed char* matches) nogil:
+        cdef unsigned i
+        for i in range(l):
+            dst[i] = 0 if codes[i] < 0 else matches[codes[i]]
+
+    cdef int eval_objects(self, unsigned l, signed char* dst, Tuple values) except -1:
         cdef unsigned i
         for i in range(l):
-            dst[i] = +1 if src[i]>self.threshold else -1
+            value = values.get_item(i)
+            dst[i] = 0 if value is None else +1 if value == self.value else -1
 
+        return 0
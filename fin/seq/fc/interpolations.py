@@ -8,7 +8,14 @@ from fin.seq.column import Column
 def _index(col, x, *, bsearch=bisect.bisect_left):
     """
     Return the index of x in col, assuming col is sorted is ascending order.
+
+    Date/time columns are searched using their native epoch representation.
     """
+    to_epoch = getattr(col.type, "to_epoch", None)
+    if to_epoch is not None:
+        col = col.i_values
+        x = to_epoch(x)
+
     idx = bsearch(col, x)
     if idx == len(col) or col[idx] != x:
         raise ValueError
@@ -1,8 +1,12 @@
-from fin.seq.column cimport Column
+from libc.stdint cimport uint64_t
+
+from fin.seq.column cimport Column, planes_words, planes_tail_mask
 from fin.seq.serie cimport Serie
 from fin.seq.coltypes import Ternary
 
 from fin cimport mem
+from fin.config cimport parallel_threads
+from cython.parallel cimport prange
 
 # ======================================================================
 # Logical functions
@@ -10,6 +14,9 @@ from fin cimport mem
 cdef class _LogicalFunction:
     """ Baseclass for N-ary logical functions.
 
+        The arguments are processed as ternary bitplanes, 64 rows at a time.
+        See `fin/seq/column.pxd` for the layout.
+
         Sub-classes should implement the following methods:
         - `__repr__()`
         - `eval()`
@@ -17,30 +24,39 @@ cdef class _LogicalFunction:
     def __call__(self, Serie ser, *cols):
         # ------------------ prologue ------------------
         cdef unsigned l = ser.rowcount
-        cdef signed char[::1] dst = mem.schar_alloc(l)
+        cdef Py_ssize_t nwords = planes_words(l)
+        cdef uint64_t[::1] dst = mem.uint64_alloc(2*nwords)
 
         cdef unsigned n = len(cols)
-        cdef const signed char **srcs = <const signed char**>mem.alloca(n*sizeof(signed char**))
+        cdef const uint64_t **srcs = <const uint64_t**>mem.alloca(n*sizeof(uint64_t*))
         cdef unsigned j
         cdef Column col
         cdef str col_names = ""
         for j, col in enumerate(cols):
-            srcs[j] = col.as_ternary_values()
+            srcs[j] = col.as_ternary_planes()
             col_names += f", {col.name}"
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], n, srcs)
+        cdef uint64_t *dst_ptr
+        if nwords > 0:
+            dst_ptr = &dst[0]
+            with nogil:
+                self.eval(l, nwords, dst_ptr, n, srcs)
+                dst_ptr[nwords-1] &= planes_tail_mask(l)
+                dst_ptr[2*nwords-1] &= planes_tail_mask(l)
 
         # ------------------ epilogue ------------------
-        return Column.from_ternary_mv(
+        return Column.from_ternary_planes(
                 dst,
+                l,
                 name=f"{self}{col_names}",
                 type=Ternary()
             )
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, signed char* dst, unsigned n, const signed char** srcs):
-        raise NotImplementedError()
+    cdef int eval(self, unsigned l, Py_ssize_t nwords, uint64_t* dst, unsigned n, const uint64_t** srcs) except -1 nogil:
+        with gil:
+            raise NotImplementedError()
 
 cdef class All(_LogicalFunction):
     """ Check the truthiness of the arguments.
@@ -56,17 +72,20 @@ cdef class All(_LogicalFunction):
     def __repr__(self):
         return f"all"
 
-    cdef void eval(self, unsigned l, signed char* dst, unsigned n, const signed char** srcs):
-        cdef signed char acc
-        cdef unsigned i, j
-        for i in range(l):
-            acc = +1
+    cdef int eval(self, unsigned l, Py_ssize_t nwords, uint64_t* dst, unsigned n, const uint64_t** srcs) except -1 nogil:
+        cdef uint64_t true, false
+        cdef Py_ssize_t i
+        cdef unsigned j
+        for i in prange(nwords, num_threads=parallel_threads(l), schedule="static"):
+            true = ~<uint64_t>0
+            false = 0
             for j in range(n):
-                if srcs[j][i] < acc:
-                    acc = srcs[j][i]
-                if acc < 0:
-                    break
-            dst[i] = acc
+                true = true & srcs[j][nwords+i]
+                false = false | (srcs[j][i] & ~srcs[j][nwords+i])
+            dst[nwords+i] = true
+            dst[i] = true | false
+
+        return 0
 
 all = All()
 
@@ -84,17 +103,19 @@ cdef class Any(_LogicalFunction):
     def __repr__(self):
         return f"any"
 
-    cdef void eval(self, unsigned l, signed char* dst, unsigned n, const signed char** srcs):
-        cdef signed char acc
-        cdef unsigned i, j
-        for i in range(l):
-            acc = -1
+    cdef int eval(self, unsigned l, Py_ssize_t nwords, uint64_t* dst, unsigned n, const uint64_t** srcs) except -1 nogil:
+        cdef uint64_t true, false
+        cdef Py_ssize_t i
+        cdef unsigned j
+        for i in prange(nwords, num_threads=parallel_threads(l), schedule="static"):
+            true = 0
+            false = ~<uint64_t>0
             for j in range(n):
-                if srcs[j][i] > acc:
-                    acc = srcs[j][i]
-                if acc > 0:
-                    break
-            dst[i] = acc
+                true = true | srcs[j][nwords+i]
+                false = false & (srcs[j][i] & ~srcs[j][nwords+i])
+            dst[nwords+i] = true
+            dst[i] = true | false
 
-any = Any()
+        return 0
 
+any = Any()
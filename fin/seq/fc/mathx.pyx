@@ -0,0 +1,255 @@
+# cython: boundscheck=False
+# cython: cdivision=True
+
+"""
+Native element-wise mathematical functions on columns.
+
+All functions perform an implicit conversion to float values. NaN (None) values
+are propagated.
+
+The absolute value and the power functions are named `fabs` and `power`, so
+`from fin.seq.fc import *` does not shadow the `abs` and `pow` builtins.
+"""
+
+from libc cimport math
+
+from fin.mathx cimport isnan
+from fin.seq.column cimport Column
+from fin.seq.serie cimport Serie
+
+from fin cimport mem
+from fin.config cimport parallel_threads
+from cython.parallel cimport prange
+
+# ======================================================================
+# Unary functions
+# ======================================================================
+cdef class _UnaryFunction:
+    """ Baseclass for unary element-wise functions.
+
+        Sub-classes should implement the following methods:
+        - `__repr__()`
+        - `eval()`
+    """
+    def __call__(self, Serie ser, Column col):
+        # ------------------ prologue ------------------
+        cdef unsigned l = ser.rowcount
+        cdef double[::1] dst = mem.double_alloc(l)
+        cdef const double *src = col.as_float_values()
+        cdef double *dst_ptr = &dst[0]
+        # -------------- end of prologue ---------------
+
+        with nogil:
+            self.eval(l, dst_ptr, src)
+
+        # ------------------ epilogue ------------------
+        return Column.from_float_mv(
+                dst,
+                name=f"{self}({col.name})",
+                type="n"
+            )
+        # -------------- end of epilogue ---------------
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        pass
+
+cdef class Log(_UnaryFunction):
+    """ Natural logarithm.
+    """
+    def __repr__(self):
+        return f"log"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = math.log(src[i])
+
+log = Log()
+
+cdef class Exp(_UnaryFunction):
+    """ Exponential.
+    """
+    def __repr__(self):
+        return f"exp"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = math.exp(src[i])
+
+exp = Exp()
+
+cdef class Sqrt(_UnaryFunction):
+    """ Square root.
+    """
+    def __repr__(self):
+        return f"sqrt"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = math.sqrt(src[i])
+
+sqrt = Sqrt()
+
+cdef class Abs(_UnaryFunction):
+    """ Absolute value.
+    """
+    def __repr__(self):
+        return f"fabs"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = math.fabs(src[i])
+
+fabs = Abs()
+
+cdef class Sign(_UnaryFunction):
+    """ Sign of the values: -1.0, 0.0 or +1.0.
+    """
+    def __repr__(self):
+        return f"sign"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        cdef double x
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            x = src[i]
+            if x > 0.0:
+                dst[i] = 1.0
+            elif x < 0.0:
+                dst[i] = -1.0
+            else:
+                dst[i] = x # 0.0, -0.0 or NaN
+
+sign = Sign()
+
+cdef class power(_UnaryFunction):
+    """ Raise the values to a constant power.
+    """
+    cdef double exponent
+
+    def __init__(self, exponent):
+        self.exponent = exponent
+
+    def __repr__(self):
+        return f"power({self.exponent})"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        cdef double exponent = self.exponent
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            dst[i] = math.pow(src[i], exponent)
+
+cdef class clip(_UnaryFunction):
+    """ Limit the values to the [lower, upper] interval.
+
+        Use None for an unbounded side.
+    """
+    cdef double lower
+    cdef double upper
+
+    def __init__(self, lower=None, upper=None):
+        self.lower = -math.INFINITY if lower is None else lower
+        self.upper = math.INFINITY if upper is None else upper
+        if self.lower > self.upper:
+            raise ValueError(f"Empty interval [{lower}, {upper}]")
+
+    def __repr__(self):
+        return f"clip({self.lower}, {self.upper})"
+
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef Py_ssize_t i
+        cdef double x
+        cdef double lower = self.lower
+        cdef double upper = self.upper
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            x = src[i]
+            if x < lower:
+                dst[i] = lower
+            elif x > upper:
+                dst[i] = upper
+            else:
+                dst[i] = x # Including NaN
+
+# ======================================================================
+# N-ary functions
+# ======================================================================
+cdef class _NaryFunction:
+    """ Baseclass for N-ary element-wise functions.
+
+        Sub-classes should implement the following methods:
+        - `__repr__()`
+        - `eval()`
+    """
+    def __call__(self, Serie ser, Column head, *tail):
+        # ------------------ prologue ------------------
+        cdef unsigned l = ser.rowcount
+        cdef double[::1] dst = mem.double_alloc(l)
+        cdef double *dst_ptr = &dst[0]
+
+        cdef unsigned n = len(tail) + 1
+        cdef const double **srcs = <const double**>mem.alloca(n*sizeof(double*))
+        cdef unsigned j
+        cdef Column col
+        cdef str col_names = head.name
+        srcs[0] = head.as_float_values()
+        for j, col in enumerate(tail, 1):
+            srcs[j] = col.as_float_values()
+            col_names += f", {col.name}"
+        # -------------- end of prologue ---------------
+
+        with nogil:
+            self.eval(l, dst_ptr, n, srcs)
+
+        # ------------------ epilogue ------------------
+        return Column.from_float_mv(
+                dst,
+                name=f"{self}({col_names})",
+                type="n"
+            )
+        # -------------- end of epilogue ---------------
+
+    cdef void eval(self, unsigned l, double* dst, unsigned n, const double** srcs) nogil:
+        pass
+
+cdef class Minimum(_NaryFunction):
+    """ Element-wise minimum of the arguments.
+    """
+    def __repr__(self):
+        return f"minimum"
+
+    cdef void eval(self, unsigned l, double* dst, unsigned n, const double** srcs) nogil:
+        cdef Py_ssize_t i
+        cdef unsigned j
+        cdef double acc, x
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            acc = srcs[0][i]
+            for j in range(1, n):
+                x = srcs[j][i]
+                if x < acc or isnan(x):
+                    acc = x
+            dst[i] = acc
+
+minimum = Minimum()
+
+cdef class Maximum(_NaryFunction):
+    """ Element-wise maximum of the arguments.
+    """
+    def __repr__(self):
+        return f"maximum"
+
+    cdef void eval(self, unsigned l, double* dst, unsigned n, const double** srcs) nogil:
+        cdef Py_ssize_t i
+        cdef unsigned j
+        cdef double acc, x
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
+            acc = srcs[0][i]
+            for j in range(1, n):
+                x = srcs[j][i]
+                if x > acc or isnan(x):
+                    acc = x
+            dst[i] = acc
+
+maximum = Maximum()
@@ -4,7 +4,7 @@ from .statx import *
 
 from fin.seq.column import Column
 from fin.seq.fc.window import naive_window
-from fin.seq.fc import proj
+from fin.seq.fc import mathx
 
 # ======================================================================
 # Statistics
@@ -40,18 +40,15 @@ def volatility(n, tau=1/252):
         tau: inverse of the number of periods in one year
     """
     stddev = stdev.s(n)
-    log = math.log
     k = math.sqrt(1/tau)
-    vol = lambda stddev : stddev*k
 
     def _volatility(serie, values):
-        rowcount = serie.rowcount
         # 1. Continuously compounded return for each period
-        ui = proj.map_change(lambda curr, prev: log(curr/prev))(serie, values)
+        ui = mathx.log(serie, values/values.shift(-1))
         # 2. Standard deviation
         result = stddev(serie, ui)
         # 3. Annualized values
-        return proj.map(vol)(serie, result)
+        return result*k
 
     return _volatility
 
@@ -13,7 +13,7 @@ cdef class var:
     cdef double correction
 
     cdef init(self, unsigned n, double correction)
-    cdef void eval(self, unsigned l, double* dst, const double* src)
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil
 
 cdef class stdev:
     """
@@ -22,5 +22,5 @@ cdef class stdev:
     cdef var delegate
 
     cdef init(self, unsigned n, var v)
-    cdef void eval(self, unsigned l, double* dst, const double* src)
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil
 
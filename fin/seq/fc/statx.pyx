@@ -61,17 +61,18 @@ cdef class var:
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src)
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst,
                 name=f"{self}, {col.name}",
-                type=col._type
+                type=col.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, double* dst, const double* src):
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
         cdef double a = self.a
         cdef double b = self.b
         cdef unsigned n = self.n
@@ -83,14 +84,15 @@ cdef class var:
 
         # degenerate case
         if l < n:
+            for i in range(l):
+                dst[i] = NaN
             return
 
         # general case
         while i < n-1:
-            v = src[i]
-            if not isnan(v):
-                sigma_ui += v
-                sigma_ui2 += v*v
+            if not isnan(src[i]):
+                sigma_ui += src[i]
+                sigma_ui2 += src[i]*src[i]
             else:
                 nones += 1
 
@@ -98,10 +100,9 @@ cdef class var:
             i += 1
 
         while i < l:
-            v = src[i]
-            if not isnan(v):
-                sigma_ui += v
-                sigma_ui2 += v*v
+            if not isnan(src[i]):
+                sigma_ui += src[i]
+                sigma_ui2 += src[i]*src[i]
             else:
                 nones += 1
 
@@ -109,10 +110,9 @@ cdef class var:
 
             i += 1
 
-            v = src[i-n]
-            if not isnan(v):
-                sigma_ui -= v
-                sigma_ui2 -= v*v
+            if not isnan(src[i-n]):
+                sigma_ui -= src[i-n]
+                sigma_ui2 -= src[i-n]*src[i-n]
             else:
                 nones -= 1
 
@@ -159,17 +159,19 @@ cdef class stdev:
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src)
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst,
                 name=f"{self}, {col.name}",
-                type=col._type
+                type=col.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, double* dst, const double* src):
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
+        cdef unsigned i
         self.delegate.eval(l, dst, src)
         for i in range(l):
             dst[i] = sqrt(dst[i])
@@ -10,7 +10,7 @@ from __future__ import print_function
 # function without that import.
 # See: https://stackoverflow.com/questions/19185338/cython-error-compiling-with-print-function-parameters
 
-from libc.math cimport sqrt
+from libc.math cimport sqrt, fabs
 import array
 from cpython cimport array
 
@@ -20,6 +20,9 @@ from fin.seq.column cimport Column
 
 from fin.seq.fc cimport statx
 
+from cython.parallel cimport prange
+from fin.config cimport parallel_threads
+
 from fin cimport mem
 
 # ======================================================================
@@ -38,23 +41,27 @@ cdef class sma:
         # ------------------ prologue ------------------
         cdef unsigned l = ser.rowcount
         cdef double[::1] dst = mem.double_alloc(l)
+        cdef double[::1] buffer = alloc(self.n)
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src, &buffer[0])
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst,
                 name=f"{self}, {col.name}",
-                type=col._type
+                type=col.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
-    cdef int eval(self, unsigned l, double* dst, const double* src):
+    cdef void eval(self, unsigned l, double* dst, const double* src, double* buffer) nogil:
+        """
+        `buffer` is a scratch buffer of `n` items initialized to NaN.
+        """
         cdef unsigned n = self.n
 
-        cdef double[::1] buffer = alloc(n)
         cdef unsigned idx=0
 
         cdef double acc = 0.0
@@ -103,17 +110,18 @@ cdef class ema:
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src)
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst,
                 name=f"{self}, {col.name}",
-                type=col._type
+                type=col.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, double* dst, const double* src):
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
         cdef unsigned n = self.n
         cdef double alpha = self.alpha
 
@@ -160,17 +168,18 @@ cdef class wilders:
         cdef const double *src = col.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst[0], src)
+        with nogil:
+            self.eval(l, &dst[0], src)
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst,
                 name=f"{self}, {col.name}",
-                type=col._type
+                type=col.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
-    cdef void eval(self, unsigned l, double* dst, const double* src):
+    cdef void eval(self, unsigned l, double* dst, const double* src) nogil:
         cdef unsigned n = self.n
         cdef double alpha = self.alpha
 
@@ -216,13 +225,14 @@ cdef class Tr:
         cdef const double *src3 = close.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst1[0], src1, src2, src3)
+        with nogil:
+            self.eval(l, &dst1[0], src1, src2, src3)
 
         # ------------------ epilogue ------------------
         return Column.from_float_mv(
                 dst1,
                 name=f"{self}, {high.name}, {low.name}, {close.name}",
-                type=close._type
+                type=close.get_float_type()
             )
         # -------------- end of epilogue ---------------
 
@@ -230,7 +240,7 @@ cdef class Tr:
             unsigned l,
             double *dst,
             const double* high, const double* low, const double* close
-            ):
+            ) nogil:
         cdef double yc = NaN # Yesterday's close
         cdef double th # today's high
         cdef double tl # today's low
@@ -247,8 +257,8 @@ cdef class Tr:
 
             tr = th-tl
             if not isnan(yc):
-                hc = abs(th-yc)
-                lc = abs(tl-yc)
+                hc = fabs(th-yc)
+                lc = fabs(tl-yc)
 
                 if hc > tr:
                     tr = hc
@@ -304,34 +314,35 @@ cdef class band:
         cdef const double *src2 = col2.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst1[0], &dst2[0], &dst3[0], src1, src2)
+        with nogil:
+            self.eval(l, &dst1[0], &dst2[0], &dst3[0], src1, src2)
 
         # ------------------ epilogue ------------------
         return (
                 Column.from_float_mv(
                     dst1,
                     name=f"{self}, {col1.name}:B",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
                 Column.from_float_mv(
                     dst2,
                     name=f"{self}, {col1.name}:M",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
                 Column.from_float_mv(
                     dst3,
                     name=f"{self}, {col1.name}:A",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
             )
         # -------------- end of epilogue ---------------
 
     cdef void eval(self, unsigned l,
             double *dst1, double *dst2, double *dst3,
-            const double *src1, const double *src2):
+            const double *src1, const double *src2) nogil:
         cdef double width = self._width
-        cdef unsigned i
-        for i in range(l):
+        cdef Py_ssize_t i
+        for i in prange(l, num_threads=parallel_threads(l), schedule="static"):
             dst1[i] = src1[i]-width*src2[i]
             dst2[i] = src1[i]
             dst3[i] = src1[i]+width*src2[i]
@@ -365,37 +376,44 @@ cdef class bband:
         cdef double[::1] dst1 = mem.double_alloc(l)
         cdef double[::1] dst2 = mem.double_alloc(l)
         cdef double[::1] dst3 = mem.double_alloc(l)
+        cdef double[::1] middle = alloc(l)
+        cdef double[::1] sd = alloc(l)
+        cdef double[::1] buffer = alloc(self._n)
         cdef const double *src1 = col1.as_float_values()
         # -------------- end of prologue ---------------
 
-        self.eval(l, &dst1[0], &dst2[0], &dst3[0], src1)
+        with nogil:
+            self.eval(l, &dst1[0], &dst2[0], &dst3[0], src1, &middle[0], &sd[0], &buffer[0])
 
         # ------------------ epilogue ------------------
         return (
                 Column.from_float_mv(
                     dst1,
                     name=f"B{self}, {col1.name}",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
                 Column.from_float_mv(
                     dst2,
                     name=f"SMA({self._n}), {col1.name}",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
                 Column.from_float_mv(
                     dst3,
                     name=f"T{self}, {col1.name}",
-                    type=col1._type
+                    type=col1.get_float_type()
                 ),
             )
         # -------------- end of epilogue ---------------
 
     cdef void eval(self, unsigned l,
             double *dst1, double *dst2, double *dst3,
-            const double *src1):
-        cdef double[::1] middle = alloc(l)
-        cdef double[::1] sd = alloc(l)
-        self._sma.eval(l, &middle[0], src1)
-        self._stdev.eval(l, &sd[0], &middle[0])
-        self._band.eval(l, dst1, dst2, dst3, &middle[0], &sd[0])
+            const double *src1,
+            double *middle, double *sd, double *buffer) nogil:
+        """
+        `middle` and `sd` are scratch buffers of `l` items. `buffer` is the
+        scratch buffer of the moving average (see `sma.eval()`).
+        """
+        self._sma.eval(l, middle, src1, buffer)
+        self._stdev.eval(l, sd, middle)
+        self._band.eval(l, dst1, dst2, dst3, middle, sd)
 
@@ -0,0 +1,12 @@
+from libc.stdint cimport int64_t, uint64_t
+
+# ======================================================================
+# Encodings
+# ======================================================================
+cdef enum:
+    PACK_DELTA  = 1 # Delta-of-delta of 64-bit integers, as zigzag varints
+    PACK_XOR    = 2 # XOR of consecutive doubles (Gorilla)
+    PACK_RLE    = 3 # Run-length encoded 64-bit words
+
+cdef bytes pack(int encoding, const void* values, Py_ssize_t n)
+cdef int unpack(int encoding, bytes data, void* dst, Py_ssize_t n) except -1
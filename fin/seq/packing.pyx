@@ -0,0 +1,340 @@
+"""
+Compression codecs for arrays of 64-bit values.
+
+All encodings are lossless. They work on the bit patterns of the values, so
+None markers (INT64_MIN, NaN) round-trip like any other value.
+"""
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from fin.mathx cimport clz64, ctz64
+
+cdef enum:
+    VARINT_MAX_SIZE = 10 # Bytes required to encode 64 bits, 7 bits at a time
+
+# ======================================================================
+# Variable-length integers
+# ======================================================================
+cdef inline uint64_t zigzag(uint64_t x) nogil:
+    """
+    Map signed integers to unsigned ones, so small magnitudes have short encodings.
+    """
+    return (x << 1) ^ <uint64_t>(<int64_t>x >> 63)
+
+cdef inline uint64_t unzigzag(uint64_t z) nogil:
+    return (z >> 1) ^ (~(z & 1) + 1)
+
+cdef inline Py_ssize_t varint_write(unsigned char* dst, Py_ssize_t pos, uint64_t value) nogil:
+    """
+    Write `value` as a LEB128 varint at `dst[pos]` and return the position past it.
+    """
+    while value >= 0x80:
+        dst[pos] = (value & 0x7f) | 0x80
+        pos += 1
+        value >>= 7
+    dst[pos] = <unsigned char>value
+
+    return pos + 1
+
+cdef inline Py_ssize_t varint_read(const unsigned char* src, Py_ssize_t size, Py_ssize_t pos, uint64_t* value) nogil:
+    """
+    Read a LEB128 varint at `src[pos]` and return the position past it, or -1 if
+    the data is truncated.
+    """
+    cdef uint64_t result = 0
+    cdef int shift = 0
+    cdef unsigned char byte
+    while pos < size and shift < 64:
+        byte = src[pos]
+        pos += 1
+        result |= <uint64_t>(byte & 0x7f) << shift
+        if byte < 0x80:
+            value[0] = result
+            return pos
+        shift += 7
+
+    return -1
+
+# ======================================================================
+# Bit streams
+# ======================================================================
+# Bits are written most significant first. `acc` holds the pending bits in its
+# `nbits` low-order bits.
+ctypedef struct bit_writer_t:
+    unsigned char*  dst
+    Py_ssize_t      pos
+    uint64_t        acc
+    int             nbits
+
+ctypedef struct bit_reader_t:
+    const unsigned char* src
+    Py_ssize_t      size
+    Py_ssize_t      pos
+    uint64_t        acc
+    int             nbits
+    bint            overrun # Set when reading past the end of the data
+
+cdef inline void bits_put(bit_writer_t* w, uint64_t value, int n) nogil:
+    # n <= 32
+    w.acc = (w.acc << n) | (value & ((<uint64_t>1 << n) - 1))
+    w.nbits += n
+    while w.nbits >= 8:
+        w.nbits -= 8
+        w.dst[w.pos] = <unsigned char>(w.acc >> w.nbits)
+        w.pos += 1
+
+cdef inline void bits_write(bit_writer_t* w, uint64_t value, int n) nogil:
+    """
+    Write the `n` low-order bits of `value`, with `n <= 64`.
+    """
+    if n > 32:
+        bits_put(w, value >> 32, n - 32)
+        n = 32
+    bits_put(w, value, n)
+
+cdef inline void bits_flush(bit_writer_t* w) nogil:
+    if w.nbits > 0:
+        w.dst[w.pos] = <unsigned char>(w.acc << (8 - w.nbits))
+        w.pos += 1
+        w.nbits = 0
+
+cdef inline uint64_t bits_get(bit_reader_t* r, int n) nogil:
+    # n <= 32
+    while r.nbits < n:
+        r.acc <<= 8
+        if r.pos < r.size:
+            r.acc |= r.src[r.pos]
+            r.pos += 1
+        else:
+            r.overrun = True
+        r.nbits += 8
+    r.nbits -= n
+
+    return (r.acc >> r.nbits) & ((<uint64_t>1 << n) - 1)
+
+cdef inline uint64_t bits_read(bit_reader_t* r, int n) nogil:
+    """
+    Read `n` bits, with `n <= 64`.
+    """
+    cdef uint64_t hi = 0
+    if n > 32:
+        hi = bits_get(r, n - 32) << 32
+        n = 32
+
+    return hi | bits_get(r, n)
+
+# ======================================================================
+# Delta-of-delta
+# ======================================================================
+# Each value is encoded as the difference between its delta to the previous
+# value and the previous delta. Regularly spaced timestamps have a null
+# delta-of-delta, encoded in a single byte.
+# The arithmetic wraps around, so any 64-bit value, including the INT64_MIN
+# None marker, round-trips exactly.
+cdef Py_ssize_t delta_encode(unsigned char* dst, const uint64_t* values, Py_ssize_t n) nogil:
+    cdef Py_ssize_t pos = 0
+    cdef uint64_t prev = 0
+    cdef uint64_t delta = 0
+    cdef uint64_t d
+    cdef Py_ssize_t i
+    for i in range(n):
+        d = values[i] - prev
+        pos = varint_write(dst, pos, zigzag(d - delta))
+        delta = d
+        prev = values[i]
+
+    return pos
+
+cdef int delta_decode(const unsigned char* src, Py_ssize_t size, uint64_t* dst, Py_ssize_t n) nogil:
+    cdef Py_ssize_t pos = 0
+    cdef uint64_t prev = 0
+    cdef uint64_t delta = 0
+    cdef uint64_t z
+    cdef Py_ssize_t i
+    for i in range(n):
+        pos = varint_read(src, size, pos, &z)
+        if pos < 0:
+            return -1
+        delta += unzigzag(z)
+        prev += delta
+        dst[i] = prev
+
+    return 0 if pos == size else -1
+
+# ======================================================================
+# XOR of consecutive floats
+# ======================================================================
+# The first value is stored verbatim. Each next value is XORed with the
+# previous one:
+#
+#   0                           same value
+#   10 <bits>                   the meaningful bits fit in the previous window
+#   11 <lead:5> <len-1:6> <bits> new window of `len` bits after `lead` zeros
+#
+# Slowly varying series (prices, levels) share their sign, exponent and
+# leading mantissa bits, so the meaningful bits are few.
+cdef Py_ssize_t xor_encode(unsigned char* dst, const uint64_t* values, Py_ssize_t n) nogil:
+    cdef bit_writer_t w
+    w.dst = dst
+    w.pos = 0
+    w.acc = 0
+    w.nbits = 0
+
+    cdef int lead = -1 # No window yet
+    cdef int trail = 0
+    cdef int l, t
+    cdef uint64_t prev, x
+    cdef Py_ssize_t i
+    for i in range(n):
+        if i == 0:
+            bits_write(&w, values[0], 64)
+            prev = values[0]
+            continue
+
+        x = values[i] ^ prev
+        prev = values[i]
+        if x == 0:
+            bits_write(&w, 0, 1)
+            continue
+
+        l = min(clz64(x), 31)
+        t = ctz64(x)
+        if lead >= 0 and l >= lead and t >= trail:
+            bits_write(&w, 0b10, 2)
+        else:
+            lead = l
+            trail = t
+            bits_write(&w, 0b11, 2)
+            bits_write(&w, lead, 5)
+            bits_write(&w, 64 - lead - trail - 1, 6)
+        bits_write(&w, x >> trail, 64 - lead - trail)
+
+    bits_flush(&w)
+    return w.pos
+
+cdef int xor_decode(const unsigned char* src, Py_ssize_t size, uint64_t* dst, Py_ssize_t n) nogil:
+    cdef bit_reader_t r
+    r.src = src
+    r.size = size
+    r.pos = 0
+    r.acc = 0
+    r.nbits = 0
+    r.overrun = False
+
+    cdef int lead = -1
+    cdef int trail = 0
+    cdef uint64_t prev = 0
+    cdef Py_ssize_t i
+    for i in range(n):
+        if i == 0:
+            prev = bits_read(&r, 64)
+        elif bits_get(&r, 1):
+            if bits_get(&r, 1):
+                lead = <int>bits_get(&r, 5)
+                trail = 64 - lead - <int>bits_get(&r, 6) - 1
+                if trail < 0:
+                    return -1
+            elif lead < 0:
+                return -1
+            prev ^= bits_read(&r, 64 - lead - trail) << trail
+        dst[i] = prev
+
+    return -1 if r.overrun else 0
+
+# ======================================================================
+# Run-length encoding
+# ======================================================================
+# Each run is stored as its length (a varint) followed by the 8 bytes of its value.
+cdef Py_ssize_t rle_encode(unsigned char* dst, const uint64_t* values, Py_ssize_t n) nogil:
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j
+    while i < n:
+        j = i + 1
+        while j < n and values[j] == values[i]:
+            j += 1
+        pos = varint_write(dst, pos, j - i)
+        memcpy(dst + pos, &values[i], sizeof(uint64_t))
+        pos += sizeof(uint64_t)
+        i = j
+
+    return pos
+
+cdef int rle_decode(const unsigned char* src, Py_ssize_t size, uint64_t* dst, Py_ssize_t n) nogil:
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t end
+    cdef uint64_t count, value
+    while i < n:
+        pos = varint_read(src, size, pos, &count)
+        if pos < 0 or count == 0 or count > <uint64_t>(n - i) or pos + <Py_ssize_t>sizeof(uint64_t) > size:
+            return -1
+        memcpy(&value, src + pos, sizeof(uint64_t))
+        pos += sizeof(uint64_t)
+        end = i + <Py_ssize_t>count
+        while i < end:
+            dst[i] = value
+            i += 1
+
+    return 0 if pos == size else -1
+
+# ======================================================================
+# Interface
+# ======================================================================
+cdef bytes pack(int encoding, const void* values, Py_ssize_t n):
+    """
+    Encode `n` 64-bit values (integers or doubles) using `encoding`.
+    """
+    cdef Py_ssize_t capacity
+    if encoding == PACK_DELTA:
+        capacity = n*VARINT_MAX_SIZE
+    elif encoding == PACK_XOR:
+        capacity = (n*(2 + 5 + 6 + 64) + 7)//8 + sizeof(uint64_t)
+    elif encoding == PACK_RLE:
+        capacity = n*(VARINT_MAX_SIZE + sizeof(uint64_t))
+    else:
+        raise ValueError(f"Unknown encoding {encoding}")
+
+    cdef unsigned char* buffer = <unsigned char*>malloc(capacity + 1)
+    if buffer == NULL:
+        raise MemoryError()
+
+    cdef Py_ssize_t size
+    try:
+        with nogil:
+            if encoding == PACK_DELTA:
+                size = delta_encode(buffer, <const uint64_t*>values, n)
+            elif encoding == PACK_XOR:
+                size = xor_encode(buffer, <const uint64_t*>values, n)
+            else:
+                size = rle_encode(buffer, <const uint64_t*>values, n)
+
+        return PyBytes_FromStringAndSize(<char*>buffer, size)
+    finally:
+        free(buffer)
+
+cdef int unpack(int encoding, bytes data, void* dst, Py_ssize_t n) except -1:
+    """
+    Decode `n` 64-bit values from `data` into `dst`.
+
+    Raise ValueError if `data` is not a valid encoding of `n` values.
+    """
+    cdef const unsigned char* src = <const unsigned char*><char*>data
+    cdef Py_ssize_t size = len(data)
+    cdef int status
+    with nogil:
+        if encoding == PACK_DELTA:
+            status = delta_decode(src, size, <uint64_t*>dst, n)
+        elif encoding == PACK_XOR:
+            status = xor_decode(src, size, <uint64_t*>dst, n)
+        elif encoding == PACK_RLE:
+            status = rle_decode(src, size, <uint64_t*>dst, n)
+        else:
+            status = -2
+
+    if status == -2:
+        raise ValueError(f"Unknown encoding {encoding}")
+    if status < 0:
+        raise ValueError("Corrupted compressed data")
+
+    return 0
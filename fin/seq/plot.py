@@ -475,11 +475,13 @@ class _GNUPlotVisitor:
         the_max = float("-inf")
         for element in elements:
             for column_name in element["data"]:
-                mi, ma = serie[column_name].data[0].min_max()
-                if mi < the_min:
-                    the_min = mi
-                if ma > the_max:
-                    the_max = ma
+                stats = serie[column_name].data[0].stats()
+                if stats.min is None:
+                    continue
+                if stats.min < the_min:
+                    the_min = stats.min
+                if stats.max > the_max:
+                    the_max = stats.max
 
         # case of columns containing only None values
         if the_max < the_min:
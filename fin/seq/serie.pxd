@@ -21,6 +21,7 @@ cdef class Serie:
     cdef Serie c_get_items(self, tuple idx)
     cdef Serie c_get_item_by_index(self, int idx)
     cdef Serie c_get_item_by_name(self, str name)
+    cdef Serie c_get_rows(self, slice rows)
 
 cdef inline Column columns_get_column_by_name(tuple columns, str name):
     cdef Column column
@@ -1,11 +1,18 @@
 from cpython cimport array
 from cpython.object cimport Py_EQ, Py_NE
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.stdint cimport int32_t, int64_t, uint64_t, INT64_MIN, INT64_MAX
+from libc.math cimport INFINITY
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
 import array
+import heapq
 
-from fin.mathx cimport ualloc
+from fin.mathx cimport isnan, ualloc, ctz64, popcount64
 from fin.containers cimport Tuple
-from fin.seq.column cimport Column
+from fin.seq.column cimport Column, ColumnStats, planes_words, planes_tail_mask
 from fin.seq.coltypes cimport parse_type_string, IGNORE
+from fin cimport mem
 from fin.seq.smachine cimport evaluate
 from fin.seq.ag.corex cimport CAggregateFunction
 
@@ -19,30 +26,54 @@ from fin.utils import collections as uc
 cdef array.array    int_array       = array.array("i", [])
 cdef array.array    unsigned_array  = array.array("I", [])
 cdef array.array    double_array    = array.array("d", [])
+cdef array.array    uchar_array     = array.array("B", [])
 
 cdef str SERIE_DEFAULT_NAME = ""
 
 # ======================================================================
 # Low-level helpers
 # ======================================================================
+cdef const int64_t* index_int_values(Column index):
+    """ Return the values of an index as an array of 64-bit integers.
+
+        Date/time indices are converted to their epoch representation on demand,
+        and compressed indices are decoded.
+        Return NULL if the index has no native integer representation.
+    """
+    if index._i_values is None:
+        if (not isinstance(index._type, coltypes.DateTimeBase)
+                and index._packed is None and index._selection is None):
+            return NULL
+        try:
+            index.as_int_values()
+        except (TypeError, ValueError):
+            return NULL
+
+    return &index._i_values[0]
+
 cdef bint check_index(Column index) except -1:
     """ Check that a column satisfies the prerequisites for an index.
 
         An index must have values sorted in a strictly ascending order.
     """
-
-    it = iter(index)
-    try:
-        prev = next(it)
-    except StopIteration:
+    if index.length == 0:
         raise TypeError(f"Zero-length index are not supported")
 
+    cdef ColumnStats stats = index.get_stats()
+    if stats.null_count:
+        raise TypeError(f"None is not allowed in an index")
+    if stats.ascending:
+        return True
+
+    # Locate the offending values to report them
+    it = iter(index)
+    prev = next(it)
     for item in it:
         if not item > prev:
             raise TypeError(f"Non monotonic index detected {prev} -> {item}")
         prev = item
 
-    return True
+    raise TypeError(f"Non monotonic index detected")
 
 # ----------------------------------------------------------------------
 # Factory functions
@@ -60,6 +91,19 @@ cdef Serie serie_bind(Column index, tuple columns, str name):
 
     return self
 
+def serie_from_pickle(Column index, tuple columns, str name):
+    """ Rebuild a pickled serie. See `Serie.__reduce__()`.
+
+        The index was checked when the original serie was created.
+    """
+    cdef Serie self = Serie.__new__(Serie)
+    self._index = index
+    self._data = columns
+    self.rowcount = len(index)
+    self.name = name
+
+    return self
+
 cdef Serie serie_create(exprs, str name):
     """ Recursively evaluate `exprs` to create a serie.
     """
@@ -191,33 +235,52 @@ cdef Serie serie_extend(Serie self, tuple exprs):
     return result
 
 cdef Serie serie_where(Serie self, tuple exprs):
-    cdef tuple conds = evaluate(self, exprs)
+    """ Return the rows for which all the conditions in `exprs` are true.
 
-    cdef array.array mapping_arr = ualloc(self.rowcount)
-    cdef unsigned* mapping = mapping_arr.data.as_uints
-    cdef unsigned end = self.rowcount
-
-    # Initialize the mapping table
-    cdef unsigned i = 0
-    for i in range(end):
-        mapping[i]=i
+        The conditions are combined as a ternary AND of their bitplanes, so rows
+        where a condition is false or None are dropped. The columns of the result
+        are gathered lazily, when they are used.
+    """
+    cdef tuple conds = evaluate(self, exprs)
+    cdef unsigned n = self.rowcount
+    cdef Py_ssize_t nwords = planes_words(n)
+    cdef uint64_t[::1] selected = mem.uint64_alloc(nwords)
+    cdef uint64_t* acc = &selected[0]
+    cdef const uint64_t* value
+    cdef Py_ssize_t w
+    for w in range(nwords):
+        acc[w] = ~<uint64_t>0
+    if nwords:
+        acc[nwords-1] &= planes_tail_mask(n)
 
-    cdef unsigned src, dst
     cdef Column cond
     for cond in conds:
-        dst = 0
-        for src in range(end):
-            if cond[mapping[src]]:
-                mapping[dst] = mapping[src]
-                dst += 1
-        end = dst
-        if end == 0:
-            break # No remaining rows
+        if len(cond) != n:
+            raise ValueError(f"Condition {cond.name} has {len(cond)} rows instead of {n}")
+        value = cond.as_ternary_planes() + nwords # Only true rows have their value bit set
+        for w in range(nwords):
+            acc[w] &= value[w]
+
+    cdef unsigned count = 0
+    for w in range(nwords):
+        count += popcount64(acc[w])
+    if count == n:
+        return self
+
+    cdef unsigned[::1] rows = ualloc(count)
+    cdef unsigned k = 0
+    cdef uint64_t word
+    for w in range(nwords):
+        word = acc[w]
+        while word:
+            rows[k] = (w << 6) + ctz64(word)
+            k += 1
+            word &= word - 1
 
     cdef Column column
     return serie_bind(
-            self._index.c_remap(end, mapping),
-            tuple([column.c_remap(end, mapping) for column in self._data]),
+            self._index.c_select(rows),
+            tuple([column.c_select(rows) for column in self._data]),
             self.name
             )
 
@@ -236,13 +299,20 @@ cdef Serie serie_lstrip(Serie self, tuple exprs):
     else:
         columns = evaluate(self, exprs)
 
-    none_row = (None,)*len(columns)
-    try:
-        for i, row in enumerate(zip(*columns)):
-            if row != none_row:
-                break
-    except TypeError:
-        pass
+    cdef Column column
+    i = 0
+    for column in columns:
+        if column.get_stats().null_count == 0:
+            # The first row is not empty
+            break
+    else:
+        none_row = (None,)*len(columns)
+        try:
+            for i, row in enumerate(zip(*columns)):
+                if row != none_row:
+                    break
+        except TypeError:
+            pass
 
     end = self.rowcount
     return serie_bind(
@@ -260,23 +330,23 @@ cdef int columns_get_strips(tuple columns, unsigned* buffer) except -1:
 
         The buffer is assumed to be large enough to hold all the strip limit indices.
         At worst, there is `(rowcount+1)` indices.
+
+        The rows are compared natively column by column (see `Column.c_mark_changes()`).
     """
-    rows = zip(*[col.py_values for col in columns])
-    cdef unsigned idx = 0
-    cdef tuple prev = None
-    cdef tuple row
-
-    for row in rows:
-        if prev is None:
-            prev = row
-        elif row != prev:
-            prev = row
+    cdef unsigned rowcount = (<Column>columns[0]).length if columns else 0
+    cdef array.array changes = array.clone(uchar_array, rowcount, zero=True)
+    cdef unsigned char* ptr = changes.data.as_uchars
+    cdef Column column
+    for column in columns:
+        column.c_mark_changes(ptr)
+
+    cdef unsigned idx
+    for idx in range(1, rowcount):
+        if ptr[idx]:
             buffer[0] = idx
             buffer += 1
 
-        idx += 1
-
-    buffer[0] = idx
+    buffer[0] = rowcount
 
 cdef Serie serie_group_by(Serie self, expr, tuple aggregate_expr):
     # Build the group column(s)
@@ -464,6 +534,56 @@ cdef class Serie:
     def union(self, other):
         return serie_union(self, other)
 
+    # ------------------------------------------------------------------
+    # Joins
+    # ------------------------------------------------------------------
+    @staticmethod
+    def join_many(series, how="inner", *, rename=True):
+        """
+        Join several series on their index in one pass.
+
+        `how` is "inner" (the keys present in all the series), "outer" (the
+        keys present in any serie), or "left" (the keys of the first serie).
+        Like the `&` and `|` operators, the data columns are prefixed with the
+        name of their serie if `rename` is true.
+        """
+        return serie_join_many(tuple(series), how, rename)
+
+    def asof_join(self, other, direction="backward", *, tolerance=None, rename=True):
+        """
+        Join the rows of the receiver with the nearest rows of `other`.
+
+        Each row is matched with the row of `other` having the same key or,
+        failing that, the last key before it ("backward"), the first key after
+        it ("forward"), or the closest of both ("nearest", backward on ties).
+        Rows without a match within `tolerance` get None values.
+
+        The tolerance is expressed in the units of the index: for date/time
+        indices, the number of days, seconds or microseconds of their resolution.
+        """
+        cdef Join join = c_asof_join(self, other, direction, tolerance, rename)
+        return serie_bind(join.index, (join.left+join.right), f"{self.name} ~ {other.name}")
+
+    def hash_join(self, other, on, how="inner", *, rename=True):
+        """
+        Join the rows of the receiver with the rows of `other` having the same
+        values in the key columns `on`, a column name or a tuple of names.
+
+        `how` is "inner" (the rows with a match), "left" (all the rows), "semi"
+        (the rows with a match, without the columns of `other`), or "anti" (the
+        rows without a match, without the columns of `other`). For the inner
+        and left joins, each row must match at most one row of `other`, and
+        the key columns of `other` are omitted. Keys containing None never match.
+
+        The rows keep the order of the receiver's index.
+        """
+        cdef Join join = c_hash_join(self, other, on, how, rename)
+        return serie_bind(
+                join.index,
+                (join.left+join.right),
+                f"{self.name}{HASH_JOIN_KINDS[how][1]}{other.name}"
+            )
+
     # ------------------------------------------------------------------
     # Column expression evaluation
     # ------------------------------------------------------------------
@@ -473,6 +593,19 @@ cdef class Serie:
         """
         return evaluate(self, expr)
 
+    def memory_usage(self, deep=False):
+        """
+        Return a dictionary mapping each column's name (index included) to the
+        number of bytes used by all the representations it currently holds.
+
+        See `Column.memory_usage()` for the meaning of the `deep` parameter.
+        """
+        result = {}
+        for column in (self._index, *self._data):
+            result[column.name] = sum(column.memory_usage(deep).values())
+
+        return result
+
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -550,6 +683,16 @@ cdef class Serie:
         pres = Presentation(format="CSV", heading=True)
         return pres(self)
 
+    # ------------------------------------------------------------------
+    # Pickling
+    # ------------------------------------------------------------------
+    def __reduce__(self):
+        """ Support for pickle.
+
+            The columns are pickled individually (see `Column.__reduce_ex__()`).
+        """
+        return (serie_from_pickle, (self._index, self._data, self.name))
+
     # ------------------------------------------------------------------
     # Subscript
     # ------------------------------------------------------------------
@@ -561,6 +704,8 @@ cdef class Serie:
             return self.c_get_item_by_index(selector)
         elif t is str:
             return self.c_get_item_by_name(selector)
+        elif t is slice:
+            return self.c_get_rows(selector)
         else:
             raise TypeError(f"serie indices cannot be {t}")
 
@@ -587,6 +732,23 @@ cdef class Serie:
     cdef Serie c_get_item_by_name(self, str name):
         return serie_bind(self._index, (serie_get_column_by_name(self, name),), self.name)
 
+    cdef Serie c_get_rows(self, slice rows):
+        """
+        Return a serie with the rows selected by `rows`.
+
+        With a step, for example `ser[::5]`, the columns are zero-copy strided
+        views of the receiver's columns.
+        """
+        if rows.step is not None and rows.step <= 0:
+            raise ValueError(f"Row slices must have a positive step ({rows})")
+
+        cdef Column column
+        return serie_bind(
+                self._index[rows],
+                tuple([ column[rows] for column in self._data ]),
+                self.name
+        )
+
     def clear(self):
         """
         Return a serie containing only the index.
@@ -735,6 +897,18 @@ ctypedef unsigned (*join_build_mapping_t)(
         unsigned *mappingA,
         unsigned *mappingB)
 
+ctypedef unsigned (*join_build_mapping_i64_t)(
+        unsigned lenA, const int64_t* indexA,
+        unsigned lenB, const int64_t* indexB,
+        unsigned *mappingA,
+        unsigned *mappingB) nogil
+
+ctypedef unsigned (*join_build_mapping_f64_t)(
+        unsigned lenA, const double* indexA,
+        unsigned lenB, const double* indexB,
+        unsigned *mappingA,
+        unsigned *mappingB) nogil
+
 cdef unsigned inner_join_build_mapping(
         unsigned lenA, Tuple indexA,
         unsigned lenB, Tuple indexB,
@@ -909,89 +1083,1101 @@ cdef unsigned left_outer_join_build_mapping(
 
     return n
 
+# ----------------------------------------------------------------------
+# Mapping builders for indices stored as native numbers.
+#
+# Valid indices contain no null value, so, unlike their Tuple-based
+# counterparts, these functions do not check for them.
+#
+# When one index is much longer than the other, its runs of rows that do not
+# match are crossed using an exponential search, so joining a short index
+# with a long one costs O(short·log(long)) comparisons.
+# ----------------------------------------------------------------------
+ctypedef fused join_key_t:
+    int64_t
+    double
+
+cdef enum:
+    GALLOP_RATIO = 16 # Gallop over an index at least that many times longer than the other
+
+cdef inline bint join_gallops(unsigned lenA, unsigned lenB) nogil:
+    """ Return True if the joins should gallop over an index of lenA rows.
+    """
+    return lenA > GALLOP_RATIO*<Py_ssize_t>lenB
+
+cdef inline unsigned gallop(const join_key_t* values, unsigned lo, unsigned hi, join_key_t key) nogil:
+    """ Return the position of the first value not less than `key` in the
+        sorted range values[lo:hi].
+
+        The range is probed at exponentially increasing distances from `lo`, then
+        the last gap is bisected.
+    """
+    cdef Py_ssize_t start = lo
+    cdef Py_ssize_t end = lo
+    cdef Py_ssize_t step = 1
+    cdef Py_ssize_t mid
+    while end < hi and values[end] < key:
+        start = end + 1
+        end += step
+        step <<= 1
+    if end > hi:
+        end = hi
+
+    # Here, values[start-1] < key <= values[end]
+    while start < end:
+        mid = start + (end - start)//2
+        if values[mid] < key:
+            start = mid + 1
+        else:
+            end = mid
+
+    return <unsigned>start
+
+cdef unsigned inner_join_build_mapping_native(
+        unsigned lenA, const join_key_t* indexA,
+        unsigned lenB, const join_key_t* indexB,
+        unsigned *mappingA,
+        unsigned *mappingB) nogil:
+    """
+    Build the translation table for the inner join of indexA and indexB.
+
+    See inner_join_build_mapping().
+    """
+    cdef bint gallopA = join_gallops(lenA, lenB)
+    cdef bint gallopB = join_gallops(lenB, lenA)
+    cdef unsigned n = 0
+    cdef unsigned posA = 0
+    cdef unsigned posB = 0
+
+    while posA < lenA and posB < lenB:
+        if indexA[posA] < indexB[posB]:
+            posA = gallop(indexA, posA+1, lenA, indexB[posB]) if gallopA else posA+1
+        elif indexB[posB] < indexA[posA]:
+            posB = gallop(indexB, posB+1, lenB, indexA[posA]) if gallopB else posB+1
+        else:
+            mappingA[n] = posA
+            mappingB[n] = posB
+            n += 1
+            posA += 1
+            posB += 1
+
+    return n
+
+cdef unsigned full_outer_join_build_mapping_native(
+        unsigned lenA, const join_key_t* indexA,
+        unsigned lenB, const join_key_t* indexB,
+        unsigned *mappingA,
+        unsigned *mappingB) nogil:
+    """
+    Build the translation table for the full outer join of indexA and indexB.
+
+    See full_outer_join_build_mapping().
+    """
+    cdef bint gallopA = join_gallops(lenA, lenB)
+    cdef bint gallopB = join_gallops(lenB, lenA)
+    cdef unsigned n = 0
+    cdef unsigned posA = 0
+    cdef unsigned posB = 0
+    cdef unsigned end
+
+    while posA < lenA and posB < lenB:
+        if indexA[posA] < indexB[posB]:
+            end = gallop(indexA, posA+1, lenA, indexB[posB]) if gallopA else posA+1
+            while posA < end:
+                mappingA[n] = posA
+                mappingB[n] = -1
+                n += 1
+                posA += 1
+        elif indexB[posB] < indexA[posA]:
+            end = gallop(indexB, posB+1, lenB, indexA[posA]) if gallopB else posB+1
+            while posB < end:
+                mappingA[n] = -1
+                mappingB[n] = posB
+                n += 1
+                posB += 1
+        else:
+            mappingA[n] = posA
+            mappingB[n] = posB
+            n += 1
+            posA += 1
+            posB += 1
+
+    while posA < lenA:
+        mappingA[n] = posA
+        mappingB[n] = -1
+        n += 1
+        posA += 1
+
+    while posB < lenB:
+        mappingA[n] = -1
+        mappingB[n] = posB
+        n += 1
+        posB += 1
+
+    return n
+
+cdef unsigned left_outer_join_build_mapping_native(
+        unsigned lenA, const join_key_t* indexA,
+        unsigned lenB, const join_key_t* indexB,
+        unsigned *mappingA,
+        unsigned *mappingB) nogil:
+    """
+    Build the translation table for the left outer join of indexA and indexB.
+
+    See left_outer_join_build_mapping().
+    """
+    cdef bint gallopA = join_gallops(lenA, lenB)
+    cdef bint gallopB = join_gallops(lenB, lenA)
+    cdef unsigned n = 0
+    cdef unsigned posA = 0
+    cdef unsigned posB = 0
+    cdef unsigned end
+
+    while posA < lenA and posB < lenB:
+        if indexA[posA] < indexB[posB]:
+            end = gallop(indexA, posA+1, lenA, indexB[posB]) if gallopA else posA+1
+            while posA < end:
+                mappingA[n] = posA
+                mappingB[n] = -1
+                n += 1
+                posA += 1
+        elif indexB[posB] < indexA[posA]:
+            posB = gallop(indexB, posB+1, lenB, indexA[posA]) if gallopB else posB+1
+        else:
+            mappingA[n] = posA
+            mappingB[n] = posB
+            n += 1
+            posA += 1
+            posB += 1
+
+    while posA < lenA:
+        mappingA[n] = posA
+        mappingB[n] = -1
+        n += 1
+        posA += 1
+
+    return n
+
+cdef join_key_t[::1] combine_native(
+        const join_key_t* indexA, const join_key_t* indexB,
+        unsigned n, const unsigned *mappingA, const unsigned *mappingB):
+    """ Combine two arrays of native numbers using the given mapping.
+
+        This is the native counterpart of Tuple.combine().
+    """
+    cdef join_key_t[::1] result
+    if join_key_t is double:
+        result = mem.double_alloc(n)
+    else:
+        result = mem.int64_alloc(n)
+
+    cdef unsigned MISSING = -1
+    cdef unsigned i
+    cdef unsigned idxA
+    for i in range(n):
+        idxA = mappingA[i]
+        result[i] = indexA[idxA] if idxA != MISSING else indexB[mappingB[i]]
+
+    return result
+
+cdef const double* index_float_values(Column index):
+    """ Return the values of an index as an array of doubles.
+
+        Return NULL if the index has no native floating point representation.
+    """
+    if index._py_values is not None and not isinstance(index._type, coltypes.Float):
+        return NULL
+    if isinstance(index._type, (coltypes.Integer, coltypes.DateTimeBase)):
+        return NULL # Compared as integers, or not at all
+    try:
+        return index.as_float_values()
+    except (TypeError, ValueError):
+        return NULL
+
+cdef bint join_native_index_compatible(Column indexA, Column indexB):
+    """ Return True if the two indices can be compared using their native
+        representation.
+
+        Date/time indices must share the same type (and hence the same resolution).
+    """
+    cdef object typeA = indexA._type
+    cdef object typeB = indexB._type
+
+    if isinstance(typeA, coltypes.DateTimeBase) or isinstance(typeB, coltypes.DateTimeBase):
+        return type(typeA) is type(typeB)
+
+    return True
+
+cdef list join_rename_columns(str name, columns, bint rename):
+    """ Return the `columns` of the serie `name` for a join.
+
+        The columns are prefixed with the name of the serie if:
+        1. `rename` is true
+        2. the serie has a non-empty name
+    """
+    cdef Column column
+    if not rename or len(name) == 0:
+        return list(columns)
+
+    cdef str prefix = name + ":"
+    return [ column.c_rename(prefix + column.name) for column in columns ]
+
 cdef list join_engine_remap_columns(list columns, unsigned n, unsigned* mapping):
     cdef Column column
 
     return [ column.c_remap(n, mapping) for column in columns ]
 
 cdef Join c_inner_join(Serie serA, Serie serB, bint rename):
-    return join_engine(inner_join_build_mapping, serA, serB, rename)
+    return join_engine(inner_join_build_mapping,
+            inner_join_build_mapping_native[int64_t],
+            inner_join_build_mapping_native[double],
+            serA, serB, rename)
 
 cdef Join c_full_outer_join(Serie serA, Serie serB, bint rename):
-    return join_engine(full_outer_join_build_mapping, serA, serB, rename)
+    return join_engine(full_outer_join_build_mapping,
+            full_outer_join_build_mapping_native[int64_t],
+            full_outer_join_build_mapping_native[double],
+            serA, serB, rename)
 
 cdef Join c_left_outer_join(Serie serA, Serie serB, bint rename):
-    return join_engine(left_outer_join_build_mapping, serA, serB, rename)
+    return join_engine(left_outer_join_build_mapping,
+            left_outer_join_build_mapping_native[int64_t],
+            left_outer_join_build_mapping_native[double],
+            serA, serB, rename)
 
 cdef Join join_engine(
         join_build_mapping_t join_build_mapping,
+        join_build_mapping_i64_t join_build_mapping_i64,
+        join_build_mapping_f64_t join_build_mapping_f64,
         Serie serA, Serie serB,
         bint rename):
     """
     Create a join from two series.
-    """
-    cdef Tuple indexA = serA._index.get_py_values()
-    cdef Tuple indexB = serB._index.get_py_values()
 
-    cdef unsigned lenA = len(indexA)
-    cdef unsigned lenB = len(indexB)
+    If both indices have a native 64-bit integer representation, the join is
+    performed on it. Otherwise, if both have a native floating point
+    representation, the join is performed on it. Otherwise, we fallback to
+    comparing Python objects.
+    """
+    cdef unsigned lenA = serA._index.length
+    cdef unsigned lenB = serB._index.length
 
     # In the worst case, a join can have lenA+lenB rows (case of a full outer join with
     # completely disjoined indices).
     cdef unsigned lenMapping = lenA+lenB
     cdef array.array mappingA = array.clone(unsigned_array, lenMapping, zero=False)
     cdef array.array mappingB = array.clone(unsigned_array, lenMapping, zero=False)
+    cdef unsigned* mapA = mappingA.data.as_uints
+    cdef unsigned* mapB = mappingB.data.as_uints
+
+    cdef const int64_t* valuesA = NULL
+    cdef const int64_t* valuesB = NULL
+    cdef const double* floatsA = NULL
+    cdef const double* floatsB = NULL
+    if join_native_index_compatible(serA._index, serB._index):
+        valuesA = index_int_values(serA._index)
+        if valuesA != NULL:
+            valuesB = index_int_values(serB._index)
+        if valuesB == NULL:
+            floatsA = index_float_values(serA._index)
+            if floatsA != NULL:
+                floatsB = index_float_values(serB._index)
+
+    cdef Tuple indexA
+    cdef Tuple indexB
+    cdef unsigned n
+    if valuesB != NULL:
+        with nogil:
+            n = join_build_mapping_i64(lenA, valuesA, lenB, valuesB, mapA, mapB)
+    elif floatsB != NULL:
+        with nogil:
+            n = join_build_mapping_f64(lenA, floatsA, lenB, floatsB, mapA, mapB)
+    else:
+        indexA = serA._index.get_py_values()
+        indexB = serB._index.get_py_values()
+        n = join_build_mapping(lenA, indexA, lenB, indexB, mapA, mapB)
 
-    cdef unsigned n = join_build_mapping(
-            lenA, indexA,
-            lenB, indexB,
-            mappingA.data.as_uints, mappingB.data.as_uints,
-        )
+    # Build the index
+    cdef Column joinIndex
+    if valuesB != NULL:
+        joinIndex = Column.from_int_mv(
+                combine_native(valuesA, valuesB, n, mapA, mapB),
+                name=serA._index.name,
+                type=serA._index.type,
+            )
+    elif floatsB != NULL:
+        joinIndex = Column.from_float_mv(
+                combine_native(floatsA, floatsB, n, mapA, mapB),
+                name=serA._index.name,
+                type=serA._index.type,
+            )
+    else:
+        joinIndex = Column.from_sequence_noconv(
+                Tuple.combine(indexA, indexB, n, mapA, mapB),
+                name=serA._index.name,
+                type=serA._index.type,
+            )
 
     # shrink array to their correct length:
     array.resize(mappingA, n)
     array.resize(mappingB, n)
 
-    # Build the index
-    cdef unsigned i
-    cdef Tuple joinIndex = Tuple.combine(indexA, indexB,
-            n, mappingA.data.as_uints, mappingB.data.as_uints)
+    cdef list colA = join_rename_columns(serA.name, serA._data, rename)
+    cdef list colB = join_rename_columns(serB.name, serB._data, rename)
 
-    # Rename the columns if:
-    # 1. `rename` is true
-    # 2. the serie has a non-empty name
-    cdef Column column
-    cdef str prefix
-    cdef list colA = list(serA._data)
-    cdef list colB = list(serB._data)
-    if rename:
-        prefix = serA.name
-        if len(prefix) > 0:
-            prefix += ":"
-            colA = [
-                    column.c_rename(prefix + column.name) for column in colA
-                    ]
-
-        prefix = serB.name
-        if len(prefix) > 0:
-            prefix += ":"
-            colB = [
-                    column.c_rename(prefix + column.name) for column in colB
-                    ]
     # Build the left and right series
     cdef list leftColumns = join_engine_remap_columns(colA, n, mappingA.data.as_uints)
     cdef list rightColumns = join_engine_remap_columns(colB, n, mappingB.data.as_uints)
 
     return Join.create(
-            Column.from_sequence_noconv(
-                joinIndex,
-                name=serA._index.name,
-                type=serA._index.type,
-            ),
+            joinIndex,
             tuple(leftColumns),
             tuple(rightColumns)
     )
 
+# ----------------------------------------------------------------------
+# K-way joins
+# ----------------------------------------------------------------------
+# `join_many()` builds the index of the result with a single k-way merge of
+# the input indices, driven by a binary heap of the inputs ordered by their
+# current key. Then each input is mapped onto that index with a left outer
+# join, so its columns are remapped only once.
+cdef enum:
+    JOIN_INNER = 0
+    JOIN_OUTER = 1
+    JOIN_LEFT = 2
+
+cdef dict JOIN_MANY_KINDS = {
+    # how: (kind, separator of the serie names)
+    "inner": (JOIN_INNER, " & "),
+    "outer": (JOIN_OUTER, " | "),
+    "left": (JOIN_LEFT, " ⟕ "),
+}
+
+cdef inline void heap_sift_down(
+        unsigned* heap, unsigned size, unsigned i,
+        const join_key_t** indices, const unsigned* pos) nogil:
+    """ Restore the heap property below heap[i]. The heap holds input numbers
+        ordered by the current key of each input.
+    """
+    cdef unsigned item = heap[i]
+    cdef join_key_t key = indices[item][pos[item]]
+    cdef unsigned child
+    while True:
+        child = 2*i + 1
+        if child >= size:
+            break
+        if child + 1 < size and indices[heap[child+1]][pos[heap[child+1]]] < indices[heap[child]][pos[heap[child]]]:
+            child += 1
+        if not indices[heap[child]][pos[heap[child]]] < key:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = item
+
+cdef unsigned join_many_merge_native(
+        int how, unsigned k,
+        const unsigned* lengths, const join_key_t** indices,
+        unsigned* scratch,
+        join_key_t* keys) nogil:
+    """
+    Merge the `k` sorted `indices` and store the keys of the join in `keys`.
+
+    `scratch` must hold 2*k integers. `keys` is *assumed* to be large enough
+    to store the result.
+
+    Return the actual number of row in the resulting join.
+    """
+    cdef unsigned* pos = scratch
+    cdef unsigned* heap = scratch + k
+    cdef unsigned size = 0
+    cdef unsigned s
+    for s in range(k):
+        pos[s] = 0
+        if lengths[s] > 0:
+            heap[size] = s
+            size += 1
+        elif how == JOIN_INNER or (how == JOIN_LEFT and s == 0):
+            return 0
+
+    cdef unsigned i = size//2
+    while i > 0:
+        i -= 1
+        heap_sift_down(heap, size, i, indices, pos)
+
+    cdef unsigned n = 0
+    cdef unsigned count
+    cdef bint in_first
+    cdef bint last = False
+    cdef join_key_t key
+    while size > 0 and not last:
+        s = heap[0]
+        key = indices[s][pos[s]]
+        count = 0
+        in_first = False
+        while size > 0:
+            s = heap[0]
+            if key < indices[s][pos[s]]:
+                break
+            count += 1
+            in_first |= s == 0
+            pos[s] += 1
+            if pos[s] == lengths[s]:
+                # Once this input is exhausted, no other row can be kept
+                last |= how == JOIN_INNER or (how == JOIN_LEFT and s == 0)
+                size -= 1
+                heap[0] = heap[size]
+            if size > 0:
+                heap_sift_down(heap, size, 0, indices, pos)
+
+        if how == JOIN_OUTER or (how == JOIN_INNER and count == k) or (how == JOIN_LEFT and in_first):
+            keys[n] = key
+            n += 1
+
+    return n
+
+cdef list join_many_merge(int how, list indices):
+    """
+    Merge the sorted Tuple `indices` and return the keys of the join.
+
+    This is the object-based counterpart of join_many_merge_native().
+    """
+    cdef unsigned k = len(indices)
+    cdef list pos = [0]*k
+    cdef list heap = []
+    cdef Tuple index
+    cdef unsigned s
+    for s, index in enumerate(indices):
+        if len(index) > 0:
+            heap.append((index[0], s))
+        elif how == JOIN_INNER or (how == JOIN_LEFT and s == 0):
+            return []
+    heapq.heapify(heap)
+
+    cdef list keys = []
+    cdef unsigned count
+    cdef bint in_first
+    cdef bint last = False
+    while heap and not last:
+        key = heap[0][0]
+        count = 0
+        in_first = False
+        while heap:
+            current, s = heap[0]
+            if key < current:
+                break
+            count += 1
+            in_first |= s == 0
+            index = indices[s]
+            pos[s] += 1
+            if pos[s] == len(index):
+                last |= how == JOIN_INNER or (how == JOIN_LEFT and s == 0)
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (index[pos[s]], s))
+
+        if how == JOIN_OUTER or (how == JOIN_INNER and count == k) or (how == JOIN_LEFT and in_first):
+            keys.append(key)
+
+    return keys
+
+cdef Serie serie_join_many(tuple series, str how, bint rename):
+    """
+    Join all the `series` in one pass. See `Serie.join_many()`.
+    """
+    cdef int kind
+    cdef str separator
+    try:
+        kind, separator = JOIN_MANY_KINDS[how]
+    except KeyError:
+        raise ValueError(f"Unknown join {how!r}. Expected one of {', '.join(JOIN_MANY_KINDS)}") from None
+
+    cdef unsigned k = len(series)
+    if k == 0:
+        raise ValueError(f"join_many() requires at least one serie")
+
+    cdef Serie serie
+    cdef Column first = (<Serie>series[0])._index
+    cdef list indices = [ serie._index for serie in series ]
+    cdef unsigned capacity = first.length if kind != JOIN_OUTER else sum([ serie.rowcount for serie in series ])
+    cdef unsigned[::1] lengths = ualloc(k)
+    cdef unsigned[::1] scratch = ualloc(2*k)
+    cdef unsigned s
+    for s in range(k):
+        lengths[s] = (<Column>indices[s]).length
+
+    # Look for a native representation shared by all the indices
+    cdef const int64_t** values = <const int64_t**>PyMem_Malloc(k*sizeof(int64_t*))
+    cdef const double** floats = <const double**>PyMem_Malloc(k*sizeof(double*))
+    cdef Column index
+    cdef bint native_int = True
+    cdef bint native_float = True
+    cdef unsigned n
+    cdef int64_t[::1] int_keys
+    cdef double[::1] float_keys
+    cdef Column joinIndex
+    try:
+        if values == NULL or floats == NULL:
+            raise MemoryError()
+
+        for s in range(k):
+            index = indices[s]
+            if not join_native_index_compatible(first, index):
+                native_int = native_float = False
+                break
+            if native_int:
+                values[s] = index_int_values(index)
+                native_int = values[s] != NULL
+
+        if native_float and not native_int:
+            for s in range(k):
+                floats[s] = index_float_values(indices[s])
+                if floats[s] == NULL:
+                    native_float = False
+                    break
+
+        if native_int:
+            int_keys = mem.int64_alloc(capacity)
+            with nogil:
+                n = join_many_merge_native[int64_t](kind, k, &lengths[0], values, &scratch[0], &int_keys[0])
+            if n == 0:
+                joinIndex = Column.from_sequence_noconv((), name=first.name, type=first.type)
+            else:
+                if n < capacity:
+                    int_keys = int_keys[:n].copy()
+                joinIndex = Column.from_int_mv(int_keys, name=first.name, type=first.type)
+        elif native_float:
+            float_keys = mem.double_alloc(capacity)
+            with nogil:
+                n = join_many_merge_native[double](kind, k, &lengths[0], floats, &scratch[0], &float_keys[0])
+            if n == 0:
+                joinIndex = Column.from_sequence_noconv((), name=first.name, type=first.type)
+            else:
+                if n < capacity:
+                    float_keys = float_keys[:n].copy()
+                joinIndex = Column.from_float_mv(float_keys, name=first.name, type=first.type)
+        else:
+            joinIndex = Column.from_sequence_noconv(
+                    join_many_merge(kind, [ index.get_py_values() for index in indices ]),
+                    name=first.name,
+                    type=first.type,
+                )
+    finally:
+        PyMem_Free(values)
+        PyMem_Free(floats)
+
+    # Map each input onto the joined index
+    cdef Serie joined = serie_bind(joinIndex, (), separator.join([ serie.name for serie in series ]))
+    cdef list columns = []
+    cdef Column column
+    cdef Join join
+    for serie in series:
+        join = c_left_outer_join(joined, serie, False)
+        if rename and len(serie.name) > 0:
+            columns.extend([ column.c_rename(f"{serie.name}:{column.name}") for column in join.right ])
+        else:
+            columns.extend(join.right)
+
+    return serie_bind(joinIndex, tuple(columns), joined.name)
+
+# ----------------------------------------------------------------------
+# As-of joins
+# ----------------------------------------------------------------------
+# An as-of join keeps the rows of the left serie, and matches each of them
+# with the row of the right serie whose key is the nearest one in the
+# requested direction.
+cdef enum:
+    ASOF_BACKWARD = 0 # The last key not greater than the left key
+    ASOF_FORWARD = 1  # The first key not less than the left key
+    ASOF_NEAREST = 2  # The closest of the two above, the backward one on ties
+
+cdef dict ASOF_DIRECTIONS = {
+    "backward": ASOF_BACKWARD,
+    "forward": ASOF_FORWARD,
+    "nearest": ASOF_NEAREST,
+}
+
+cdef inline bint asof_within(join_key_t hi, join_key_t lo, join_key_t tolerance) nogil:
+    """ Return True if hi - lo <= tolerance, assuming lo <= hi.
+    """
+    if join_key_t is int64_t:
+        # Unsigned arithmetic does not overflow on distant keys
+        return <uint64_t>hi - <uint64_t>lo <= <uint64_t>tolerance
+    else:
+        return hi - lo <= tolerance
+
+cdef inline bint asof_prefer_backward(join_key_t key, join_key_t before, join_key_t after) nogil:
+    """ Return True if key - before <= after - key, assuming before <= key <= after.
+    """
+    if join_key_t is int64_t:
+        return <uint64_t>key - <uint64_t>before <= <uint64_t>after - <uint64_t>key
+    else:
+        return key - before <= after - key
+
+cdef void asof_join_build_mapping_native(
+        int direction, join_key_t tolerance,
+        unsigned lenA, const join_key_t* indexA,
+        unsigned lenB, const join_key_t* indexB,
+        unsigned *mappingB) nogil:
+    """
+    Build the translation table from the rows of indexA to the matching rows
+    of indexB for an as-of join. Rows without a match within `tolerance` are
+    mapped to -1.
+    """
+    cdef bint gallopB = join_gallops(lenB, lenA)
+    cdef unsigned MISSING = -1
+    cdef unsigned posB = 0 # First row of indexB not less than the current key
+    cdef unsigned match
+    cdef unsigned posA
+    cdef join_key_t key
+    for posA in range(lenA):
+        key = indexA[posA]
+        if gallopB:
+            posB = gallop(indexB, posB, lenB, key)
+        else:
+            while posB < lenB and indexB[posB] < key:
+                posB += 1
+
+        if posB < lenB and not key < indexB[posB]:
+            match = posB # Exact match
+        elif direction == ASOF_BACKWARD:
+            match = posB - 1 if posB > 0 and asof_within(key, indexB[posB-1], tolerance) else MISSING
+        elif direction == ASOF_FORWARD:
+            match = posB if posB < lenB and asof_within(indexB[posB], key, tolerance) else MISSING
+        elif posB == 0:
+            match = posB if posB < lenB and asof_within(indexB[posB], key, tolerance) else MISSING
+        elif posB == lenB or asof_prefer_backward(key, indexB[posB-1], indexB[posB]):
+            match = posB - 1 if asof_within(key, indexB[posB-1], tolerance) else MISSING
+        else:
+            match = posB if asof_within(indexB[posB], key, tolerance) else MISSING
+
+        mappingB[posA] = match
+
+cdef int asof_join_build_mapping(
+        int direction, object tolerance,
+        unsigned lenA, Tuple indexA,
+        unsigned lenB, Tuple indexB,
+        unsigned *mappingB) except -1:
+    """
+    Build the translation table for an as-of join of indices stored as
+    Python objects. See asof_join_build_mapping_native().
+
+    The distances between keys are only computed for the nearest direction or
+    when a tolerance is given.
+    """
+    cdef unsigned MISSING = -1
+    cdef unsigned posB = 0
+    cdef unsigned match
+    cdef unsigned posA
+    for posA in range(lenA):
+        key = indexA[posA]
+        while posB < lenB and indexB[posB] < key:
+            posB += 1
+
+        if posB < lenB and not key < indexB[posB]:
+            match = posB
+        elif direction == ASOF_BACKWARD or (direction == ASOF_NEAREST and posB == lenB):
+            match = posB - 1 if posB > 0 else MISSING
+        elif direction == ASOF_FORWARD or posB == 0:
+            match = posB if posB < lenB else MISSING
+        elif key - indexB[posB-1] <= indexB[posB] - key:
+            match = posB - 1
+        else:
+            match = posB
+
+        if tolerance is not None and match != MISSING and abs(indexB[match] - key) > tolerance:
+            match = MISSING
+        mappingB[posA] = match
+
+    return 0
+
+cdef Join c_asof_join(Serie serA, Serie serB, str direction, object tolerance, bint rename):
+    """
+    Create an as-of join from two series. The rows of the join are those of serA.
+    """
+    cdef int kind
+    try:
+        kind = ASOF_DIRECTIONS[direction]
+    except KeyError:
+        raise ValueError(f"Unknown direction {direction!r}. Expected one of {', '.join(ASOF_DIRECTIONS)}") from None
+    if tolerance is not None and not tolerance >= 0:
+        raise ValueError(f"The tolerance must be a non-negative number, not {tolerance!r}")
+
+    cdef unsigned lenA = serA._index.length
+    cdef unsigned lenB = serB._index.length
+    cdef array.array mapping = array.clone(unsigned_array, lenA, zero=False)
+    cdef unsigned* mapB = mapping.data.as_uints
+
+    cdef const int64_t* valuesA = NULL
+    cdef const int64_t* valuesB = NULL
+    cdef const double* floatsA = NULL
+    cdef const double* floatsB = NULL
+    if join_native_index_compatible(serA._index, serB._index):
+        valuesA = index_int_values(serA._index)
+        if valuesA != NULL:
+            valuesB = index_int_values(serB._index)
+        if valuesB == NULL:
+            floatsA = index_float_values(serA._index)
+            if floatsA != NULL:
+                floatsB = index_float_values(serB._index)
+
+    # The tolerance is expressed in the units of the native representation
+    cdef int64_t int_tolerance = INT64_MAX
+    cdef double float_tolerance = INFINITY
+    if valuesB != NULL:
+        if tolerance is not None and tolerance < INT64_MAX:
+            int_tolerance = int(tolerance // 1)
+        with nogil:
+            asof_join_build_mapping_native(kind, int_tolerance, lenA, valuesA, lenB, valuesB, mapB)
+    elif floatsB != NULL:
+        if tolerance is not None:
+            float_tolerance = tolerance
+        with nogil:
+            asof_join_build_mapping_native(kind, float_tolerance, lenA, floatsA, lenB, floatsB, mapB)
+    else:
+        asof_join_build_mapping(kind, tolerance,
+                lenA, serA._index.get_py_values(),
+                lenB, serB._index.get_py_values(),
+                mapB)
+
+    cdef list colA = join_rename_columns(serA.name, serA._data, rename)
+    cdef list colB = join_rename_columns(serB.name, serB._data, rename)
+
+    return Join.create(
+            serA._index,
+            tuple(colA),
+            tuple(join_engine_remap_columns(colB, lenA, mapB))
+    )
+
+# ----------------------------------------------------------------------
+# Hash joins
+# ----------------------------------------------------------------------
+# Hash joins match the rows of two series on the values of one or several
+# key columns, in any order. The rows of the left serie keep their order, so
+# the result is still indexed by the left index. For the inner and left
+# joins, each left row must match at most one right row.
+#
+# Keys with a common native representation (integers, dates, floats,
+# categories) are hashed and compared as 64-bit words. Other keys are
+# compared as Python objects. Keys containing None never match.
+cdef enum:
+    HASH_INNER = 0
+    HASH_LEFT = 1
+    HASH_SEMI = 2 # The left rows with a match
+    HASH_ANTI = 3 # The left rows without a match
+
+cdef dict HASH_JOIN_KINDS = {
+    # how: (kind, separator of the serie names)
+    "inner": (HASH_INNER, " & "),
+    "left": (HASH_LEFT, " ⟕ "),
+    "semi": (HASH_SEMI, " ⋉ "),
+    "anti": (HASH_ANTI, " ▷ "),
+}
+
+cdef inline uint64_t hash_combine(uint64_t h, uint64_t word) nogil:
+    # The finalizer of MurmurHash3
+    h ^= word + <uint64_t>0x9e3779b97f4a7c15 + (h << 6) + (h >> 2)
+    h ^= h >> 33
+    h *= <uint64_t>0xff51afd7ed558ccd
+    h ^= h >> 33
+    h *= <uint64_t>0xc4ceb9fe1a85ec53
+    h ^= h >> 33
+
+    return h
+
+cdef bint hash_key_words(
+        Column a, Column b,
+        uint64_t* wordsA, uint64_t* wordsB,
+        unsigned char* nullA, unsigned char* nullB) except -1:
+    """
+    Store the values of the key columns `a` and `b` as 64-bit words that are
+    equal when the values are, and flag the rows holding None.
+
+    Return False if the two columns have no common native representation.
+    """
+    cdef object typeA = a._type
+    cdef object typeB = b._type
+    cdef unsigned lenA = a.length
+    cdef unsigned lenB = b.length
+    cdef unsigned i
+    cdef const int64_t* intsA
+    cdef const int64_t* intsB
+    cdef const double* floatsA
+    cdef const double* floatsB
+    cdef const int32_t* codesA
+    cdef const int32_t* codesB
+    cdef int32_t[::1] translation
+    cdef int32_t[::1] canonical
+    cdef dict codes
+
+    if isinstance(typeA, coltypes.Categorical) and isinstance(typeB, coltypes.Categorical):
+        try:
+            codesA = a.as_codes()
+            codesB = b.as_codes()
+        except TypeError:
+            return False
+
+        # Translate the codes of a and b into the code of the first category of a
+        # comparing equal (categories like 1 and 1.0 are distinct). -2 matches nothing
+        codes = {}
+        for code, value in enumerate(a._categories):
+            codes.setdefault(value, code)
+        canonical = array.array("i", [ codes[value] for value in a._categories ])
+        translation = array.array("i", [ codes.get(value, -2) for value in b._categories ])
+        for i in range(lenA):
+            nullA[i] |= codesA[i] < 0
+            wordsA[i] = <uint64_t>canonical[codesA[i]] if codesA[i] >= 0 else 0
+        for i in range(lenB):
+            nullB[i] |= codesB[i] < 0
+            wordsB[i] = <uint64_t>translation[codesB[i]] if codesB[i] >= 0 else 0
+
+    elif (isinstance(typeA, (coltypes.Integer, coltypes.DateTimeBase))
+            and isinstance(typeB, (coltypes.Integer, coltypes.DateTimeBase))):
+        if not join_native_index_compatible(a, b):
+            return False
+        intsA = a.as_int_values()
+        intsB = b.as_int_values()
+        for i in range(lenA):
+            nullA[i] |= intsA[i] == INT64_MIN
+            wordsA[i] = <uint64_t>intsA[i]
+        for i in range(lenB):
+            nullB[i] |= intsB[i] == INT64_MIN
+            wordsB[i] = <uint64_t>intsB[i]
+
+    elif isinstance(typeA, coltypes.Float) and isinstance(typeB, coltypes.Float):
+        floatsA = a.as_float_values()
+        floatsB = b.as_float_values()
+        for i in range(lenA):
+            nullA[i] |= isnan(floatsA[i])
+            wordsA[i] = float_key_word(floatsA[i])
+        for i in range(lenB):
+            nullB[i] |= isnan(floatsB[i])
+            wordsB[i] = float_key_word(floatsB[i])
+
+    else:
+        return False
+
+    return True
+
+cdef inline uint64_t float_key_word(double value) nogil:
+    if value == 0.0:
+        value = 0.0 # -0.0 == 0.0
+    return (<uint64_t*>&value)[0]
+
+cdef int hash_join_match_native(
+        unsigned lenA, unsigned lenB, unsigned nkeys,
+        const uint64_t* wordsA, const uint64_t* wordsB,
+        const unsigned char* nullA, const unsigned char* nullB,
+        unsigned* matches) nogil:
+    """
+    Store in `matches` the row of B matching each row of A, or -1.
+
+    `wordsA` and `wordsB` hold the `nkeys` key columns of each side, one after
+    the other. The hash table is built on the shorter side.
+
+    Return the number of rows of A matching several rows of B.
+    """
+    cdef unsigned MISSING = -1
+    cdef bint build_on_a = lenA < lenB
+    cdef unsigned nbuild = lenA if build_on_a else lenB
+    cdef unsigned nprobe = lenB if build_on_a else lenA
+    cdef const uint64_t* wbuild = wordsA if build_on_a else wordsB
+    cdef const uint64_t* wprobe = wordsB if build_on_a else wordsA
+    cdef const unsigned char* nbuild_null = nullA if build_on_a else nullB
+    cdef const unsigned char* nprobe_null = nullB if build_on_a else nullA
+
+    cdef unsigned nslots = 1
+    while nslots < 2*nbuild:
+        nslots <<= 1
+    cdef uint64_t mask = nslots - 1
+
+    cdef uint64_t* hbuild = <uint64_t*>malloc(nbuild*sizeof(uint64_t))
+    cdef unsigned* heads = <unsigned*>malloc(nslots*sizeof(unsigned))
+    cdef unsigned* chain = <unsigned*>malloc(nbuild*sizeof(unsigned))
+    if hbuild == NULL or heads == NULL or chain == NULL:
+        free(hbuild)
+        free(heads)
+        free(chain)
+        return -1
+
+    cdef unsigned i, j, r, c
+    cdef unsigned duplicates = 0
+    cdef uint64_t h
+    cdef bint equal
+    memset(heads, 0xff, nslots*sizeof(unsigned))
+    for i in range(lenA):
+        matches[i] = MISSING
+
+    # Chain the rows of the build side in ascending order in each slot
+    r = nbuild
+    while r > 0:
+        r -= 1
+        if nbuild_null[r]:
+            continue
+        h = 0
+        for c in range(nkeys):
+            h = hash_combine(h, wbuild[c*nbuild + r])
+        hbuild[r] = h
+        chain[r] = heads[h & mask]
+        heads[h & mask] = r
+
+    for i in range(nprobe):
+        if nprobe_null[i]:
+            continue
+        h = 0
+        for c in range(nkeys):
+            h = hash_combine(h, wprobe[c*nprobe + i])
+
+        j = heads[h & mask]
+        while j != MISSING:
+            if hbuild[j] == h:
+                equal = True
+                for c in range(nkeys):
+                    if wbuild[c*nbuild + j] != wprobe[c*nprobe + i]:
+                        equal = False
+                        break
+                if equal:
+                    # (a, b) is (j, i) or (i, j), depending on the build side
+                    if build_on_a:
+                        if matches[j] != MISSING:
+                            duplicates += 1
+                        matches[j] = i
+                    else:
+                        if matches[i] != MISSING:
+                            duplicates += 1
+                        matches[i] = j
+            j = chain[j]
+
+    free(hbuild)
+    free(heads)
+    free(chain)
+
+    return duplicates
+
+cdef unsigned hash_join_match(list keysA, list keysB, unsigned* matches) except? 0:
+    """
+    Python object counterpart of hash_join_match_native(). The keys are lists
+    of tuples.
+    """
+    cdef unsigned MISSING = -1
+    cdef unsigned lenA = len(keysA)
+    cdef unsigned lenB = len(keysB)
+    cdef unsigned duplicates = 0
+    cdef unsigned i
+    cdef dict table = {}
+    for i in range(lenA):
+        matches[i] = MISSING
+
+    if lenA < lenB:
+        for i, key in enumerate(keysA):
+            if None not in key:
+                table.setdefault(key, []).append(i)
+        for i, key in enumerate(keysB):
+            for j in table.get(key, ()):
+                if matches[j] != MISSING:
+                    duplicates += 1
+                matches[j] = i
+    else:
+        for i, key in enumerate(keysB):
+            if None not in key:
+                table.setdefault(key, []).append(i)
+        for i, key in enumerate(keysA):
+            rows = table.get(key, ())
+            if rows:
+                matches[i] = rows[0]
+                duplicates += len(rows) - 1
+
+    return duplicates
+
+cdef Join c_hash_join(Serie serA, Serie serB, object on, str how, bint rename):
+    """
+    Create a hash join of two series on the columns named in `on`.
+
+    The right columns are omitted from the semi and anti joins, as are the
+    right key columns from the other joins.
+    """
+    cdef int kind
+    try:
+        kind, _ = HASH_JOIN_KINDS[how]
+    except KeyError:
+        raise ValueError(f"Unknown join {how!r}. Expected one of {', '.join(HASH_JOIN_KINDS)}") from None
+
+    cdef tuple names = (on,) if isinstance(on, str) else tuple(on)
+    if not names:
+        raise ValueError(f"A hash join requires at least one key column")
+    cdef list columnsA = [ serie_get_column_by_name(serA, name) for name in names ]
+    cdef list columnsB = [ serie_get_column_by_name(serB, name) for name in names ]
+
+    cdef unsigned lenA = serA.rowcount
+    cdef unsigned lenB = serB.rowcount
+    cdef unsigned nkeys = len(names)
+    cdef array.array matches = array.clone(unsigned_array, lenA, zero=False)
+    cdef unsigned* matchesB = matches.data.as_uints
+
+    # Try the native representations first
+    cdef uint64_t[::1] wordsA = mem.uint64_alloc(nkeys*lenA)
+    cdef uint64_t[::1] wordsB = mem.uint64_alloc(nkeys*lenB)
+    cdef array.array nullA = array.clone(uchar_array, lenA, zero=True)
+    cdef array.array nullB = array.clone(uchar_array, lenB, zero=True)
+    cdef bint native = True
+    cdef unsigned c
+    for c in range(nkeys):
+        if not hash_key_words(columnsA[c], columnsB[c],
+                &wordsA[c*lenA], &wordsB[c*lenB],
+                nullA.data.as_uchars, nullB.data.as_uchars):
+            native = False
+            break
+
+    cdef int duplicates
+    cdef Column column
+    if native:
+        with nogil:
+            duplicates = hash_join_match_native(lenA, lenB, nkeys,
+                    &wordsA[0], &wordsB[0],
+                    nullA.data.as_uchars, nullB.data.as_uchars,
+                    matchesB)
+        if duplicates < 0:
+            raise MemoryError()
+    else:
+        duplicates = hash_join_match(
+                list(zip(*[ column.get_py_values() for column in columnsA ])),
+                list(zip(*[ column.get_py_values() for column in columnsB ])),
+                matchesB)
+
+    if duplicates and (kind == HASH_INNER or kind == HASH_LEFT):
+        raise ValueError(f"{duplicates} row(s) of {serA.name!r} match several rows of {serB.name!r}")
+
+    # Select the left rows
+    cdef unsigned MISSING = -1
+    cdef unsigned i
+    cdef unsigned n = 0
+    cdef unsigned[::1] rows
+    if kind == HASH_LEFT:
+        n = lenA
+    else:
+        rows = ualloc(lenA)
+        for i in range(lenA):
+            if (matchesB[i] == MISSING) == (kind == HASH_ANTI):
+                rows[n] = i
+                matchesB[n] = matchesB[i]
+                n += 1
+
+    cdef list colA = join_rename_columns(serA.name, serA._data, rename)
+    cdef list colB = []
+    if kind == HASH_INNER or kind == HASH_LEFT:
+        colB = [ column for column in serB._data if column.get_name() not in names ]
+        colB = join_engine_remap_columns(join_rename_columns(serB.name, colB, rename), n, matchesB)
+
+    if n == lenA:
+        return Join.create(serA._index, tuple(colA), tuple(colB))
+
+    rows = rows[:n]
+    return Join.create(
+            serA._index.c_select(rows),
+            tuple([ column.c_select(rows) for column in colA ]),
+            tuple(colB)
+    )
+
 # ======================================================================
 # Set operations
 # ======================================================================
@@ -0,0 +1,220 @@
+"""
+Shared-memory transport for columns and series.
+
+`share()` pickles an object, placing the native buffers of its columns in a
+`multiprocessing.shared_memory` segment. The returned handle is small and can
+be sent to other processes, where `Shared.attach()` rebuilds the object over
+the segment without copying the buffers.
+"""
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_WRITABLE, PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    SharedMemory = None # Python < 3.8
+
+from fin cimport mem
+
+# ======================================================================
+# Segment views
+# ======================================================================
+cdef class SegmentView:
+    """
+    A window over a shared memory segment, exported through the buffer
+    protocol as an array of bytes.
+
+    The segment stays mapped as long as the window, or a buffer exported from
+    it, is alive.
+    """
+    cdef object         segment
+    cdef Py_buffer      base
+    cdef Py_ssize_t     offset
+    cdef Py_ssize_t     shape[1]
+    cdef Py_ssize_t     itemsize
+
+    def __cinit__(self, segment, Py_ssize_t offset, Py_ssize_t nbytes):
+        PyObject_GetBuffer(segment.buf, &self.base, PyBUF_WRITABLE)
+        if offset < 0 or nbytes < 0 or offset + nbytes > self.base.len:
+            PyBuffer_Release(&self.base)
+            raise ValueError(f"Window [{offset}, {offset+nbytes}) out of the segment")
+
+        self.segment = segment
+        self.offset = offset
+        self.shape[0] = nbytes
+        self.itemsize = 1
+
+    def __dealloc__(self):
+        if self.segment is not None:
+            PyBuffer_Release(&self.base)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        buffer.buf = <char*>self.base.buf + self.offset
+        buffer.len = self.shape[0]
+        buffer.readonly = 0
+        buffer.itemsize = 1
+        buffer.format = NULL
+        if (flags & PyBUF_FORMAT) == PyBUF_FORMAT:
+            buffer.format = b"B"
+        buffer.ndim = 1
+        buffer.shape = self.shape if (flags & PyBUF_ND) == PyBUF_ND else NULL
+        buffer.strides = &self.itemsize if (flags & PyBUF_STRIDES) == PyBUF_STRIDES else NULL
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+        buffer.obj = self
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        pass
+
+# ======================================================================
+# Shared objects
+# ======================================================================
+class Shared:
+    """
+    A handle to an object stored in a shared memory segment.
+
+    Handles are picklable. The process that created the segment (or the last
+    one using it) is responsible for calling `unlink()`. Objects already
+    attached remain valid after the segment is unlinked.
+    """
+    def __init__(self, name, payload, layout, segment=None):
+        self.name = name
+        self.payload = payload  # The pickled object, without its out-of-band buffers
+        self.layout = layout    # (offset, nbytes) of each buffer in the segment
+        self._segment = segment
+
+    def __getstate__(self):
+        return (self.name, self.payload, self.layout)
+
+    def __setstate__(self, state):
+        self.name, self.payload, self.layout = state
+        self._segment = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+
+    def __repr__(self):
+        return f"Shared(name={self.name!r}, buffers={len(self.layout)})"
+
+    def attach(self):
+        """
+        Rebuild the shared object. Its native buffers are mapped from the segment.
+        """
+        if self._segment is None:
+            self._segment = SharedMemory(self.name)
+
+        buffers = [ SegmentView(self._segment, offset, nbytes) for offset, nbytes in self.layout ]
+        return pickle.loads(self.payload, buffers=buffers)
+
+    def take(self):
+        """
+        Rebuild the shared object, then unlink the segment.
+        """
+        try:
+            return self.attach()
+        finally:
+            self.unlink()
+
+    def unlink(self):
+        """
+        Request the destruction of the segment. The memory is released once no
+        process maps it anymore.
+        """
+        if self._segment is None:
+            try:
+                self._segment = SharedMemory(self.name)
+            except FileNotFoundError:
+                return # Already unlinked
+
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:
+            pass
+
+def share(obj):
+    """
+    Copy `obj` (typically a column or a serie) to a new shared memory segment
+    and return a `Shared` handle.
+
+    The buffers exported through pickle protocol 5 are placed in the segment,
+    aligned on `fin.mem.ALIGNMENT` bytes. The other data stay in the handle.
+
+    Shared memory requires Python 3.8 or later.
+    """
+    if SharedMemory is None:
+        raise NotImplementedError("Shared memory requires Python 3.8 or later")
+
+    buffers = []
+    payload = pickle.dumps(obj, 5, buffer_callback=buffers.append)
+
+    raws = [ buffer.raw() for buffer in buffers ]
+    layout = []
+    size = 0
+    for raw in raws:
+        offset = (size + mem.ALIGNMENT - 1) & ~(mem.ALIGNMENT - 1)
+        layout.append((offset, raw.nbytes))
+        size = offset + raw.nbytes
+
+    segment = SharedMemory(create=True, size=max(size, 1))
+    try:
+        for (offset, nbytes), raw in zip(layout, raws):
+            segment.buf[offset:offset+nbytes] = raw
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+
+    return Shared(segment.name, payload, tuple(layout), segment)
+
+# ======================================================================
+# Process pools
+# ======================================================================
+def apply_shared(fn, handle):
+    """
+    Worker side of `map_series()`.
+    """
+    return share(fn(handle.attach()))
+
+def map_series(fn, series, workers=None):
+    """
+    Return the list of `fn(serie)` for each serie of `series`, computed in a pool
+    of `workers` processes (by default, one per CPU).
+
+    The series and the results are transferred through shared memory, so the
+    native buffers of their columns are never copied through a pipe. `fn` must
+    be picklable, for example a module-level function.
+
+    The workers are started by a fork server rather than forked from the calling
+    process: the OpenMP runtime does not survive a fork once a parallel region
+    has run.
+    """
+    inputs = [ share(serie) for serie in series ]
+    futures = []
+    results = []
+    try:
+        try:
+            with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+                ) as pool:
+                for handle in inputs:
+                    futures.append(pool.submit(apply_shared, fn, handle))
+            # Leaving the pool waits for all the submitted tasks
+        finally:
+            for handle in inputs:
+                handle.unlink()
+
+        for future in futures:
+            results.append(future.result().take())
+    except BaseException:
+        # Unlink the segments created for the results not taken yet
+        for future in futures[len(results):]:
+            if not future.cancelled() and future.exception() is None:
+                future.result().unlink()
+        raise
+
+    return results
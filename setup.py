@@ -1,34 +1,73 @@
+import os
+import tempfile
+
+from distutils.ccompiler import new_compiler
 from distutils.core import setup
+from distutils.errors import CompileError, LinkError
+from distutils.sysconfig import customize_compiler
 from Cython.Build import cythonize
 
+def openmp_flags():
+    """ Return the compiler and linker flags enabling OpenMP.
+
+        Return an empty list if the compiler does not support OpenMP. The
+        parallel kernels are then compiled as serial loops.
+    """
+    flags = [ "-fopenmp" ]
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "omp.c")
+        with open(src, "w") as f:
+            f.write("#include <omp.h>\nint main(void) { return omp_get_max_threads() < 1; }\n")
+        try:
+            objects = compiler.compile([ src ], output_dir=tmpdir, extra_postargs=flags)
+            compiler.link_executable(objects, os.path.join(tmpdir, "omp"), extra_postargs=flags)
+        except (CompileError, LinkError):
+            return []
+
+    return flags
+
+ext_modules = cythonize([
+    "fin/config.pyx",
+    "fin/containers/tuple.pyx",
+    "fin/mathx.pyx",
+    "fin/mem.pyx",
+    "fin/model/kellyx.pyx",
+    "fin/model/solvers/particle.pyx",
+    "fin/model/solvers/random.pyx",
+    "fin/model/solvers/solver.pyx",
+    "fin/seq/ag/corex.pyx",
+    "fin/seq/ag/statx.pyx",
+    "fin/seq/coltypes.pyx",
+    "fin/seq/column.pyx",
+    "fin/seq/fc/compx.pyx",
+    "fin/seq/fc/core.pyx",
+    "fin/seq/fc/logic.pyx",
+    "fin/seq/fc/mathx.pyx",
+    "fin/seq/fc/statx.pyx",
+    "fin/seq/fc/tix.pyx",
+    "fin/seq/fc/windowx.pyx",
+    "fin/seq/packing.pyx",
+    "fin/seq/serie.pyx",
+    "fin/seq/shm.pyx",
+    "fin/seq/smachine.pyx",
+    "fin/tuplex.pyx",
+    "fin/utils/ternary.pyx",
+
+    "tests/fin/tuplex.pyx",
+    "tests/fin/utils/ternary.pyx",
+    ],
+    annotate=True,
+    compiler_directives={'language_level' : "3"},
+)
+
+OPENMP_FLAGS = openmp_flags()
+for ext in ext_modules:
+    ext.extra_compile_args += OPENMP_FLAGS
+    ext.extra_link_args += OPENMP_FLAGS
+    ext.include_dirs.append(".") # For the headers in fin/
+
 setup(
-    ext_modules = cythonize([
-        "fin/containers/tuple.pyx",
-        "fin/mathx.pyx",
-        "fin/mem.pyx",
-        "fin/model/kellyx.pyx",
-        "fin/model/solvers/particle.pyx",
-        "fin/model/solvers/random.pyx",
-        "fin/model/solvers/solver.pyx",
-        "fin/seq/ag/corex.pyx",
-        "fin/seq/ag/statx.pyx",
-        "fin/seq/coltypes.pyx",
-        "fin/seq/column.pyx",
-        "fin/seq/fc/compx.pyx",
-        "fin/seq/fc/core.pyx",
-        "fin/seq/fc/logic.pyx",
-        "fin/seq/fc/statx.pyx",
-        "fin/seq/fc/tix.pyx",
-        "fin/seq/fc/windowx.pyx",
-        "fin/seq/serie.pyx",
-        "fin/seq/smachine.pyx",
-        "fin/tuplex.pyx",
-        "fin/utils/ternary.pyx",
-
-        "tests/fin/tuplex.pyx",
-        "tests/fin/utils/ternary.pyx",
-        ],
-        annotate=True,
-        compiler_directives={'language_level' : "3"},
-    )
+    ext_modules = ext_modules
 )
@@ -1,3 +1,4 @@
+import pickle
 import sys
 import unittest
 
@@ -108,6 +109,26 @@ class TestTuple(unittest.TestCase):
                 self.assertIsInstance(s, Tuple)
                 self.assertSequenceEqual(s, seq[start:stop])
 
+    def test_slice_step(self):
+        n = 100
+        seq = tuple(range(n))
+        t = Tuple.tst_create(n, seq)
+        for sl in (slice(None, None, 5), slice(3, 50, 7), slice(None, None, -1), slice(90, 10, -3)):
+            with self.subTest(sl=sl):
+                s = t[sl]
+
+                self.assertIsInstance(s, Tuple)
+                self.assertSequenceEqual(s, seq[sl])
+
+    def test_pickle(self):
+        seq = (1, "a", None, (2.5, None))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                t = pickle.loads(pickle.dumps(Tuple.tst_from_sequence(seq), protocol))
+
+                self.assertIsInstance(t, Tuple)
+                self.assertSequenceEqual(t, seq)
+
     def test_remap(self):
         a = object()
         b = object()
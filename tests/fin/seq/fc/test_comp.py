@@ -41,3 +41,24 @@ class TestComp(unittest.TestCase):
             with self.subTest(desc=desc):
                 actual = fct(serie, *cols)
                 self.assertSequenceEqual(tuple(actual),  expected)
+
+    def test_equal(self):
+        values = ( "AAPL", "MSFT", None, "AAPL", "IBM" )
+        serie = Serie.create(Column.from_sequence(range(5), name="T"))
+        testcases = (
+                ( "categorical", "c", "AAPL", ( True, False, None, True, False ) ),
+                ( "object", None, "AAPL", ( True, False, None, True, False ) ),
+                ( "missing", "c", "GOOG", ( False, False, None, False, False ) ),
+                ( "none", "c", None, ( None, None, None, None, None ) ),
+            )
+        for desc, type, value, expected in testcases:
+            with self.subTest(desc=desc):
+                col = Column.from_sequence(values, type=type)
+                actual = comp.equal(value)(serie, col)
+                self.assertSequenceEqual(tuple(actual), expected)
+
+    def test_equal_categories_of_distinct_types(self):
+        serie = Serie.create(Column.from_sequence(range(4), name="T"))
+        col = Column.from_sequence([ 1, 1.0, True, 2 ], type="c")
+        actual = comp.equal(1)(serie, col)
+        self.assertSequenceEqual(tuple(actual), ( True, True, True, False ))
@@ -84,3 +84,23 @@ class TestLogicalOperators(unittest.TestCase):
             ),
         )
 
+
+    def test_multiple_words(self):
+        # The truth tables repeated over several 64-row words, with a partial last word
+        a = (T, F, N)*50
+        b = (T, T, T, F, F, F, N, N, N)*16 + (F, N, T, F, N, T)
+        self.check(logic.all,
+            ("150 rows", a, b, [ F if F in (x, y) else N if N in (x, y) else T for x, y in zip(a, b) ]),
+        )
+        self.check(logic.any,
+            ("150 rows", a, b, [ T if T in (x, y) else N if N in (x, y) else F for x, y in zip(a, b) ]),
+        )
+
+    def test_eval_not_implemented(self):
+        class Incomplete(logic._LogicalFunction):
+            def __repr__(self):
+                return "incomplete"
+
+        ser = Serie.create(Column.from_sequence(range(3)))
+        with self.assertRaises(NotImplementedError):
+            Incomplete()(ser, Column.from_sequence([ T, F, N ], type=Ternary()))
@@ -0,0 +1,74 @@
+import unittest
+import math
+
+from testing import assertions
+
+from fin.seq.column import Column
+from fin.seq.fc import mathx
+
+from tests.fin.seq.fc import utilities
+
+# ======================================================================
+# Element-wise math functions
+# ======================================================================
+class TestUnaryFunctions(unittest.TestCase, assertions.ExtraTests):
+    def test_unary_functions(self):
+        INPUT = [ 4.0, 1.0, None, 0.25, 2.5 ]
+        testcases = (
+            ("log", mathx.log, math.log),
+            ("exp", mathx.exp, math.exp),
+            ("sqrt", mathx.sqrt, math.sqrt),
+            ("power", mathx.power(3), lambda x: x**3),
+            ("clip", mathx.clip(0.5, 3), lambda x: min(max(x, 0.5), 3)),
+            ("clip-lower", mathx.clip(lower=1), lambda x: max(x, 1)),
+        )
+        for desc, fct, ref in testcases:
+            with self.subTest(desc=desc):
+                actual = utilities.apply(self, fct, INPUT)
+                self.assertFloatSequenceEqual(actual.py_values, [
+                    None if x is None else ref(x) for x in INPUT
+                ])
+
+    def test_fabs_and_sign(self):
+        INPUT = [ -2.0, 0.0, None, 3.5 ]
+        self.assertFloatSequenceEqual(utilities.apply(self, mathx.fabs, INPUT).py_values,
+                [ 2.0, 0.0, None, 3.5 ])
+        self.assertFloatSequenceEqual(utilities.apply(self, mathx.sign, INPUT).py_values,
+                [ -1.0, 0.0, None, 1.0 ])
+
+    def test_domain_errors(self):
+        actual = utilities.apply(self, mathx.log, [ -1.0, 0.0 ])
+        self.assertTrue(math.isnan(actual.f_values[0]))
+        self.assertEqual(actual.f_values[1], -math.inf)
+
+    def test_invalid_clip(self):
+        with self.assertRaises(ValueError):
+            mathx.clip(2, 1)
+
+class TestNaryFunctions(unittest.TestCase, assertions.ExtraTests):
+    def test_minimum_maximum(self):
+        A = [ 1.0, 5.0, None, 3.0 ]
+        B = [ 2.0, 4.0, 1.0, None ]
+        C = [ 0.0, 6.0, 1.0, 3.0 ]
+
+        self.assertFloatSequenceEqual(utilities.apply(self, mathx.minimum, A, B, C).py_values,
+                [ 0.0, 4.0, None, None ])
+        self.assertFloatSequenceEqual(utilities.apply(self, mathx.maximum, A, B, C).py_values,
+                [ 2.0, 6.0, None, None ])
+        self.assertFloatSequenceEqual(utilities.apply(self, mathx.maximum, A).py_values, A)
+
+    def test_star_import_keeps_builtins(self):
+        namespace = {}
+        exec("from fin.seq.fc import *", namespace)
+        self.assertNotIn("abs", namespace)
+        self.assertNotIn("pow", namespace)
+        self.assertIs(namespace["fabs"], mathx.fabs)
+        self.assertIs(namespace["power"], mathx.power)
+
+class TestColumnOperators(unittest.TestCase, assertions.ExtraTests):
+    def test_abs_pow(self):
+        c = Column.from_sequence([ -2.0, 3.0, None ])
+        self.assertFloatSequenceEqual(abs(c).py_values, [ 2.0, 3.0, None ])
+        self.assertFloatSequenceEqual((c**2).py_values, [ 4.0, 9.0, None ])
+        self.assertFloatSequenceEqual((2**c).py_values, [ 0.25, 8.0, None ])
+        self.assertFloatSequenceEqual(abs(c*2 - 1).py_values, [ 5.0, 5.0, None ])
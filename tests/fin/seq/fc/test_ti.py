@@ -18,6 +18,82 @@ class TestSimpleMovingAverage(unittest.TestCase):
 
         self.assertSequenceEqual(actual.py_values, [ None, 10.5, 11.5, 12.5, 13.5, 14.5, 15.5, 16.5, 17.5, 18.5 ])
 
+    def test_sma_in_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        fct = ti.sma(20)
+        series = [
+                Serie.create(Column.from_sequence(range(k, k+10_000)))
+                for k in range(8)
+            ]
+        expected = [ fct(serie, serie.index).py_values for serie in series ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(lambda serie: fct(serie, serie.index).py_values, series))
+
+        self.assertSequenceEqual(actual, expected)
+
+    def test_sma_in_threads_with_budget(self):
+        """
+        Evictions from other threads must not release the buffers a kernel uses.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from fin.seq import column
+
+        fct = ti.sma(20)
+        def make_series():
+            return [
+                    Serie.create(Column.from_sequence(range(k, k+10_000)))
+                    for k in range(8)
+                ]
+
+        expected = [ fct(serie, serie.index).py_values for serie in make_series() ]
+        budget = column.get_memory_budget()
+        try:
+            for limit in (0, 200_000):
+                with self.subTest(budget=limit):
+                    column.set_memory_budget(limit)
+                    with ThreadPoolExecutor(max_workers=4) as executor:
+                        actual = list(executor.map(
+                            lambda serie: fct(serie, serie.index).py_values, make_series()
+                        ))
+
+                    self.assertSequenceEqual(actual, expected)
+        finally:
+            column.set_memory_budget(budget)
+
+class TestSinglePrecision(unittest.TestCase):
+    def test_single_precision_output(self):
+        """
+        Indicators computed from single-precision columns are stored in single precision.
+        """
+        import array
+        from fin.seq.fc import stat
+
+        values = array.array("f", range(100))
+        ser = Serie.create(Column.from_sequence(range(100)))
+        columns = (
+                ("float32 array", Column.from_float32_mv(values, name="X")),
+                ("expression", Column.from_float32_mv(values, name="X")*2),
+            )
+        functions = (
+                ("sma", ti.sma(5)),
+                ("stdev", stat.stdev.s(5)),
+            )
+        for desc, col in columns:
+            for name, fct in functions:
+                with self.subTest(column=desc, function=name):
+                    expected = fct(ser, Column.from_float_mv(col.f_values)).py_values
+                    actual = fct(ser, col)
+                    self.assertEqual(list(actual.memory_usage()), [ "s_values" ])
+                    for a, e in zip(actual.py_values, expected):
+                        if e is None:
+                            self.assertIsNone(a)
+                        else:
+                            self.assertAlmostEqual(a, e, places=3)
+
+        col = Column.from_float_mv(array.array("d", range(100)))
+        self.assertEqual(list(ti.sma(5)(ser, col).memory_usage()), [ "f_values" ])
+
 class TestIndicators(unittest.TestCase):
     """
     Test engine for indicators.
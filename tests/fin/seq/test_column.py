@@ -1,6 +1,7 @@
 import unittest
 import math
 import array
+import pickle
 
 from testing import assertions
 
@@ -28,6 +29,17 @@ class TestColumnRemap(unittest.TestCase):
 
         self.assertSequenceEqual(actual.py_values, tuple((*"DEAD", None, *"BEEF", None)))
 
+    def test_remap_from_i_values(self):
+        arr = array.array("q", (10, 20, 30, 40, 50, 60))
+        #                        0   1   2   3   4   5
+        column = Column.from_int_mv(arr)
+
+        actual = column.remap([3,4,0,-1,1,4,4,5])
+
+        self.assertSequenceEqual(actual.py_values, (
+            40, 50, 10, None, 20, 50, 50, 60
+        ))
+
     def test_remap_from_f_values(self):
         arr = array.array("d", (10, 20, 30, 40, 50, 60))
         #                        0   1   2   3   4   5
@@ -169,6 +181,15 @@ class TestColumn(unittest.TestCase, assertions.ExtraTests):
         c = Column.from_ternary_mv(arr)
         self.assertSequenceEqual(c.t_values, arr)
 
+    def test_create_from_int_mv(self):
+        """
+        You can create a column from a 64-bit integer array.
+        """
+        arr = array.array("q", [1, 2, 3, -2**63, 5])
+        c = Column.from_int_mv(arr)
+        self.assertSequenceEqual(c.i_values, arr)
+        self.assertSequenceEqual(c.py_values, (1, 2, 3, None, 5))
+
     def test_create_from_callable_1(self):
         """
         You can create a column from a callable and a set of columns.
@@ -248,6 +269,70 @@ class TestColumn(unittest.TestCase, assertions.ExtraTests):
         c = Column.from_float_mv(a)
         self.assertFloatSequenceEqual(c.t_values, b)
 
+    def test_sequence_to_int_conversion(self):
+        """
+        You can access the content of a column as an array of 64-bit integers.
+        """
+        seq = [1, 2, 3, None, 5]
+        arr = array.array("q", [1, 2, 3, -2**63, 5])
+        c = Column.from_sequence(seq)
+        self.assertSequenceEqual(c.i_values, arr)
+
+    def test_int_conversions(self):
+        """
+        Integer columns can be converted to other representations.
+        """
+        NaN = float("nan")
+        arr = array.array("q", [1, 0, 3, -2**63, -5])
+        c = Column.from_int_mv(arr)
+        self.assertFloatSequenceEqual(c.f_values, [1.0, 0.0, 3.0, NaN, -5.0])
+        self.assertSequenceEqual(c.t_values, array.array("b", [+1, -1, +1, 0, +1]))
+
+    def test_float_to_int_conversion(self):
+        """
+        Conversion from float to int is supported for integral values only.
+        """
+        NaN = float("nan")
+        c = Column.from_float_mv(array.array("d", [1.0, 0.0, NaN, -5.0]))
+        self.assertSequenceEqual(c.i_values, array.array("q", [1, 0, -2**63, -5]))
+
+        c = Column.from_float_mv(array.array("d", [1.0, 0.5]))
+        with self.assertRaises(ValueError):
+            c.i_values
+
+        c = Column.from_sequence([1.0, 2, None])
+        self.assertSequenceEqual(c.i_values, array.array("q", [1, 2, -2**63]))
+
+        c = Column.from_sequence([1.5, 2.7])
+        with self.assertRaises(ValueError):
+            c.i_values
+
+    def test_integer_type_is_stored_natively(self):
+        """
+        Integer columns do not need their Python objects representation.
+        """
+        c = Column.from_sequence(["1", "2", "x", "4"], type="i")
+        self.assertSequenceEqual(c.i_values, array.array("q", [1, 2, -2**63, 4]))
+        self.assertSequenceEqual(c.py_values, (1, 2, None, 4))
+        self.assertEqual(c[1], 2)
+        self.assertIsNone(c[2])
+
+    def test_date_type_is_stored_natively(self):
+        """
+        Date/time columns are stored as a number of units since the Unix epoch.
+        """
+        from fin.datetime import CalendarDate, CalendarDateTime
+
+        c = Column.from_sequence(["1970-01-02", None, "2023-03-29"], type="d")
+        self.assertSequenceEqual(c.i_values, array.array("q", [1, -2**63, 19445]))
+        self.assertEqual(c[2], CalendarDate(2023, 3, 29))
+        self.assertSequenceEqual(c.py_values, (CalendarDate(1970, 1, 2), None, CalendarDate(2023, 3, 29)))
+
+        dt = CalendarDateTime(2023, 3, 29, 0, 0, 10)
+        c = Column.from_sequence([dt], type="s")
+        self.assertSequenceEqual(c.i_values, array.array("q", [1680048010]))
+        self.assertEqual(c[0], dt)
+
     def test_use_native_format_1(self):
         arr = array.array("d", [1.0, 0.0, 3.0, 4.0, 5.0])
         col = Column.from_float_mv(arr)
@@ -324,6 +409,45 @@ class TestColumn(unittest.TestCase, assertions.ExtraTests):
 
             self.assertEqual(c.min_max(), (2, 10))
 
+        with self.subTest(created="from a sequence of float type"):
+            c = Column.from_sequence_noconv([10, 2, 3, None, 5], type="n")
+            c.f_values
+
+            lo, hi = c.min_max()
+            self.assertEqual((lo, hi), (2, 10))
+            self.assertIs(type(lo), int)
+            self.assertIs(type(hi), int)
+
+        with self.subTest(created="without values"):
+            c = Column.from_sequence([None, None])
+
+            with self.assertRaisesRegex(ValueError, "empty sequence"):
+                c.min_max()
+
+    def test_stats(self):
+        """
+        Column statistics are computed in one pass and cached.
+        """
+        from fin import datetime
+        d1 = datetime.CalendarDate(2024, 1, 1)
+        d2 = datetime.CalendarDate(2024, 2, 1)
+        testcases = (
+            ("float", Column.from_float_mv(array.array("d", [3, 1, math.nan, 2])), (1, 3, 1, False, 6)),
+            ("ascending", Column.from_float_mv(array.array("d", [1, 2, 3])), (1, 3, 0, True, 6)),
+            ("int", Column.from_sequence([5, None, 7], type="i"), (5, 7, 1, False, 12)),
+            ("int ascending", Column.from_int_mv(array.array("q", [1, 2, 4])), (1, 4, 0, True, 7)),
+            ("date", Column.from_sequence([d1, d2], type="d"), (d1, d2, 0, True, None)),
+            ("object", Column.from_sequence(["b", "a", None]), ("a", "b", 1, False, None)),
+            ("runs", Column.from_runs([2, None, 1], [3, 1, 2]), (1, 2, 1, False, 8)),
+            ("constant", Column.from_constant(1, 4), (4, 4, 0, True, 4)),
+            ("empty", Column.from_sequence([None]), (None, None, 1, False, 0)),
+        )
+        for desc, c, expected in testcases:
+            with self.subTest(desc=desc):
+                stats = c.stats()
+                self.assertEqual((stats.min, stats.max, stats.null_count, stats.ascending, stats.sum), expected)
+                self.assertIs(c.stats(), stats)
+
     def test_slice(self):
         """
         You can use the slice syntax to copy a part of a column.
@@ -346,6 +470,13 @@ class TestColumn(unittest.TestCase, assertions.ExtraTests):
                 start, end = use_case
                 self.assertSequenceEqual(tuple(carr[start:end].f_values), tuple(carr.f_values[start:end]))
 
+    def test_slice_int(self):
+        """
+        You can slice an integer column.
+        """
+        c = Column.from_int_mv(array.array("q", range(10)))
+        self.assertSequenceEqual(c[2:5].i_values, array.array("q", [2, 3, 4]))
+
 # ======================================================================
 # Column metadata
 # ======================================================================
@@ -417,6 +548,69 @@ class TestMutations(unittest.TestCase):
 
         self.assertSequenceEqual(res.py_values, (1,2,3,4,5))
 
+    def test_shift_int(self):
+        """
+        You can shift an integer column without boxing its values.
+        """
+        col = Column.from_int_mv(array.array("q", (1,2,3,4,5)))
+
+        self.assertSequenceEqual(col.shift(2).i_values, array.array("q", (3,4,5,-2**63,-2**63)))
+        self.assertSequenceEqual(col.shift(-2).py_values, (None,None,1,2,3))
+        self.assertSequenceEqual(col.shift(7).py_values, (None,)*5)
+
+    def test_shift_float(self):
+        """
+        Shifting a float column creates a view padded with NaN.
+        """
+        col = Column.from_float_mv(array.array("d", (1,2,3,4,5)), name="X")
+
+        for n, expected in (
+                (2, (3,4,5,None,None)),
+                (-2, (None,None,1,2,3)),
+                (0, (1,2,3,4,5)),
+                (7, (None,)*5),
+                (-7, (None,)*5),
+            ):
+            with self.subTest(n=n):
+                res = col.shift(n)
+                self.assertEqual(res.name, "X")
+                self.assertEqual(res.memory_usage(), {})
+                self.assertSequenceEqual(res.py_values, expected)
+
+    def test_shift_float_in_expression(self):
+        """
+        A shifted float column is fused in the arithmetic expressions using it.
+        """
+        values = [ float(i) for i in range(1, 1501) ]
+        col = Column.from_float_mv(array.array("d", values))
+        res = col / col.shift(-1)
+
+        self.assertSequenceEqual(res.py_values, [ None, *(values[i]/values[i-1] for i in range(1, 1500)) ])
+
+    def test_shift_ternary(self):
+        col = Column.from_ternary_mv(array.array("b", (1,-1,0,1)))
+
+        self.assertSequenceEqual(col.shift(1).t_values, array.array("b", (-1,0,1,0)))
+        self.assertSequenceEqual(col.shift(-1).py_values, (None,True,False,None))
+
+    def test_shift_typed_sequence(self):
+        """
+        Float and ternary columns built from Python objects are shifted natively.
+        """
+        col = Column.from_sequence((1,2,None,4,5), type="n")
+        res = col.shift(2)
+        self.assertEqual(res.memory_usage(), {})
+        self.assertSequenceEqual(res.py_values, (None,4.0,5.0,None,None))
+
+        col = Column.from_sequence((True,False,None,True), type="t")
+        res = col.shift(1)
+        self.assertEqual(list(res.memory_usage()), [ "t_values" ])
+        self.assertSequenceEqual(res.py_values, (False,None,True,None))
+
+    def test_shift_empty(self):
+        for col in (Column.from_sequence(()), Column.from_float_mv(array.array("d"))):
+            self.assertSequenceEqual(col.shift(1).py_values, ())
+
     def test_rename(self):
         new_name = "Y"
         test_cases = (
@@ -456,3 +650,727 @@ class TestColumnUtilities(unittest.TestCase):
             self.assertIsInstance(c, Column)
             self.assertSequenceEqual(c.py_values, seq)
 
+
+class TestArithmeticExpressions(unittest.TestCase, assertions.ExtraTests):
+    def setUp(self):
+        self.n = 1500 # Spans several evaluation blocks
+        self.high = [ 10.0 + (i % 7) for i in range(self.n) ]
+        self.low = [ 5.0 + (i % 3) for i in range(self.n) ]
+        self.close = [ 7.0 + (i % 5) for i in range(self.n) ]
+        self.close[3] = math.nan
+        self.ch = Column.from_float_mv(array.array("d", self.high))
+        self.cl = Column.from_float_mv(array.array("d", self.low))
+        self.cc = Column.from_float_mv(array.array("d", self.close))
+
+    def test_operators_are_lazy(self):
+        c = (self.ch - self.cl) / self.cc * 100
+        self.assertEqual(c.memory_usage(), {})
+        self.assertEqual(len(c), self.n)
+        self.assertEqual(c.name, f"((({self.ch.name}+-{self.cl.name})/{self.cc.name})*100.0)")
+
+        self.assertFloatSequenceEqual(c.f_values, [
+            (h - l) / c * 100 for h, l, c in zip(self.high, self.low, self.close)
+        ])
+        self.assertIn("f_values", c.memory_usage())
+
+    def test_nested_expressions(self):
+        testcases = (
+            lambda h, l, c: -(h + l) * (c - 1),
+            lambda h, l, c: 2 - h,
+            lambda h, l, c: 1 / (h * l) + c / 2,
+            lambda h, l, c: (h + l) - (l + c) * (h - c),
+            lambda h, l, c: -(-h),
+        )
+        for fct in testcases:
+            with self.subTest(fct=fct):
+                actual = fct(self.ch, self.cl, self.cc)
+                self.assertIsInstance(actual, Column)
+                self.assertFloatSequenceEqual(actual.f_values, [
+                    fct(*row) for row in zip(self.high, self.low, self.close)
+                ])
+
+    def test_long_chain(self):
+        c = self.ch
+        for i in range(100):
+            c = c + self.cl
+        self.assertFloatSequenceEqual(c.f_values, [ h + 100*l for h, l in zip(self.high, self.low) ])
+
+    def test_shared_subexpression(self):
+        t = self.ch - self.cl
+        u = t * t
+        self.assertFloatSequenceEqual(u.f_values, [ (h - l)**2 for h, l in zip(self.high, self.low) ])
+        self.assertFloatSequenceEqual(t.f_values, [ h - l for h, l in zip(self.high, self.low) ])
+
+    def test_lazy_column_access(self):
+        c = self.ch + self.cl
+        self.assertEqual(c[1], self.high[1] + self.low[1])
+        self.assertSequenceEqual((self.ch + self.cl).rename("X").py_values, c.py_values)
+
+    def test_errors(self):
+        with self.assertRaises(column.ColumnSizeMismatchError):
+            self.ch + Column.from_float_mv(array.array("d", [1.0]))
+        with self.assertRaises(TypeError):
+            self.ch + Column.from_sequence(["a"] * self.n)
+
+        c = self.ch / Column.from_float_mv(array.array("d", [0.0] * self.n))
+        with self.assertRaises(ZeroDivisionError):
+            c.f_values
+
+    def test_division_by_zero_scalar(self):
+        for divisor in (0, 0.0, Column.from_constant(self.n, 0.0)):
+            with self.subTest(divisor=divisor):
+                with self.assertRaises(ZeroDivisionError):
+                    self.ch / divisor
+
+class TestRunLengthColumns(unittest.TestCase, assertions.ExtraTests):
+    def test_constant_is_not_expanded(self):
+        c = Column.from_constant(1_000_000, 1000)
+        self.assertEqual(list(c.memory_usage()), [ "runs" ])
+        self.assertEqual(c[999_999], 1000)
+        self.assertEqual(c[-1], 1000)
+        with self.assertRaises(IndexError):
+            c[1_000_000]
+
+    def test_from_runs(self):
+        c = Column.from_runs([ 1, None, 3 ], [ 2, 1, 3 ])
+        self.assertSequenceEqual(c.py_values, [ 1, 1, None, 3, 3, 3 ])
+        self.assertFloatSequenceEqual(Column.from_float_mv(c.f_values).py_values, [ 1, 1, None, 3, 3, 3 ])
+        self.assertSequenceEqual(c.t_values, [ 1, 1, 0, 1, 1, 1 ])
+        self.assertSequenceEqual(c.i_values, [ 1, 1, -2**63, 3, 3, 3 ])
+
+        with self.assertRaises(ValueError):
+            Column.from_runs([ 1 ], [ 1, 2 ])
+
+    def test_typed_runs(self):
+        from fin import datetime
+        d = datetime.CalendarDate(2024, 1, 2)
+        c = Column.from_runs([ d, None ], [ 2, 1 ], type="d")
+        self.assertSequenceEqual(c.i_values, [ d.epoch, d.epoch, -2**63 ])
+
+    def test_arithmetic_broadcast(self):
+        values = Column.from_float_mv(array.array("d", range(1000)))
+        k = Column.from_constant(1000, 2)
+        r = Column.from_runs([ 1.0, 10.0, None ], [ 600, 300, 100 ])
+
+        actual = (values*k + r).py_values
+        self.assertFloatSequenceEqual(actual, [
+            2*v + (1.0 if v < 600 else 10.0) if v < 900 else None for v in range(1000)
+        ])
+        self.assertEqual(list(k.memory_usage()), [ "runs" ])
+        self.assertEqual(list(r.memory_usage()), [ "runs" ])
+
+    def test_logic_broadcast(self):
+        T, F, N = True, False, None
+        values = Column.from_sequence([ T, F, N ])
+        testcases = (
+            (T, lambda a, b: a & b, [ T, F, N ]),
+            (F, lambda a, b: a & b, [ F, F, F ]),
+            (N, lambda a, b: a | b, [ T, N, N ]),
+            (T, lambda a, b: b | a, [ T, T, T ]),
+        )
+        for k, fct, expected in testcases:
+            with self.subTest(k=k):
+                self.assertSequenceEqual(fct(values, Column.from_constant(3, k)).py_values, expected)
+
+        c = Column.from_constant(3, T) & Column.from_constant(3, N)
+        self.assertEqual(list(c.memory_usage()), [ "runs" ])
+        self.assertSequenceEqual(c.py_values, [ N, N, N ])
+
+    def test_slice_shift_remap(self):
+        c = Column.from_runs("ABC", [ 2, 3, 1 ])
+        expected = list("AABBBC")
+        for start, stop in ((1, 4), (0, 6), (2, 5), (-3, None), (4, 2)):
+            with self.subTest(start=start, stop=stop):
+                actual = c[start:stop]
+                self.assertEqual(list(actual.memory_usage()), [ "runs" ])
+                self.assertSequenceEqual(actual.py_values, expected[start:stop])
+        for n in (0, 1, 4, -2, 10):
+            with self.subTest(shift=n):
+                actual = c.shift(n)
+                self.assertEqual(list(actual.memory_usage()), [ "runs" ])
+                shifted = expected[n:] + [None]*n if n >= 0 else [None]*-n + expected[:n]
+                self.assertSequenceEqual(actual.py_values, shifted[:6] if n >= 0 else shifted[-6:])
+
+        actual = c.remap([ 5, 0, 1, -1, 2, 4 ])
+        self.assertSequenceEqual(actual.py_values, [ "C", "A", "A", None, "B", "B" ])
+
+class TestCategoricalColumns(unittest.TestCase):
+    def test_from_sequence(self):
+        c = Column.from_sequence([ "AAPL", "MSFT", None, "AAPL" ], type="c")
+        self.assertEqual(c.categories, ( "AAPL", "MSFT" ))
+        self.assertSequenceEqual(c.codes, [ 0, 1, -1, 0 ])
+        self.assertEqual(c[1], "MSFT")
+        self.assertIsNone(c[2])
+        self.assertSequenceEqual(c.py_values, [ "AAPL", "MSFT", None, "AAPL" ])
+        self.assertEqual(set(c.memory_usage()), { "c_codes", "py_values" })
+
+    def test_equal_values_of_distinct_types(self):
+        c = Column.from_sequence([ 1, 1.0, True, 1 ], type="c")
+        self.assertEqual(len(c.categories), 3)
+        self.assertSequenceEqual(c.codes, [ 0, 1, 2, 0 ])
+        self.assertEqual([ type(v) for v in c.py_values ], [ int, float, bool, int ])
+
+    def test_unhashable_values(self):
+        c = Column.from_sequence([ [1], [2] ], type="c")
+        self.assertIsNone(c.codes)
+        self.assertSequenceEqual(c.py_values, [ [1], [2] ])
+
+    def test_from_codes(self):
+        c = Column.from_codes([ 1, 0, -1 ], [ 10, 20 ])
+        self.assertSequenceEqual(c.py_values, [ 20, 10, None ])
+        self.assertSequenceEqual(c.i_values, [ 20, 10, -2**63 ])
+        self.assertSequenceEqual(c.t_values, [ 1, 1, 0 ])
+        self.assertSequenceEqual(c.f_values[:2], [ 20.0, 10.0 ])
+        self.assertEqual(c.stats().min, 10)
+
+        with self.assertRaises(ValueError):
+            Column.from_codes([ 2 ], [ 10, 20 ])
+
+    def test_derived_columns_share_the_dictionary(self):
+        c = Column.from_sequence("ABCAB", type="c")
+        testcases = (
+            ("slice", c[1:4], [ "B", "C", "A" ]),
+            ("shift", c.shift(2), [ "C", "A", "B", None, None ]),
+            ("remap", c.remap([ 4, -1, 0 ]), [ "B", None, "A" ]),
+            ("rename", c.rename("X"), list("ABCAB")),
+        )
+        for desc, actual, expected in testcases:
+            with self.subTest(desc=desc):
+                self.assertEqual(list(actual.memory_usage()), [ "c_codes" ])
+                self.assertEqual(actual.categories, c.categories)
+                self.assertSequenceEqual(actual.py_values, expected)
+
+    def test_export_codes(self):
+        c = Column.from_sequence("ABA", type="c")
+        self.assertSequenceEqual(memoryview(c).tolist(), [ 0, 1, 0 ])
+
+class TestSinglePrecisionColumns(unittest.TestCase, assertions.ExtraTests):
+    def single(self):
+        return coltypes.Float(storage="float32")
+
+    def test_from_sequence(self):
+        c = Column.from_sequence([ "1.5", 2, None, 0.1 ], type=self.single())
+        self.assertEqual(c.memory_usage(), { "s_values": 16 })
+        self.assertEqual(c[0], 1.5)
+        self.assertTrue(math.isnan(c[2]))
+        self.assertFloatSequenceEqual(c.py_values, [ 1.5, 2.0, None, 0.1 ], ndigits=7)
+        self.assertEqual(c.stats().null_count, 1)
+
+        with self.assertRaises(ValueError):
+            coltypes.Float(storage="float16")
+
+    def test_from_float_mv_narrows(self):
+        c = Column.from_float_mv(array.array("d", [ 1.0, 2.0 ]), type=self.single())
+        self.assertEqual(list(c.memory_usage()), [ "s_values" ])
+        self.assertEqual(memoryview(c).format, "f")
+
+    def test_expressions(self):
+        a = Column.from_float32_mv(array.array("f", [ 1, 2, 3, 4 ]))
+        b = Column.from_float32_mv(array.array("f", [ 10, 20, 30, 40 ]))
+        d = Column.from_float_mv(array.array("d", [ 0.5, 0.5, 0.5, 0.5 ]))
+
+        single = a*b + 1
+        self.assertSequenceEqual(single.py_values, [ 11.0, 41.0, 91.0, 161.0 ])
+        self.assertEqual(set(single.memory_usage()), { "s_values", "py_values" })
+        self.assertEqual(list(a.memory_usage()), [ "s_values" ])
+
+        mixed = a + d
+        self.assertSequenceEqual(mixed.py_values, [ 1.5, 2.5, 3.5, 4.5 ])
+        self.assertIn("f_values", mixed.memory_usage())
+
+        shifted = a.shift(1)
+        self.assertSequenceEqual(shifted.py_values, [ 2.0, 3.0, 4.0, None ])
+        self.assertIn("s_values", shifted.memory_usage())
+
+    def test_slice_remap(self):
+        c = Column.from_float32_mv(array.array("f", [ 1, 2, 3, 4 ]))
+        self.assertSequenceEqual(c[1:3].py_values, [ 2.0, 3.0 ])
+        self.assertSequenceEqual(c.remap([ 3, -1, 0 ]).py_values, [ 4.0, None, 1.0 ])
+        self.assertSequenceEqual(Column.from_buffer(array.array("f", [ 5 ])).py_values, [ 5.0 ])
+
+class TestTernaryPlanes(unittest.TestCase):
+    # Deterministic mix of True, False and None, over several 64-row words
+    A = [ (True, False, None)[i*i % 7 % 3] for i in range(150) ]
+    B = [ (True, False, None)[(i*5 + 1) % 11 % 3] for i in range(150) ]
+
+    @staticmethod
+    def kleene_and(x, y):
+        return False if x is False or y is False else None if x is None or y is None else True
+
+    @staticmethod
+    def kleene_or(x, y):
+        return True if x is True or y is True else None if x is None or y is None else False
+
+    def ternary(self, seq):
+        return Column.from_ternary_mv(array.array("b", [ 0 if x is None else 1 if x else -1 for x in seq ]))
+
+    def test_round_trip(self):
+        c = Column.from_ternary_planes(self.ternary(self.A).b_planes, len(self.A))
+        self.assertEqual(list(c.memory_usage()), [ "b_planes" ])
+        self.assertEqual(c.memory_usage()["b_planes"], 2*3*8)
+        self.assertSequenceEqual(c.py_values, self.A)
+        self.assertSequenceEqual(list(c.t_values), list(self.ternary(self.A).t_values))
+        self.assertEqual(c[-1], self.A[-1])
+
+        with self.assertRaises(ValueError):
+            Column.from_ternary_planes(array.array("Q", [ 0, 0 ]), 65)
+
+    def test_operators(self):
+        a = self.ternary(self.A)
+        b = self.ternary(self.B)
+        for c, fct in ((a & b, self.kleene_and), (a | b, self.kleene_or)):
+            with self.subTest(name=c.name):
+                self.assertIn("b_planes", c.memory_usage())
+                self.assertSequenceEqual(c.py_values, [ fct(x, y) for x, y in zip(self.A, self.B) ])
+
+    def test_operators_with_constant(self):
+        a = self.ternary(self.A)
+        for value in (True, False, None):
+            k = Column.from_constant(len(self.A), value)
+            with self.subTest(value=value):
+                self.assertSequenceEqual((a & k).py_values, [ self.kleene_and(x, value) for x in self.A ])
+                self.assertSequenceEqual((a | k).py_values, [ self.kleene_or(x, value) for x in self.A ])
+                self.assertSequenceEqual((a & k)[len(self.A):], [])
+
+    def test_slice_shift_remap(self):
+        c = self.ternary(self.A) & self.ternary(self.A)
+        for start, stop in ((0, 150), (3, 70), (64, 128), (100, 150), (149, 200)):
+            with self.subTest(start=start, stop=stop):
+                self.assertSequenceEqual(c[start:stop].py_values, self.A[start:stop])
+        for n in (1, -1, 63, 64, -65, 150):
+            with self.subTest(n=n):
+                expected = (self.A[n:] + [None]*n) if n >= 0 else ([None]*-n + self.A[:n])
+                self.assertSequenceEqual(c.shift(n).py_values, expected[:len(self.A)])
+
+        self.assertSequenceEqual(c.remap([ 149, -1, 0, 64 ]).py_values, [ self.A[149], None, self.A[0], self.A[64] ])
+
+class TestSparseColumns(unittest.TestCase, assertions.ExtraTests):
+    def sparse(self, **kwargs):
+        # [None, 1.5, None, None, 3, None, None, -2]
+        return Column.from_sparse(8, [ 1, 4, 7 ], [ 1.5, 3, -2 ], **kwargs)
+
+    def dense(self):
+        return [ None, 1.5, None, None, 3, None, None, -2 ]
+
+    def test_from_sparse(self):
+        c = self.sparse(name="X")
+        self.assertEqual(list(c.memory_usage()), [ "sparse" ])
+        self.assertEqual(len(c), 8)
+        self.assertEqual(c[4], 3)
+        self.assertIsNone(c[5])
+        self.assertEqual(c[-1], -2)
+        self.assertSequenceEqual(c.py_values, self.dense())
+        self.assertFloatSequenceEqual(c.f_values, [ x if x is not None else math.nan for x in self.dense() ])
+        self.assertEqual(c.stats().null_count, 5)
+        self.assertEqual(c.stats().sum, 2.5)
+
+        with self.assertRaises(ValueError):
+            Column.from_sparse(8, [ 4, 1 ], [ 1, 2 ])
+        with self.assertRaises(IndexError):
+            Column.from_sparse(8, [ 8 ], [ 1 ])
+
+    def test_slice_shift_remap(self):
+        c = self.sparse()
+        self.assertSequenceEqual(c[2:7].py_values, self.dense()[2:7])
+        self.assertEqual(list(c[2:7].memory_usage()), [ "sparse" ])
+        for n in (1, -1, 3, -4, 10):
+            with self.subTest(n=n):
+                expected = (self.dense()[n:] + [None]*n) if n >= 0 else ([None]*-n + self.dense()[:n])
+                self.assertSequenceEqual(c.shift(n).py_values, expected[:8])
+        self.assertSequenceEqual(c.remap([ 7, 0, 4, -1, 4 ]).py_values, [ -2, None, 3, None, 3 ])
+
+    def test_arithmetic_stays_sparse(self):
+        c = self.sparse()
+        d = Column.from_sequence(range(8))
+        e = Column.from_sparse(8, [ 4, 5, 7 ], [ 10, 20, 30 ])
+        for result, expected in (
+                (c*2 + 1, [ None, 4.0, None, None, 7.0, None, None, -3.0 ]),
+                (1 - c, [ None, -0.5, None, None, -2.0, None, None, 3.0 ]),
+                (c + d, [ None, 2.5, None, None, 7.0, None, None, 5.0 ]),
+                (c + e, [ None, None, None, None, 13.0, None, None, 28.0 ]),
+                (-c, [ None, -1.5, None, None, -3.0, None, None, 2.0 ]),
+            ):
+            with self.subTest(name=result.name):
+                self.assertEqual(list(result.memory_usage()), [ "sparse" ])
+                self.assertSequenceEqual(result.py_values, expected)
+        self.assertEqual((c + d).name, f"({c.name}+{d.name})")
+        self.assertNotIn("f_values", d.memory_usage())
+
+    def test_logical_operators(self):
+        a = Column.from_sparse(6, [ 0, 2, 3 ], [ True, False, True ])
+        b = Column.from_sparse(6, [ 2, 3, 5 ], [ True, None, False ])
+        self.assertSequenceEqual((a & b).py_values, [ None, None, False, None, None, False ])
+        self.assertSequenceEqual((a | b).py_values, [ True, None, True, True, None, None ])
+        self.assertEqual(list((a & b).memory_usage()), [ "sparse" ])
+
+    def test_mark_changes(self):
+        from fin.seq.serie import Serie
+        from fin.seq import ag
+        c = Column.from_sparse(8, [ 1, 2, 5, 6 ], [ 1, 1, None, 2 ], name="X")
+        ser = Serie.create(Column.from_sequence(range(8), name="T"), c)
+        self.assertSequenceEqual(ser.group_by("X", (ag.first, "T")).index.py_values, (0, 1, 3, 6, 7))
+
+class TestStridedViews(unittest.TestCase, assertions.ExtraTests):
+    N = 50
+
+    def test_float_view(self):
+        base = Column.from_float_mv(array.array("d", range(self.N)))
+        c = base[3::5]
+        self.assertEqual(c.memory_usage(), { "strided": 0 })
+        self.assertEqual(len(c), 10)
+        self.assertEqual(c[1], 8.0)
+        self.assertEqual(c[-1], 48.0)
+
+        # Arithmetic reads the view in place
+        self.assertSequenceEqual((c*2).py_values, [ 2.0*x for x in range(3, self.N, 5) ])
+        self.assertEqual(c.memory_usage(), { "strided": 0 })
+
+        self.assertSequenceEqual(c.f_values, array.array("d", range(3, self.N, 5)))
+        self.assertSequenceEqual(c.py_values, range(3, self.N, 5))
+
+    def test_buffer_is_shared(self):
+        base = Column.from_float_mv(array.array("d", range(self.N)))
+        view = memoryview(base[1::4])
+        self.assertEqual(view.strides, (32,))
+        self.assertSequenceEqual(view.tolist(), range(1, self.N, 4))
+        self.assertEqual(view.obj, memoryview(base).obj)
+
+    def test_ternary_and_python_views(self):
+        seq = [ (True, False, None)[i % 3] for i in range(self.N) ]
+        for base in (
+                Column.from_ternary_mv(array.array("b", [ 0 if x is None else 1 if x else -1 for x in seq ])),
+                Column.from_sequence(seq),
+            ):
+            with self.subTest(base=base.memory_usage()):
+                c = base[::4]
+                self.assertSequenceEqual(c.py_values, seq[::4])
+                self.assertSequenceEqual(list(c.t_values), list(base.t_values[::4]))
+                self.assertSequenceEqual((c & c).py_values, seq[::4])
+
+    def test_views_of_views(self):
+        base = Column.from_sequence(range(self.N), type="i")
+        c = base[2::3][1::2][:4]
+        self.assertSequenceEqual(c.py_values, list(range(self.N))[2::3][1::2][:4])
+        self.assertSequenceEqual(c.i_values, array.array("q", list(range(self.N))[2::3][1::2][:4]))
+        self.assertSequenceEqual(c.shift(1).py_values, [ 11, 17, 23, None ])
+        self.assertSequenceEqual(c.remap([ 3, -1, 0 ]).py_values, [ 23, None, 5 ])
+        self.assertEqual(c.stats().max, 23)
+
+    def test_negative_step_and_compact_columns(self):
+        self.assertSequenceEqual(Column.from_sequence(range(10))[::-3].py_values, [ 9, 6, 3, 0 ])
+        c = Column.from_runs([ "a", "b" ], [ 5, 5 ])[::2]
+        self.assertEqual(list(c.memory_usage()), [ "runs" ])
+        self.assertSequenceEqual(c.py_values, [ "a", "a", "a", "b", "b" ])
+
+class TestCompressedColumns(unittest.TestCase, assertions.ExtraTests):
+    N = 1000
+
+    def setUp(self):
+        self.timestamps = [ 1_700_000_000 + 60*i + (i % 7 == 0) for i in range(self.N) ]
+        self.prices = [ 100.0 + round(math.sin(i/50.0), 2) for i in range(self.N) ]
+
+    def test_delta_encoding(self):
+        base = Column.from_sequence(self.timestamps, type="i", name="T")
+        c = base.compress()
+        self.assertEqual(c.compression, "delta")
+        self.assertEqual(c.name, "T")
+        self.assertEqual(list(c.memory_usage()), [ "packed" ])
+        self.assertLess(c.memory_usage()["packed"], self.N*8//4)
+
+        self.assertSequenceEqual(list(c.i_values), list(base.i_values))
+        self.assertSequenceEqual(c.py_values, self.timestamps)
+
+    def test_xor_encoding(self):
+        base = Column.from_sequence(self.prices, type="n")
+        c = base.compress("xor")
+        self.assertEqual(c.compression, "xor")
+        self.assertLess(c.memory_usage()["packed"], self.N*8)
+
+        # Decoded lazily, then cached
+        self.assertSequenceEqual(list((c*2).py_values), [ 2*x for x in self.prices ])
+        self.assertIn("f_values", c.memory_usage())
+        self.assertSequenceEqual(c.py_values, self.prices)
+
+    def test_rle_encoding(self):
+        c = Column.from_sequence([ 1.5 ]*500 + [ None ]*300 + [ 2.0 ]*200, type="n").compress()
+        self.assertEqual(c.compression, "rle")
+        self.assertLess(c.memory_usage()["packed"], 64)
+        self.assertEqual(c[499], 1.5)
+        self.assertTrue(math.isnan(c[500]))
+        self.assertEqual(c.stats().null_count, 300)
+
+    def test_special_values(self):
+        seq = [ 0, None, -2**63 + 1, 2**63 - 1, None, 5, 5 ]
+        for encoding in ("delta", "rle"):
+            with self.subTest(encoding=encoding):
+                c = Column.from_sequence(seq, type="i").compress(encoding)
+                self.assertSequenceEqual(c.py_values, seq)
+
+        seq = [ 0.0, -0.0, math.inf, -math.inf, 1e-310, 1.0, 1.0000000001 ]
+        c = Column.from_sequence(seq, type="n").compress("xor")
+        self.assertSequenceEqual(c.py_values, seq)
+        self.assertEqual(math.copysign(1.0, c[1]), -1.0)
+
+    def test_empty_and_single(self):
+        for seq in ([], [ 42.0 ]):
+            for encoding in ("xor", "rle"):
+                c = Column.from_sequence(seq, type="n").compress(encoding)
+                self.assertSequenceEqual(c.py_values, seq)
+
+    def test_dates(self):
+        base = Column.from_sequence([ "2023-01-0%d" % d for d in range(1, 10) ], type="d")
+        c = base.compress()
+        self.assertEqual(c.compression, "delta")
+        self.assertSequenceEqual(c.py_values, base.py_values)
+        self.assertEqual(c.stats().max, base.stats().max)
+
+    def test_copies(self):
+        c = Column.from_sequence(self.timestamps, type="i").compress()
+        self.assertSequenceEqual(c[10:15].py_values, self.timestamps[10:15])
+        self.assertSequenceEqual(c[::100].py_values, self.timestamps[::100])
+        self.assertSequenceEqual(c.shift(998).py_values, self.timestamps[998:] + [ None ]*998)
+        self.assertSequenceEqual(c.remap([ 2, -1, 0 ]).py_values, [ self.timestamps[2], None, self.timestamps[0] ])
+        self.assertEqual(c.rename("X").compression, "delta")
+        self.assertSequenceEqual(memoryview(c).tolist(), self.timestamps)
+
+    def test_memory_budget(self):
+        c = Column.from_sequence(self.prices, type="n").compress()
+        budget = column.get_memory_budget()
+        try:
+            column.set_memory_budget(0)
+            c.f_values
+            Column.from_sequence([]) # Creating a column enforces the budget
+            self.assertEqual(list(c.memory_usage()), [ "packed" ])
+            self.assertSequenceEqual(c.py_values, self.prices)
+            self.assertSequenceEqual(c[10:15].py_values, self.prices[10:15])
+            self.assertEqual(c[10], self.prices[10])
+        finally:
+            column.set_memory_budget(budget)
+
+    def test_untyped_values(self):
+        for values, compression in (
+                (self.timestamps, "delta"),
+                (self.prices, "xor"),
+                ([ 7 ]*500 + [ None ]*500, "rle"),
+            ):
+            with self.subTest(compression=compression):
+                c = Column.from_sequence(values).compress()
+                self.assertEqual(c.compression, compression)
+                self.assertSequenceEqual(c.py_values, values)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            Column.from_sequence([ "a", "b" ]).compress()
+        with self.assertRaises(ValueError):
+            Column.from_sequence([ 1, 2 ], type="i").compress("xor")
+
+class TestColumnPickle(unittest.TestCase, assertions.ExtraTests):
+    def round_trip(self, c, protocol=pickle.HIGHEST_PROTOCOL, out_of_band=False):
+        buffers = []
+        if out_of_band:
+            data = pickle.dumps(c, protocol, buffer_callback=buffers.append)
+            result = pickle.loads(data, buffers=buffers)
+        else:
+            data = pickle.dumps(c, protocol)
+            result = pickle.loads(data)
+
+        self.assertIsInstance(result, Column)
+        self.assertEqual(result.name, c.name)
+        self.assertIs(type(result.type), type(c.type))
+        self.assertEqual(len(result), len(c))
+        return result, data, buffers
+
+    def test_native_representations(self):
+        columns = (
+            Column.from_float_mv(array.array("d", [1.0, math.nan, 3.5]), name="F"),
+            Column.from_int_mv(array.array("q", [1, -2**63, 3]), name="I", type="i"),
+            Column.from_ternary_mv(array.array("b", [1, 0, -1]), name="T"),
+            Column.from_ternary_planes(array.array("Q", [0b101, 0b001]), 3, name="B"),
+            Column.from_sequence([1.5, None, 2.5], type=coltypes.Float(storage="float32")),
+        )
+        for c in columns:
+            usage = c.memory_usage()
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(usage=usage, protocol=protocol):
+                    result, _, _ = self.round_trip(c, protocol)
+                    self.assertEqual(result.memory_usage(), usage)
+                    self.assertFloatSequenceEqual(result.py_values, c.py_values)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5")
+    def test_out_of_band(self):
+        c = Column.from_float_mv(array.array("d", range(1000)), name="X")
+        result, data, buffers = self.round_trip(c, out_of_band=True)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 1000)
+        self.assertEqual(buffers[0].raw().nbytes, 8000)
+        self.assertSequenceEqual(result.py_values, c.py_values)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5")
+    def test_only_primary_representation(self):
+        c = Column.from_sequence(range(100), type="i")
+        c.py_values
+        c.f_values
+        result, data, buffers = self.round_trip(c, out_of_band=True)
+        self.assertEqual(list(result.memory_usage()), [ "i_values" ])
+        self.assertLess(len(data), 200)
+
+    def test_type_options(self):
+        c = Column.from_sequence([1.0, 2.0], type=coltypes.Float(precision=4))
+        result, _, _ = self.round_trip(c)
+        self.assertEqual(result.type._options, c.type._options)
+
+    def test_compact_representations(self):
+        columns = (
+            Column.from_sequence([1, "a", None], name="P"),
+            Column.from_sequence("ABA", type="c"),
+            Column.from_runs([ "a", None ], [ 3, 2 ]),
+            Column.from_sparse(6, [ 1, 4 ], [ 1.5, 2.5 ]),
+            Column.from_sequence(range(20), type="i").compress(),
+            Column.from_float_mv(array.array("d", range(20)))[1::3],
+            Column.from_float_mv(array.array("d", range(20))) * 2,
+        )
+        for c in columns:
+            with self.subTest(usage=c.memory_usage()):
+                result, _, _ = self.round_trip(c)
+                if "strided" not in c.memory_usage():
+                    self.assertEqual(list(result.memory_usage()), list(c.memory_usage()))
+                self.assertSequenceEqual(result.py_values, c.py_values)
+
+class TestColumnMemory(unittest.TestCase):
+    def test_memory_usage(self):
+        c = Column.from_float_mv(array.array('d', [1.0, 2.0, 3.0]))
+        self.assertEqual(c.memory_usage(), { "f_values": 24 })
+
+        c.py_values
+        c.t_values
+        usage = c.memory_usage()
+        self.assertEqual(usage["f_values"], 24)
+        self.assertEqual(usage["t_values"], 3)
+        self.assertGreater(c.memory_usage(deep=True)["py_values"], usage["py_values"])
+
+    def test_memory_budget(self):
+        c = Column.from_float_mv(array.array('d', [1.0, 2.0, math.nan]))
+        budget = column.get_memory_budget()
+        try:
+            column.set_memory_budget(0)
+            self.assertEqual(column.get_memory_budget(), 0)
+            expected = c.py_values
+            self.assertIn("py_values", c.memory_usage())
+
+            Column.from_float_mv(array.array('d', [4.0])) # Creating a column enforces the budget
+            self.assertEqual(c.memory_usage(), { "f_values": 24 })
+            self.assertSequenceEqual(c.py_values, expected)
+        finally:
+            column.set_memory_budget(budget)
+
+    def test_memory_budget_set(self):
+        c = Column.from_float_mv(array.array('d', [1.0, 2.0, 3.0]))
+        c.py_values
+        budget = column.get_memory_budget()
+        try:
+            column.set_memory_budget(0) # Setting the budget enforces it
+            self.assertEqual(c.memory_usage(), { "f_values": 24 })
+        finally:
+            column.set_memory_budget(budget)
+
+    def test_memory_budget_lazy_operands(self):
+        """
+        Resolving lazy operands must not evict the buffers a kernel holds.
+        """
+        from fin.seq.fc import tix
+        from fin.seq.serie import Serie
+        import random
+        rng = random.Random(1)
+        n = 1000
+        prices = [ [ rng.uniform(1, 100) for _ in range(n) ] for _ in "HLC" ]
+
+        def true_range():
+            ser = Serie.create(Column.from_sequence(range(n), name="T", type="i"))
+            high, low, close = ( Column.from_sequence(p) for p in prices )
+            return tix.tr(ser, high*2, low*2, close*2).py_values
+
+        expected = true_range()
+        budget = column.get_memory_budget()
+        try:
+            column.set_memory_budget(0)
+            self.assertSequenceEqual(true_range(), expected)
+        finally:
+            column.set_memory_budget(budget)
+
+    def test_cache_released_with_column(self):
+        before = column.get_cache_usage()
+        c = Column.from_float_mv(array.array('d', [1.0, 2.0, 3.0]))
+        c.i_values
+        self.assertEqual(column.get_cache_usage(), before + 24)
+
+        del c
+        self.assertEqual(column.get_cache_usage(), before)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestColumnBuffer(unittest.TestCase):
+    def test_export_float(self):
+        c = Column.from_float_mv(array.array('d', [1.0, 2.0, math.nan]))
+        view = memoryview(c)
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.format, "d")
+        self.assertEqual(view.shape, (3,))
+        self.assertEqual(view[:2].tolist(), [1.0, 2.0])
+        self.assertTrue(math.isnan(view[2]))
+
+    def test_export_by_type(self):
+        testcases = (
+            ("i", [1, None, 3], "q", [1, -2**63, 3]),
+            ("t", [True, None, False], "b", [1, 0, -1]),
+            ("n", [1, 2, 3], "d", [1.0, 2.0, 3.0]),
+        )
+        for coltype, values, fmt, expected in testcases:
+            with self.subTest(coltype=coltype):
+                view = memoryview(Column.from_sequence(values, type=coltype))
+                self.assertEqual(view.format, fmt)
+                self.assertEqual(view.tolist(), expected)
+
+    def test_export_empty(self):
+        view = memoryview(Column.from_float_mv(array.array('d')))
+        self.assertEqual(view.tolist(), [])
+
+    def test_export_outlives_column(self):
+        c = Column.from_sequence([1.0, 2.0, 3.0])
+        view = memoryview(c)
+        del c
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+        view.release()
+
+    def test_from_buffer(self):
+        testcases = (
+            (array.array('d', [1.0, 2.0]), None, [1.0, 2.0]),
+            (array.array('q', [1, 2]), None, [1, 2]),
+            (array.array('b', [1, 0, -1]), None, [True, None, False]),
+            (bytearray(b"\x01\xff"), "b", [True, False]),
+            (bytes(array.array('d', [4.0])), "d", [4.0]),
+        )
+        for buffer, dtype, expected in testcases:
+            with self.subTest(buffer=buffer):
+                c = Column.from_buffer(buffer, dtype)
+                self.assertSequenceEqual(c.py_values, expected)
+
+    def test_from_buffer_is_zero_copy(self):
+        arr = array.array('d', [1.0, 2.0])
+        c = Column.from_buffer(arr)
+        arr[0] = 10.0
+        self.assertEqual(c.f_values[0], 10.0)
+
+    def test_round_trip(self):
+        c = Column.from_sequence([1, None, 3], type="i")
+        self.assertSequenceEqual(Column.from_buffer(c, type="i").py_values, [1, None, 3])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        arr = numpy.array([1.0, 2.0, 3.0])
+        c = Column.from_numpy(arr)
+        self.assertSequenceEqual(c.py_values, [1.0, 2.0, 3.0])
+        self.assertTrue(numpy.shares_memory(c.to_numpy(), arr))
+        self.assertSequenceEqual(Column.from_numpy(numpy.array([True, False])).py_values, [True, False])
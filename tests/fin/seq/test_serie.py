@@ -1,5 +1,8 @@
+import pickle
 import unittest
+from array import array as column_array
 
+from fin import datetime
 from fin.seq import serie
 from fin.seq import column
 from fin.seq import fc
@@ -22,6 +25,26 @@ class TestSerie(unittest.TestCase):
         self.assertIsInstance(c0, column.Column)
         self.assertSequenceEqual(c0.py_values, [10, 20, 30])
 
+    def test_create_serie_with_native_date_index(self):
+        """
+        A date index is validated using its native representation.
+        """
+        dates = [ datetime.CalendarDate(2024, 1, d) for d in (1, 2, 5) ]
+        ser = serie.Serie.create(fc.sequence(dates, type="d"), fc.sequence([10, 20, 30]))
+        self.assertSequenceEqual(ser.index.py_values, dates)
+
+        for invalid in (dates[::-1], [*dates[:2], dates[1]], [None, *dates]):
+            with self.subTest(index=invalid):
+                with self.assertRaises(TypeError):
+                    serie.Serie.create(fc.sequence(invalid, type="d"))
+
+    def test_memory_usage(self):
+        ser = serie.Serie.create(fc.sequence([1, 2, 3], name="A"), fc.sequence([1.5, 2.5, 3.5], name="B"))
+        usage = ser.memory_usage()
+        self.assertEqual(set(usage), { "A", "B" })
+        self.assertEqual(usage["B"], sum(ser.data[0].memory_usage().values()))
+        self.assertGreaterEqual(ser.memory_usage(deep=True)["A"], usage["A"])
+
     def test_add_scalar(self):
         """
         You can add a scalar to a serie.
@@ -166,6 +189,26 @@ class TestSerie(unittest.TestCase):
         self.assertEqual(res.data[1], c3)
         self.assertEqual(res.data[2], c2)
 
+    def test_get_rows(self):
+        """
+        You can use a slice to extract rows. A step selects every n-th row.
+        """
+        c1 = column.Column.from_sequence(range(20), name="a", type="i")
+        c2 = column.Column.from_float_mv(column_array("d", range(0, 200, 10)), name="b")
+        ser = serie.Serie.create(c1, c2)
+
+        res = ser[2::5]
+        self.assertIsInstance(res, serie.Serie)
+        self.assertEqual(res.rowcount, 4)
+        self.assertSequenceEqual(res.index.py_values, (2, 7, 12, 17))
+        self.assertEqual(res.data[0].memory_usage(), { "strided": 0 })
+        self.assertSequenceEqual(res["b"].data[0].py_values, (20.0, 70.0, 120.0, 170.0))
+
+        self.assertSequenceEqual(ser[5:8].index.py_values, (5, 6, 7))
+
+        with self.assertRaises(ValueError):
+            ser[::-1]
+
     def test_clear(self):
         """
         You can use the clear() method to return a serie containing only the index.
@@ -182,6 +225,23 @@ class TestSerie(unittest.TestCase):
         self.assertEqual(res.index, c1)
         self.assertEqual(len(res.data), 0)
 
+    def test_pickle(self):
+        """
+        You can pickle a serie.
+        """
+        c1 = column.Column.from_sequence(range(5), name="a", type="i")
+        c2 = column.Column.from_float_mv(column_array("d", range(0, 50, 10)), name="b")
+        c3 = column.Column.from_sequence("VWXYZ", name="c")
+        ser = serie.Serie.create(c1, c2, c3, name="S")
+
+        res = pickle.loads(pickle.dumps(ser, pickle.HIGHEST_PROTOCOL))
+        self.assertIsInstance(res, serie.Serie)
+        self.assertEqual(res.name, "S")
+        self.assertEqual(res.rowcount, 5)
+        self.assertSequenceEqual(res.headings, ser.headings)
+        for actual, expected in zip(res.columns, ser.columns):
+            self.assertSequenceEqual(actual.py_values, expected.py_values)
+
 # ======================================================================
 # Joins
 # ======================================================================
@@ -192,7 +252,7 @@ class TestJoin(unittest.TestCase):
         FULL_OUTER_JOIN =   (1, serie.full_outer_join)
         LEFT_OUTER_JOIN =   (2, serie.left_outer_join)
 
-    def run_join_engine(self, join):
+    def run_join_engine(self, join, index_factory=fc.sequence, index_values=tuple):
         XX=None
         testcases = (
                 (
@@ -274,12 +334,12 @@ class TestJoin(unittest.TestCase):
             expIndex, expLeft, expRight = expected[join_id*3:(join_id+1)*3]
 
             with self.subTest(fct=join_fct, indices=(indexA, indexB)):
-                ser0 = serie.Serie.create(fc.sequence(indexA), fc.sequence(colA))
-                ser1 = serie.Serie.create(fc.sequence(indexB), fc.sequence(colB))
+                ser0 = serie.Serie.create(index_factory(indexA), fc.sequence(colA))
+                ser1 = serie.Serie.create(index_factory(indexB), fc.sequence(colB))
 
                 index, (left,), (right,) = join_fct(ser0, ser1)
 
-                self.assertSequenceEqual(index.py_values, expIndex)
+                self.assertSequenceEqual(index.py_values, index_values(expIndex))
 
                 self.assertSequenceEqual(left.py_values, expLeft)
                 self.assertSequenceEqual(right.py_values, expRight)
@@ -288,6 +348,64 @@ class TestJoin(unittest.TestCase):
         for join in TestJoin.Join:
             self.run_join_engine(join)
 
+    def test_serie_all_join_native_dates(self):
+        """
+        Joins on date indices are performed using the native epoch representation.
+        """
+        def dates(letters):
+            return [datetime.CalendarDate(2024, 1, ord(c)-64) for c in letters]
+
+        def index_factory(letters):
+            return fc.sequence(dates(letters), type="d")
+
+        for join in TestJoin.Join:
+            self.run_join_engine(join, index_factory, dates)
+
+    def test_serie_all_join_native_floats(self):
+        """
+        Joins on float indices are performed using the native representation.
+        """
+        def floats(letters):
+            return [ord(c)/4 for c in letters]
+
+        def index_factory(letters):
+            return fc.sequence(floats(letters), type="n")
+
+        for join in TestJoin.Join:
+            self.run_join_engine(join, index_factory, floats)
+
+    def test_serie_all_join_galloping(self):
+        """
+        Joining a short index with a much longer one gives the same result as
+        the object-based join.
+        """
+        import random
+        rng = random.Random(42)
+        long = sorted(rng.sample(range(100000), 5000))
+        cases = (
+                ("short subset", sorted(rng.sample(long, 20))),
+                ("short disjoint", sorted(rng.sample(range(100000, 100100), 20))),
+                ("short mixed", sorted(set(rng.sample(long, 10) + rng.sample(range(-50, 200000), 10)))),
+            )
+
+        def series(index, type):
+            return serie.Serie.create(
+                    fc.sequence(index, type=type),
+                    fc.sequence([ 10*x for x in index ]),
+                )
+
+        for desc, short in cases:
+            for a, b in ((long, short), (short, long)):
+                for join in TestJoin.Join:
+                    _, join_fct = join.value
+                    with self.subTest(desc=desc, fct=join_fct, lenA=len(a)):
+                        eIndex, (eLeft,), (eRight,) = join_fct(series(a, None), series(b, None))
+                        for type in "in":
+                            index, (left,), (right,) = join_fct(series(a, type), series(b, type))
+                            self.assertSequenceEqual(index.py_values, eIndex.py_values)
+                            self.assertSequenceEqual(left.py_values, eLeft.py_values)
+                            self.assertSequenceEqual(right.py_values, eRight.py_values)
+
     def test_serie_inner_join_operator(self):
         serA = serie.Serie.create(fc.sequence("ABCDFG"), fc.sequence([10, 11, 12, 13, 14, 15]))
         serB = serie.Serie.create(fc.sequence("ABCEF"), fc.sequence([20, 21, 22, 23, 24]))
@@ -311,6 +429,276 @@ class TestJoin(unittest.TestCase):
         self.assertSequenceEqual(join.data[0].py_values, [10, 11, 12, 13, XX, 14, 15])
         self.assertSequenceEqual(join.data[1].py_values, [20, 21, 22, XX, 23, 24, XX])
 
+class TestJoinMany(unittest.TestCase):
+    INDICES = (
+            "ABCDFGJ",
+            "BCDEFGH",
+            "ACDFGIJ",
+            "CDFG",
+        )
+
+    def make_series(self, to_key, type=None):
+        return [
+            serie.Serie.create(
+                fc.sequence([ to_key(c) for c in letters ], type=type),
+                fc.sequence([ 10*i + j for j, _ in enumerate(letters) ], name="X"),
+                name=f"S{i}",
+            ) for i, letters in enumerate(self.INDICES)
+        ]
+
+    def check_join_many(self, how, pairwise, to_key, type):
+        series = self.make_series(to_key, type)
+        expected = series[0]
+        for other in series[1:]:
+            index, left, right = pairwise(expected, other, rename=False)
+            expected = serie.Serie.bind(index, *left, *right)
+
+        actual = serie.Serie.join_many(series, how)
+
+        self.assertSequenceEqual(actual.index.py_values, expected.index.py_values)
+        self.assertEqual(len(actual.data), len(series))
+        for a, e in zip(actual.data, expected.data):
+            self.assertSequenceEqual(a.py_values, e.py_values)
+
+    def test_join_many(self):
+        keys = (
+                ("object", lambda c: c, None),
+                ("int", ord, "i"),
+                ("float", lambda c: ord(c)/4, "n"),
+                ("date", lambda c: datetime.CalendarDate(2024, 1, ord(c)-64), "d"),
+            )
+        joins = (
+                ("inner", serie.inner_join),
+                ("outer", serie.full_outer_join),
+                ("left", serie.left_outer_join),
+            )
+        for desc, to_key, type in keys:
+            for how, pairwise in joins:
+                with self.subTest(keys=desc, how=how):
+                    self.check_join_many(how, pairwise, to_key, type)
+
+    def test_join_many_rename(self):
+        series = self.make_series(ord, "i")
+
+        self.assertSequenceEqual(
+                serie.Serie.join_many(series).headings[1:],
+                ("S0:X", "S1:X", "S2:X", "S3:X"),
+            )
+        self.assertSequenceEqual(
+                serie.Serie.join_many(series, rename=False).headings[1:],
+                ("X", "X", "X", "X"),
+            )
+        self.assertEqual(serie.Serie.join_many(series, "outer").name, "S0 | S1 | S2 | S3")
+
+    def test_join_many_single(self):
+        ser, = self.make_series(ord, "i")[:1]
+        result = serie.Serie.join_many([ser], "outer")
+
+        self.assertSequenceEqual(result.index.py_values, ser.index.py_values)
+        self.assertSequenceEqual(result.data[0].py_values, ser.data[0].py_values)
+
+    def test_join_many_empty(self):
+        """
+        An empty inner join fails the same way for all key types.
+        """
+        keys = (
+                ("object", lambda c: c, None),
+                ("int", ord, "i"),
+                ("float", lambda c: ord(c)/4, "n"),
+            )
+        for desc, to_key, type in keys:
+            with self.subTest(keys=desc):
+                series = [
+                    serie.Serie.create(fc.sequence([ to_key(c) for c in letters ], type=type))
+                    for letters in ("AB", "CD")
+                ]
+                with self.assertRaisesRegex(TypeError, "Zero-length index"):
+                    serie.Serie.join_many(series)
+
+    def test_join_many_errors(self):
+        with self.assertRaises(ValueError):
+            serie.Serie.join_many([])
+        with self.assertRaises(ValueError):
+            serie.Serie.join_many(self.make_series(ord, "i"), "cross")
+
+class TestAsOfJoin(unittest.TestCase):
+    def make_series(self, to_key, type=None):
+        left = serie.Serie.create(
+                fc.sequence([ to_key(k) for k in (1, 4, 5, 9, 12, 20) ], type=type),
+                fc.sequence("abcdef", name="L"),
+                name="A",
+            )
+        right = serie.Serie.create(
+                fc.sequence([ to_key(k) for k in (3, 5, 8, 14) ], type=type),
+                fc.sequence([ 30, 50, 80, 140 ], name="R"),
+                name="B",
+            )
+        return left, right
+
+    def test_asof_join(self):
+        XX = None
+        keys = (
+                ("object", lambda k: k, None),
+                ("int", lambda k: k, "i"),
+                ("float", lambda k: k/4, "n"),
+                ("date", lambda k: datetime.CalendarDate(2024, 1, k), "d"),
+            )
+        usecases = (
+                # direction, tolerance, expected (in units of the integer keys)
+                ("backward", None, [ XX, 30, 50, 80, 80, 140 ]),
+                ("forward", None,  [ 30, 50, 50, 140, 140, XX ]),
+                ("nearest", None,  [ 30, 30, 50, 80, 140, 140 ]),
+                ("backward", 1,    [ XX, 30, 50, 80, XX, XX ]),
+                ("forward", 2,     [ 30, 50, 50, XX, 140, XX ]),
+                ("nearest", 2,     [ 30, 30, 50, 80, 140, XX ]),
+            )
+        for desc, to_key, type in keys:
+            for direction, tolerance, expected in usecases:
+                if tolerance is not None and desc == "object":
+                    continue # Tolerances require a native index
+                if tolerance is not None and desc == "float":
+                    tolerance /= 4
+                with self.subTest(keys=desc, direction=direction, tolerance=tolerance):
+                    left, right = self.make_series(to_key, type)
+                    result = left.asof_join(right, direction, tolerance=tolerance)
+
+                    self.assertSequenceEqual(result.index.py_values, left.index.py_values)
+                    self.assertSequenceEqual(result.headings[1:], ("A:L", "B:R"))
+                    self.assertSequenceEqual(result.data[0].py_values, "abcdef")
+                    self.assertSequenceEqual(result.data[1].py_values, expected)
+
+    def test_asof_join_nearest_ties(self):
+        left = serie.Serie.create(fc.sequence([ 4, 6 ], type="i"))
+        right = serie.Serie.create(fc.sequence([ 2, 6, 10 ], type="i"), fc.sequence("xyz"))
+
+        result = left.asof_join(right, "nearest")
+        self.assertSequenceEqual(result.data[0].py_values, "xy")
+
+    def test_asof_join_galloping(self):
+        """
+        Matching a short serie against a much longer one gives the same result
+        as the object-based join.
+        """
+        import random
+        rng = random.Random(7)
+        long = sorted(rng.sample(range(100000), 5000))
+        short = sorted(rng.sample(range(-100, 100100), 30))
+
+        def series(index, type):
+            return serie.Serie.create(fc.sequence(index, type=type), fc.sequence(index, name="V"))
+
+        for direction in ("backward", "forward", "nearest"):
+            for a, b in ((short, long), (long, short)):
+                with self.subTest(direction=direction, lenA=len(a)):
+                    expected = series(a, None).asof_join(series(b, None), direction)
+                    actual = series(a, "i").asof_join(series(b, "i"), direction)
+                    self.assertSequenceEqual(actual.data[0].py_values, expected.data[0].py_values)
+
+    def test_asof_join_errors(self):
+        left, right = self.make_series(lambda k: k, "i")
+        with self.assertRaises(ValueError):
+            left.asof_join(right, "sideways")
+        with self.assertRaises(ValueError):
+            left.asof_join(right, tolerance=-1)
+
+class TestHashJoin(unittest.TestCase):
+    TICKERS = ("AAA", "BBB", None, "CCC", "AAA", "DDD", "BBB")
+    REFERENCE = ("BBB", "AAA", "EEE", "CCC")
+
+    def make_series(self, to_key, type, *, extra=0):
+        trades = serie.Serie.create(
+                fc.sequence(range(len(self.TICKERS)), name="T", type="i"),
+                fc.sequence([ to_key(t) for t in self.TICKERS ], name="K", type=type),
+                fc.sequence([ 10*i for i in range(len(self.TICKERS)) ], name="Q"),
+                name="trades",
+            )
+        # `extra` unmatched rows make the reference the larger side
+        reference = self.REFERENCE + tuple(f"Z{i:03}" for i in range(extra))
+        ref = serie.Serie.create(
+                fc.sequence(range(len(reference)), name="N", type="i"),
+                fc.sequence([ to_key(r) for r in reference ], name="K", type=type),
+                fc.sequence([ f"s{r}" for r in reference ], name="S"),
+                name="ref",
+            )
+        return trades, ref
+
+    def test_hash_join(self):
+        XX = None
+        keys = (
+                ("object", lambda k: k, None),
+                ("categorical", lambda k: k, "c"),
+                ("int", lambda k: None if k is None else int(k, 36), "i"),
+                ("float", lambda k: None if k is None else int(k, 36)/4, "n"),
+            )
+        usecases = (
+                ("inner", (0, 1, 3, 4, 6), [ "sAAA", "sBBB", "sCCC", "sAAA", "sBBB" ]),
+                ("left", (0, 1, 2, 3, 4, 5, 6), [ "sAAA", "sBBB", XX, "sCCC", "sAAA", XX, "sBBB" ]),
+                ("semi", (0, 1, 3, 4, 6), None),
+                ("anti", (2, 5), None),
+            )
+        for desc, to_key, type in keys:
+            for extra in (0, 20):
+                for how, rows, expected in usecases:
+                    with self.subTest(keys=desc, extra=extra, how=how):
+                        trades, ref = self.make_series(to_key, type, extra=extra)
+                        result = trades.hash_join(ref, "K", how)
+
+                        self.assertSequenceEqual(result.index.py_values, rows)
+                        self.assertSequenceEqual(result.data[1].py_values, [ 10*i for i in rows ])
+                        if expected is None:
+                            self.assertSequenceEqual(result.headings[1:], ("trades:K", "trades:Q"))
+                        else:
+                            self.assertSequenceEqual(result.headings[1:], ("trades:K", "trades:Q", "ref:S"))
+                            self.assertSequenceEqual(result.data[2].py_values, expected)
+
+    def test_hash_join_equal_categories_of_distinct_types(self):
+        a = serie.Serie.create(
+                fc.sequence(range(3), name="T", type="i"),
+                fc.sequence([ 1, 1.0, 2 ], name="K", type="c"),
+            )
+        b = serie.Serie.create(
+                fc.sequence(range(2), name="N", type="i"),
+                fc.sequence([ True, 3 ], name="K", type="c"),
+            )
+        result = a.hash_join(b, "K", "inner")
+        self.assertSequenceEqual(result.index.py_values, (0, 1))
+
+    def test_hash_join_multiple_keys(self):
+        a = serie.Serie.create(
+                fc.sequence(range(5), name="T", type="i"),
+                fc.sequence([ 1, 1, 2, 2, 3 ], name="X", type="i"),
+                fc.sequence("ABABA", name="Y"),
+            )
+        b = serie.Serie.create(
+                fc.sequence(range(3), name="N", type="i"),
+                fc.sequence([ 2, 1, 3 ], name="X", type="i"),
+                fc.sequence("BAB", name="Y"),
+                fc.sequence([ 20, 10, 30 ], name="V"),
+            )
+        result = a.hash_join(b, ("X", "Y"), "left", rename=False)
+
+        self.assertSequenceEqual(result.headings[1:], ("X", "Y", "V"))
+        self.assertSequenceEqual(result.data[2].py_values, [ 10, None, None, 20, None ])
+
+    def test_hash_join_duplicates(self):
+        trades, ref = self.make_series(lambda k: k, "c")
+        ref = ref.hash_join(ref, "K", "inner") # Sanity check: unique keys
+        twice = serie.Serie.create(
+                fc.sequence(range(2), type="i"),
+                fc.sequence([ "AAA", "AAA" ], name="K", type="c"),
+            )
+
+        with self.assertRaises(ValueError):
+            trades.hash_join(twice, "K", "inner")
+        self.assertSequenceEqual(trades.hash_join(twice, "K", "semi").index.py_values, (0, 4))
+
+    def test_hash_join_errors(self):
+        trades, ref = self.make_series(lambda k: k, None)
+        with self.assertRaises(ValueError):
+            trades.hash_join(ref, "K", "cross")
+        with self.assertRaises(KeyError):
+            trades.hash_join(ref, "Missing")
+
 # ======================================================================
 # Extra factory methods
 # ======================================================================
@@ -580,6 +968,64 @@ class TestSerieWhere(unittest.TestCase):
                 self.assertSequenceEqual(b.index.py_values, [a.index[n] for n in expected])
                 self.assertSequenceEqual(b.data[0].py_values, [a.data[0][n] for n in expected])
 
+    def test_where_all_rows(self):
+        a = self.serie
+        b = a.where(column.Column.from_sequence([True]*a.rowcount))
+
+        self.assertIs(b, a)
+
+    def test_where_none(self):
+        a = self.serie
+        b = a.where(column.Column.from_sequence([ True, None, False, True, None, True, True, None, False ]))
+
+        self.assertSequenceEqual(b.index.py_values, (11, 14, 16, 17))
+
+    def test_where_lazy(self):
+        Column = column.Column
+        a = serie.Serie.create(
+                Column.from_sequence(range(6), name="T", type="i"),
+                Column.from_float_mv(column_array("d", [ 0, 1, 2, 3, 4, 5 ]), name="X"),
+                Column.from_sequence("ABCDEF", name="S"),
+            )
+        b = a.where(Column.from_sequence([ True, False, True, False, False, True ]))
+
+        for c in b.data:
+            self.assertEqual(c.memory_usage(), { "selection": 0 })
+        self.assertSequenceEqual(b.data[1].py_values, "ACF")
+        self.assertSequenceEqual((b.data[0]*2).py_values, (0.0, 4.0, 10.0))
+
+    def test_where_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.serie.where(column.Column.from_sequence([ True, False ]))
+
+    def test_where_memory_budget(self):
+        """
+        Gathering a filtered column must not evict the buffers that a kernel
+        already holds.
+        """
+        from fin.seq.fc import tix
+        import random
+        rng = random.Random(1)
+        n = 1000
+        prices = [ [ rng.uniform(1, 100) for _ in range(n) ] for _ in "HLC" ]
+        keep = column.Column.from_sequence([ i != 500 for i in range(n) ])
+
+        def true_range():
+            ser = serie.Serie.create(
+                    column.Column.from_sequence(range(n), name="T", type="i"),
+                    *(column.Column.from_sequence(p, name=name) for p, name in zip(prices, "HLC")),
+                )
+            result, = ser.where(keep).evaluate((tix.tr, "H", "L", "C"))
+            return result.py_values
+
+        expected = true_range()
+        budget = column.get_memory_budget()
+        try:
+            column.set_memory_budget(0)
+            self.assertSequenceEqual(true_range(), expected)
+        finally:
+            column.set_memory_budget(budget)
+
 
 class TestSerieGroupBy(unittest.TestCase):
     def setUp(self):
@@ -603,6 +1049,32 @@ class TestSerieGroupBy(unittest.TestCase):
 
         self.assertSequenceEqual(strips[:4], (3, 4, 6, 9))
 
+    def test_get_strips_native(self):
+        Column = column.Column
+        nan = float("nan")
+        s = serie.Serie.create(
+                Column.from_sequence(range(8), name="T"),
+                Column.from_sequence("AABBBAAC", name="C", type="c"),
+                Column.from_runs([ 1, 1, 2 ], [ 3, 2, 3 ], name="R"),
+                Column.from_sequence([ 1, 1, 1, 1, None, None, 1, 1 ], name="I", type="i"),
+                Column.from_float_mv(column_array("d", [ 0, 0, 0, 0, 0, 0, nan, nan ]), name="F"),
+            )
+        strips = s.get_strips()
+
+        self.assertSequenceEqual(strips[:6], (2, 4, 5, 6, 7, 8))
+
+    def test_group_by_categorical(self):
+        a = serie.Serie.from_data(
+                ((1, 2, 3, 4, 5), ("X", "X", "Y", "Y", "X")),
+                ("T", "K"),
+                "ic",
+            )
+        b = a.group_by(
+                "K",
+                (ag.first, "T"),
+                )
+        self.assertSequenceEqual(b.index.py_values, (1, 3, 5))
+
     def test_group_by_column_name(self):
         a = self.serie
         cols = self.cols
@@ -0,0 +1,123 @@
+import unittest
+import array
+import os
+import struct
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    SharedMemory = None
+
+from fin.seq import shm
+from fin.seq.column import Column
+from fin.seq.serie import Serie
+
+def double_values(serie):
+    return Serie.create(serie.index, serie.data[0]*2)
+
+def failing(serie):
+    raise ValueError("Expected")
+
+def failing_one(serie):
+    if serie.data[0].py_values[0] == 2:
+        raise ValueError("Expected")
+    return double_values(serie)
+
+# ======================================================================
+# Shared objects
+# ======================================================================
+@unittest.skipIf(SharedMemory is None, "Requires Python 3.8 or later")
+class TestShare(unittest.TestCase):
+    def test_column_round_trip(self):
+        c = Column.from_float_mv(array.array("d", range(100)), name="X")
+        with shm.share(c) as shared:
+            self.assertEqual(len(shared.layout), 1)
+            result = shared.attach()
+
+        self.assertEqual(result.name, "X")
+        self.assertSequenceEqual(result.py_values, c.py_values)
+
+    def test_zero_copy(self):
+        c = Column.from_float_mv(array.array("d", range(10)))
+        with shm.share(c) as shared:
+            result = shared.attach()
+            offset, _ = shared.layout[0]
+            segment = SharedMemory(shared.name)
+            segment.buf[offset:offset+8] = struct.pack("d", 42.0)
+            segment.close()
+
+        self.assertEqual(result[0], 42.0)
+
+    def test_serie_round_trip(self):
+        ser = Serie.create(
+                Column.from_sequence(range(5), name="T", type="i"),
+                Column.from_sequence("ABCDE", name="S"),
+                Column.from_sequence([1.5, None, 2.5, None, 4.0], name="F", type="n"),
+                name="ser",
+            )
+        with shm.share(ser) as shared:
+            result = shared.attach()
+
+        self.assertEqual(result.name, "ser")
+        self.assertSequenceEqual(result.headings, ser.headings)
+        for actual, expected in zip(result.columns, ser.columns):
+            self.assertEqual(actual, expected)
+
+    def test_unlink(self):
+        shared = shm.share(Column.from_sequence(range(10), type="i"))
+        result = shared.attach()
+        shared.unlink()
+        shared.unlink()
+
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(shared.name)
+        self.assertSequenceEqual(result.py_values, range(10))
+
+@unittest.skipIf(SharedMemory is None, "Requires Python 3.8 or later")
+class TestMapSeries(unittest.TestCase):
+    def setUp(self):
+        self.series = [
+            Serie.create(
+                Column.from_sequence(range(1000), name="T", type="i"),
+                Column.from_float_mv(array.array("d", range(k, k+1000)), name="X"),
+            ) for k in range(5)
+        ]
+
+    def test_map_series(self):
+        results = shm.map_series(double_values, self.series, workers=2)
+
+        self.assertEqual(len(results), len(self.series))
+        for ser, res in zip(self.series, results):
+            self.assertSequenceEqual(res.index.py_values, ser.index.py_values)
+            self.assertSequenceEqual(res.data[0].py_values, [ 2*x for x in ser.data[0].py_values ])
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            shm.map_series(failing, self.series, workers=2)
+
+    def test_after_parallel_kernel(self):
+        """
+        Workers must not inherit the OpenMP state of a parent that ran a parallel region.
+        """
+        from fin import config
+        n = 2*config.get_parallel_threshold()
+        values = array.array("d", range(n))
+        num_threads = config.get_num_threads()
+        config.set_num_threads(4)
+        try:
+            self.assertEqual((Column.from_float_mv(values)*2).f_values[-1], 2*(n-1))
+
+            ser = Serie.create(
+                    Column.from_sequence(range(n), name="T", type="i"),
+                    Column.from_float_mv(values, name="X"),
+                )
+            result, = shm.map_series(double_values, [ ser ], workers=2)
+            self.assertEqual(result.data[0].f_values[-1], 2*(n-1))
+        finally:
+            config.set_num_threads(num_threads)
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "Requires /dev/shm")
+    def test_exceptions_release_segments(self):
+        before = set(os.listdir("/dev/shm"))
+        with self.assertRaises(ValueError):
+            shm.map_series(failing_one, self.series, workers=2)
+        self.assertEqual(set(os.listdir("/dev/shm")) - before, set())
@@ -0,0 +1,68 @@
+import unittest
+import math
+
+from fin import config
+from fin.seq.serie import Serie
+from fin.seq.column import Column
+from fin.seq.fc import compx, logic, mathx
+
+# ======================================================================
+# Parallel execution
+# ======================================================================
+class TestParallelSettings(unittest.TestCase):
+    def setUp(self):
+        self.threshold = config.get_parallel_threshold()
+
+    def tearDown(self):
+        config.set_num_threads()
+        config.set_parallel_threshold(self.threshold)
+
+    def test_num_threads(self):
+        config.set_num_threads(3)
+        self.assertEqual(config.get_num_threads(), 3 if config.openmp_enabled() else 1)
+
+        with self.assertRaises(ValueError):
+            config.set_num_threads(0)
+
+    def test_parallel_threshold(self):
+        config.set_parallel_threshold(1000)
+        self.assertEqual(config.get_parallel_threshold(), 1000)
+
+        with self.assertRaises(ValueError):
+            config.set_parallel_threshold(-1)
+
+class TestParallelKernels(unittest.TestCase):
+    N = 10_007 # Not a multiple of the block size
+
+    def setUp(self):
+        self.threshold = config.get_parallel_threshold()
+        self.a = Column.from_sequence([i*0.5 if i%11 else None for i in range(self.N)], name="A")
+        self.b = Column.from_sequence([i%13 - 6.0 for i in range(self.N)], name="B")
+
+    def tearDown(self):
+        config.set_num_threads()
+        config.set_parallel_threshold(self.threshold)
+
+    def evaluate(self):
+        ser = Serie.create(Column.from_sequence(range(self.N), name="T"), self.a, self.b)
+        return (
+            ((self.a + self.b)*self.b - self.a/2).py_values,
+            mathx.sqrt(ser, self.a).py_values,
+            logic.all(ser, compx.above(100.0)(ser, self.a), compx.above(0.0)(ser, self.b)).py_values,
+        )
+
+    def test_parallel_matches_serial(self):
+        config.set_num_threads(1)
+        serial = self.evaluate()
+
+        config.set_num_threads(4)
+        config.set_parallel_threshold(0)
+        parallel = self.evaluate()
+
+        for expected, actual in zip(serial, parallel):
+            self.assertEqual(len(actual), self.N)
+            for x, y in zip(expected, actual):
+                if isinstance(x, float) and math.isnan(x):
+                    self.assertTrue(math.isnan(y))
+                else:
+                    self.assertEqual(x, y)
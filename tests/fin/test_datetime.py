@@ -285,6 +285,24 @@ class TestCalendarDate(unittest.TestCase):
                 actual = date.timestamp
                 self.assertEqual(round(actual,digits), round(expected,digits))
 
+    def test_epoch_and_back(self):
+        """
+        It should convert to and from the number of units since the Unix epoch.
+        """
+        testcases=(
+            CalendarDate(2023, 3, 29), 19445,
+            CalendarDateTime(2023, 3, 29, 0, 0, 10), 1680048010,
+            CalendarDateTimeMicro(1969, 12, 31, 23, 59, 59, 999999), -1,
+        )
+
+        while testcases:
+            date, expected, *testcases = testcases
+            with self.subTest(date=date):
+                self.assertEqual(date.epoch, expected)
+                actual = CalendarDate.fromepoch(expected, date.resolution)
+                self.assertIs(type(actual), type(date))
+                self.assertEqual(actual, date)
+
     def test_ac_calendar_date(self):
         use_cases = (
                 CalendarDate(2023, 10, 27),
@@ -0,0 +1,47 @@
+import unittest
+import ctypes
+
+from fin import mem
+from fin.seq.column import Column
+
+# ======================================================================
+# Buffer pool
+# ======================================================================
+class TestBufferPool(unittest.TestCase):
+    def setUp(self):
+        self.limit = mem.get_pool_limit()
+
+    def tearDown(self):
+        mem.set_pool_limit(self.limit)
+
+    def test_alignment(self):
+        for n in (1, 7, 1000, 1_000_000):
+            with self.subTest(n=n):
+                values = Column.from_sequence(range(n), type="i").i_values
+                address = ctypes.addressof(ctypes.c_char.from_buffer(values))
+                self.assertEqual(address % 64, 0)
+
+    def test_recycling(self):
+        mem.clear_pool()
+        values = Column.from_sequence(range(1000), type="i")
+
+        first = (values + 1).f_values
+        del first
+        before = mem.get_stats()
+        second = (values + 2).f_values
+        after = mem.get_stats()
+
+        self.assertEqual(after["allocations"] - before["allocations"], 1)
+        self.assertEqual(after["pool_hits"] - before["pool_hits"], 1)
+        self.assertGreaterEqual(after["peak_bytes_in_use"], after["bytes_in_use"])
+
+    def test_pool_limit(self):
+        mem.set_pool_limit(0)
+        self.assertEqual(mem.get_stats()["bytes_pooled"], 0)
+
+        values = Column.from_sequence(range(1000), type="i")
+        (values + 1).f_values
+        self.assertEqual(mem.get_stats()["bytes_pooled"], 0)
+
+        with self.assertRaises(ValueError):
+            mem.set_pool_limit(-1)